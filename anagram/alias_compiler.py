@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Bible Book Alias Compiler
+Derives the alternative spellings users type for each Bible book:
+roman numerals and ordinal words for numbered books ("I Samuel",
+"First Kings", "1er Rois"), standard abbreviations ("Gen", "Mt", "1 R")
+and OSIS book IDs ("1Cor"). Aliases are compiled once into the lookup
+index, so resolving one is the same dictionary probe as a display name.
+
+The numeral forms and abbreviations of each language come from its data
+file (the "numeral_forms" and "abbreviations" entries); numbered books
+list their abbreviations without the number ("Sam" for both 1 and 2 Samuel).
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+from bible_books_data import BookRecord, SpecialHandling, fold_name
+from language_registry import get_language
+
+# Numeral forms that are also combined with abbreviations ("1 Sam", "II Co")
+SHORT_NUMERAL_FORMS = {'1': ('1', 'I'), '2': ('2', 'II'), '3': ('3', 'III')}
+
+# OSIS book identifiers, shared by every language
+OSIS_IDS: Tuple[str, ...] = (
+    'Gen', 'Exod', 'Lev', 'Num', 'Deut', 'Josh', 'Judg', 'Ruth', '1Sam', '2Sam',
+    '1Kgs', '2Kgs', '1Chr', '2Chr', 'Ezra', 'Neh', 'Esth', 'Job', 'Ps', 'Prov',
+    'Eccl', 'Song', 'Isa', 'Jer', 'Lam', 'Ezek', 'Dan', 'Hos', 'Joel', 'Amos',
+    'Obad', 'Jonah', 'Mic', 'Nah', 'Hab', 'Zeph', 'Hag', 'Zech', 'Mal', 'Matt',
+    'Mark', 'Luke', 'John', 'Acts', 'Rom', '1Cor', '2Cor', 'Gal', 'Eph', 'Phil',
+    'Col', '1Thess', '2Thess', '1Tim', '2Tim', 'Titus', 'Phlm', 'Heb', 'Jas', '1Pet',
+    '2Pet', '1John', '2John', '3John', 'Jude', 'Rev'
+)
+
+def _split_number(record: BookRecord) -> Tuple[str, str]:
+    """Split a numbered book's display name into its number and stem"""
+    if record.special_handling in (SpecialHandling.NUMBERED, SpecialHandling.NUMBERED_ACCENTED):
+        number, _, stem = record.display_name.partition(' ')
+        if number in SHORT_NUMERAL_FORMS and stem:
+            return number, stem
+    return '', record.display_name
+
+def _alias_tiers(record: BookRecord, language: str) -> List[List[str]]:
+    """
+    List a book's aliases from most to least specific.
+
+    Tier 0 spells out the full name with another numeral, tier 1 holds the
+    standard abbreviations and OSIS ID, and tier 2 the numeral and
+    abbreviation combinations.
+    """
+    spec = get_language(language)
+    number, stem = _split_number(record)
+    abbreviations = spec.abbreviations.get(record.book_number, ())
+    osis_id = OSIS_IDS[record.book_number - 1] if 1 <= record.book_number <= len(OSIS_IDS) else None
+
+    full_names: List[str] = []
+    short_names: List[str] = [osis_id] if osis_id else []
+    combined: List[str] = []
+
+    if number:
+        numeral_forms = spec.numeral_forms.get(number, ())
+        full_names.extend(f"{form} {stem}" for form in numeral_forms)
+        for form in SHORT_NUMERAL_FORMS[number]:
+            combined.extend(f"{form} {abbreviation}" for abbreviation in abbreviations
+                            if form.isdigit() or len(abbreviation) > 1)
+    else:
+        short_names.extend(abbreviations)
+
+    return [full_names, short_names, combined]
+
+def compile_aliases(records: Iterable[BookRecord], language: str) -> Dict[str, int]:
+    """
+    Compile the aliases of a language's books into folded lookup keys.
+
+    Aliases never shadow a display name, key or alternate name. When an
+    alias would point at two different books it is dropped, and a less
+    specific tier can not claim it afterwards.
+
+    Args:
+        records: The language's book records
+        language: Language whose abbreviation and numeral tables are used
+
+    Returns:
+        Dictionary of folded alias to book number
+    """
+    records = list(records)
+    taken: Set[str] = set()
+    for record in records:
+        taken.add(fold_name(record.key))
+        taken.add(fold_name(record.display_name))
+        taken.update(fold_name(alt_name) for alt_name in record.alternate_names)
+
+    aliases: Dict[str, int] = {}
+    tiers = [_alias_tiers(record, language) for record in records]
+    for tier in range(3):
+        claims: Dict[str, Set[int]] = {}
+        for record, record_tiers in zip(records, tiers):
+            for alias in record_tiers[tier]:
+                folded = fold_name(alias)
+                if folded and folded not in taken:
+                    claims.setdefault(folded, set()).add(record.book_number)
+
+        for folded, book_numbers in claims.items():
+            if len(book_numbers) == 1:
+                aliases[folded] = next(iter(book_numbers))
+            taken.add(folded)
+
+    return dict(sorted(aliases.items()))
@@ -1,43 +1,84 @@
 #!/usr/bin/env python3
 """
 Command Line Interface for the anagram generator
-Usage: python3 anagram_cli.py [word] [language]
+Usage: python3 anagram_cli.py [word] [language] [word_list]
+       python3 anagram_cli.py --phrases [text] [language] [word_list]
+       python3 anagram_cli.py --sub-anagrams [letters] [language] [word_list]
 """
 
-import sys
-from anagram_generator import AnagramGenerator
+import argparse
+from itertools import islice
 
-def main():
-    if len(sys.argv) != 3:
-        print("Usage: python3 anagram_cli.py [word] [language]")
-        print("Example: python3 anagram_cli.py listen english")
-        print("Example: python3 anagram_cli.py chat french")
-        return
+from anagram_generator import AnagramGenerator
+from phrase_anagrams import MAX_PHRASE_WORDS
 
-    word = sys.argv[1]
-    language = sys.argv[2].lower()
+# Phrases printed before stopping, and seconds spent looking for them
+PHRASE_LIMIT = 50
+PHRASE_TIME_BUDGET = 10.0
 
-    if language not in ['english', 'french']:
-        print("Error: Language must be 'english' or 'french'")
-        return
+def main():
+    parser = argparse.ArgumentParser(
+        description='Find anagrams in English or French',
+        epilog='Examples: anagram_cli.py listen english | anagram_cli.py chien french lexique.txt.gz | '
+               'anagram_cli.py --phrases "dormitory" english words.txt | '
+               'anagram_cli.py --sub-anagrams "retains?" english words.txt')
+    parser.add_argument('word', help='Word to rearrange (a phrase with --phrases, letters with --sub-anagrams)')
+    parser.add_argument('language', choices=['english', 'french'], type=str.lower)
+    parser.add_argument('word_list', nargs='?',
+                        help='Word list file (one word per line, optionally gzipped) replacing the built-in words')
+    parser.add_argument('--phrases', action='store_true', help='Find phrases of several words')
+    parser.add_argument('--sub-anagrams', action='store_true',
+                        help="Find the words built from some of the letters ('?' or '*' for blank tiles)")
+    parser.add_argument('--max-words', type=int, default=MAX_PHRASE_WORDS, help='Most words per phrase')
+    parser.add_argument('--limit', type=int, default=PHRASE_LIMIT, help='Most phrases to print')
+    parser.add_argument('--time-budget', type=float, default=PHRASE_TIME_BUDGET,
+                        help='Seconds to search for phrases')
+    args = parser.parse_args()
 
+    word = args.word
+    language = args.language
     generator = AnagramGenerator()
 
     try:
-        anagrams = generator.find_anagrams(word, language)
+        if args.word_list:
+            generator.load_word_list(args.word_list, language)
+
+        if args.phrases:
+            print(f"Phrase anagrams for '{word}' in {language.title()} (up to {args.max_words} words):")
+            phrases = generator.find_phrase_anagrams(word, language, args.max_words, args.time_budget)
+            count = 0
+            # Printed as they are found; Ctrl+C stops the search early
+            try:
+                for count, phrase in enumerate(islice(phrases, args.limit), 1):
+                    print(f"  {count}. {phrase}", flush=True)
+            except KeyboardInterrupt:
+                print("  (stopped)")
+            if not count:
+                print(f"  No phrases found for '{word}' in the {language} dictionary.")
+            return
+
+        if args.sub_anagrams:
+            groups = generator.find_sub_anagrams(word, language)
+            print(f"Words from the letters '{word}' in {language.title()}:")
+            for length, words in groups.items():
+                print(f"  {length} letters: {', '.join(words)}")
+            if not groups:
+                print(f"  No words found for '{word}' in the {language} dictionary.")
+            return
+
+        anagrams, random_anagram = generator.find_anagrams_and_pick(word, language)
 
         print(f"Anagrams for '{word}' in {language.title()}:")
         if anagrams:
             for i, anagram in enumerate(anagrams, 1):
                 print(f"  {i}. {anagram}")
 
-            random_anagram = generator.generate_random_anagram(word, language)
             print(f"\nRandom selection: {random_anagram}")
         else:
             print(f"  No anagrams found for '{word}' in the {language} dictionary.")
 
-    except ValueError as e:
+    except (ValueError, OSError) as e:
         print(f"Error: {e}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -2,18 +2,72 @@
 """
 Anagram Generator Tool
 Generates anagrams in French or English using the exact same letters as the original word.
+
+Words are indexed by signature (their letters in sorted order) the first
+time a language is queried, so finding the anagrams of a word is a single
+dictionary probe instead of a scan of the whole word list. Larger word
+lists can be loaded from files with load_word_list; their index is cached
+on disk (see word_index.py). Reloading closes the index it replaces.
+The english_words and french_words attributes are read-only views of
+the dictionary in use (the loaded list once one is loaded), so they can
+never drift from the index. Phrases made of several words are found by
+find_phrase_anagrams (see phrase_anagrams.py), and the words that can be
+built from some of a set of letters by find_sub_anagrams (see
+sub_anagrams.py).
+
+Anagram lists are memoized per (normalized word, language, dictionary
+version) in a bounded LRU cache. Every dictionary replacement bumps the
+language's version, the same step that swaps its index, so a stale entry
+can never be served; old entries simply age out of the cache.
+cache_info reports the cache's size and hit rate.
 """
 
 import random
-from collections import Counter
-from typing import List, Set
+import threading
+from collections import Counter, OrderedDict
+from typing import Any, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from phrase_anagrams import MAX_PHRASE_WORDS, find_phrases
+from sub_anagrams import MIN_WORD_LENGTH, LetterMatrix
+from word_index import MappedWordIndex, WordIndex, build_index, load_word_index, normalize_word, word_signature
+
+# Anagram lists kept before the least recently used one is dropped
+ANAGRAM_CACHE_SIZE = 1024
 
 class AnagramGenerator:
-    def __init__(self):
-        self.french_words = self._load_french_words()
-        self.english_words = self._load_english_words()
+    def __init__(self, cache_size: int = ANAGRAM_CACHE_SIZE):
+        # Built-in words per language; a loaded word list's words are read from its index on demand
+        self._word_lists: Dict[str, FrozenSet[str]] = {
+            'french': self._load_french_words(),
+            'english': self._load_english_words()
+        }
 
-    def _load_french_words(self) -> Set[str]:
+        # Signature -> words, built per language on first use or loaded from a word list
+        self._indexes: Dict[str, WordIndex] = {}
+        # Letter-count matrix per language, built on the first sub-anagram query
+        self._matrices: Dict[str, LetterMatrix] = {}
+
+        # Bumped whenever a language's dictionary (and so its index) is replaced
+        self._versions: Dict[str, int] = {}
+        # Serializes dictionary replacements, which close the index they replace
+        self._lock = threading.Lock()
+        # (normalized word, language, dictionary version) -> anagrams, least recently used first
+        self.cache_size = cache_size
+        self._anagram_cache: 'OrderedDict[Tuple[str, str, int], Tuple[str, ...]]' = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @property
+    def french_words(self) -> FrozenSet[str]:
+        """Words of the French dictionary in use"""
+        return self._get_word_list('french')
+
+    @property
+    def english_words(self) -> FrozenSet[str]:
+        """Words of the English dictionary in use"""
+        return self._get_word_list('english')
+
+    def _load_french_words(self) -> FrozenSet[str]:
         """Load French word dictionary"""
         # Basic French word list - can be expanded
         french_words = {
@@ -33,7 +87,7 @@ class AnagramGenerator:
             'viande', 'poisson', 'légume', 'fruit', 'pomme', 'orange',
             'banane', 'raisin', 'fraise', 'cerise', 'pêche', 'poire',
             'carotte', 'tomate', 'salade', 'pomme de terre', 'oignon',
-            'argent', 'or', 'argent', 'bronze', 'fer', 'acier', 'bois',
+            'argent', 'or', 'bronze', 'fer', 'acier', 'bois',
             'pierre', 'verre', 'plastique', 'papier', 'tissu', 'coton',
             'soie', 'laine', 'cuir', 'métal', 'caoutchouc', 'ciment',
             # Added words that can form anagrams
@@ -47,9 +101,9 @@ class AnagramGenerator:
             'tena', 'nate', 'nota', 'aton', 'toan', 'otan', 'nito', 'tino',
             'soir', 'rois', 'oirs', 'sori', 'riso', 'iris', 'siri', 'riis'
         }
-        return {word.lower() for word in french_words}
+        return frozenset(word.lower() for word in french_words)
 
-    def _load_english_words(self) -> Set[str]:
+    def _load_english_words(self) -> FrozenSet[str]:
         """Load English word dictionary"""
         # Basic English word list - can be expanded
         english_words = {
@@ -78,11 +132,51 @@ class AnagramGenerator:
             'star', 'rats', 'arts', 'tars', 'tar', 'rat', 'art',
             'east', 'seat', 'teas', 'eats', 'sate', 'tea', 'eat', 'ate'
         }
-        return {word.lower() for word in english_words}
+        return frozenset(word.lower() for word in english_words)
+
+    def load_word_list(self, path: str, language: str, cache_path: Optional[str] = None) -> int:
+        """
+        Replace a language's dictionary with a word list file.
+
+        The list's signature index is cached on disk and memory-mapped on
+        later loads, as long as the list itself has not changed. A word
+        list loaded earlier for the language is closed, so phrase searches
+        still running over it must not be resumed.
+
+        Args:
+            path: Word list with one word per line (UTF-8, optionally gzip)
+            language: 'english' or 'french'
+            cache_path: Where to keep the index cache (defaults to next to the list)
+
+        Returns:
+            Number of distinct letter signatures in the dictionary
+
+        Raises:
+            ValueError: If the language is not supported
+            OSError: If the word list can not be read
+        """
+        language = self._check_language(language)
+        index = load_word_index(path, cache_path)
+        with self._lock:
+            previous = self._indexes.get(language)
+            self._indexes[language] = index
+            self._word_lists.pop(language, None)
+            self._matrices.pop(language, None)
+            self._versions[language] = self._versions.get(language, 0) + 1
+            if isinstance(previous, MappedWordIndex):
+                previous.close()
+        return len(index)
+
+    def close(self) -> None:
+        """Close the memory-mapped indexes of the loaded word lists"""
+        with self._lock:
+            for index in self._indexes.values():
+                if isinstance(index, MappedWordIndex):
+                    index.close()
 
     def _normalize_word(self, word: str) -> str:
         """Normalize word by converting to lowercase and removing spaces"""
-        return word.lower().replace(' ', '')
+        return normalize_word(word)
 
     def _get_letter_count(self, word: str) -> Counter:
         """Get the count of each letter in the word"""
@@ -92,31 +186,146 @@ class AnagramGenerator:
         """Check if two words are anagrams of each other"""
         return self._get_letter_count(word1) == self._get_letter_count(word2)
 
+    def _check_language(self, language: str) -> str:
+        """Get the lowercase name of a supported language"""
+        if language.lower() not in ('french', 'english'):
+            raise ValueError("Language must be 'french' or 'english'")
+        return language.lower()
+
+    def _get_word_list(self, language: str) -> FrozenSet[str]:
+        """Get the word list of a language, read back from its index after a word list was loaded"""
+        language = self._check_language(language)
+        words = self._word_lists.get(language)
+        if words is None:
+            words = self._word_lists[language] = frozenset(self._index_words(self._indexes[language]))
+        return words
+
+    @staticmethod
+    def _index_words(index: WordIndex) -> Iterator[str]:
+        """Iterate over the words of a signature index"""
+        if isinstance(index, MappedWordIndex):
+            return index.words()
+        return (word for group in index.values() for word in group)
+
+    def _get_index(self, language: str) -> WordIndex:
+        """Get the signature index of a language, building it on first use"""
+        language = language.lower()
+        index = self._indexes.get(language)
+        if index is None:
+            index = self._indexes[language] = build_index(self._get_word_list(language))
+        return index
+
     def find_anagrams(self, word: str, language: str) -> List[str]:
-        """Find all anagrams for a given word in the specified language"""
-        word_normalized = self._normalize_word(word)
+        """Find all anagrams for a given word in the specified language, in alphabetical order"""
+        return list(self._cached_anagrams(word, language))
 
-        if language.lower() == 'french':
-            word_list = self.french_words
-        elif language.lower() == 'english':
-            word_list = self.english_words
-        else:
-            raise ValueError("Language must be 'french' or 'english'")
+    def find_anagrams_and_pick(self, word: str, language: str,
+                               rng: Optional[random.Random] = None) -> Tuple[List[str], Optional[str]]:
+        """
+        Find the anagrams of a word and pick one at random, from a single lookup.
+
+        Args:
+            word: Word to rearrange
+            language: 'english' or 'french'
+            rng: Random number generator for the pick (defaults to the random module)
+
+        Returns:
+            Tuple of the anagrams in alphabetical order and a random one of
+            them (None when there are none)
 
-        anagrams = []
-        for candidate in word_list:
-            if candidate != word_normalized and self._is_anagram(word_normalized, candidate):
-                anagrams.append(candidate)
+        Raises:
+            ValueError: If the language is not supported
+        """
+        anagrams = list(self._cached_anagrams(word, language))
+        pick = (rng or random).choice(anagrams) if anagrams else None
+        return anagrams, pick
 
+    def _cached_anagrams(self, word: str, language: str) -> Tuple[str, ...]:
+        """Look up the anagrams of a word through the LRU cache"""
+        word_normalized = self._normalize_word(word)
+        language = self._check_language(language)
+        key = (word_normalized, language, self._versions.get(language, 0))
+        anagrams = self._anagram_cache.get(key)
+        if anagrams is not None:
+            self._cache_hits += 1
+            self._anagram_cache.move_to_end(key)
+            return anagrams
+
+        self._cache_misses += 1
+        candidates = self._get_index(language).get(word_signature(word_normalized), ())
+        anagrams = tuple(candidate for candidate in candidates if self._normalize_word(candidate) != word_normalized)
+        if self.cache_size > 0:
+            self._anagram_cache[key] = anagrams
+            if len(self._anagram_cache) > self.cache_size:
+                self._anagram_cache.popitem(last=False)
         return anagrams
 
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        Get statistics of the anagram cache.
+
+        Returns:
+            Dictionary with hits, misses, hit_rate (0 to 1), size and max_size
+        """
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'hit_rate': self._cache_hits / lookups if lookups else 0.0,
+            'size': len(self._anagram_cache),
+            'max_size': self.cache_size
+        }
+
+    def find_phrase_anagrams(self, text: str, language: str, max_words: int = MAX_PHRASE_WORDS,
+                             time_budget: Optional[float] = None,
+                             cancel: Optional[threading.Event] = None) -> Iterator[str]:
+        """
+        Stream the phrases of one or more words that use exactly the letters of a text.
+
+        Args:
+            text: Word or phrase to rearrange
+            language: 'english' or 'french'
+            max_words: Most words per phrase
+            time_budget: Seconds to search before stopping (None for no limit)
+            cancel: Event that stops the search once set
+
+        Returns:
+            Iterator over phrases, words joined by spaces
+
+        Raises:
+            ValueError: If the language is not supported
+        """
+        return find_phrases(self._get_index(language), text, max_words, time_budget, cancel)
+
+    def _get_letter_matrix(self, language: str) -> LetterMatrix:
+        """Get the letter-count matrix of a language, building it on first use"""
+        language = language.lower()
+        matrix = self._matrices.get(language)
+        if matrix is None:
+            matrix = self._matrices[language] = LetterMatrix(self._index_words(self._get_index(language)))
+        return matrix
+
+    def find_sub_anagrams(self, letters: str, language: str,
+                          min_length: int = MIN_WORD_LENGTH) -> Dict[int, List[str]]:
+        """
+        Find the words that can be built from some of the letters.
+
+        Args:
+            letters: Available letters, with '?' or '*' for blank tiles
+            language: 'english' or 'french'
+            min_length: Shortest word to include
+
+        Returns:
+            Dictionary of word length to words in alphabetical order, longest first
+
+        Raises:
+            ValueError: If the language is not supported
+        """
+        return self._get_letter_matrix(language).find(letters, min_length)
+
     def generate_random_anagram(self, word: str, language: str) -> str:
         """Generate a random anagram from the available anagrams"""
-        anagrams = self.find_anagrams(word, language)
-        if anagrams:
-            return random.choice(anagrams)
-        else:
-            return None
+        return self.find_anagrams_and_pick(word, language)[1]
 
 def main():
     """Main function to run the anagram generator tool"""
@@ -154,16 +363,14 @@ def main():
             continue
 
         try:
-            # Find all anagrams
-            anagrams = generator.find_anagrams(word, language)
+            # Find all anagrams and pick a random one in the same lookup
+            anagrams, random_anagram = generator.find_anagrams_and_pick(word, language)
 
             if anagrams:
                 print(f"\nAnagrams found for '{word}':")
                 for i, anagram in enumerate(anagrams, 1):
                     print(f"{i}. {anagram}")
 
-                # Generate a random anagram
-                random_anagram = generator.generate_random_anagram(word, language)
                 print(f"\nRandom anagram: {random_anagram}")
             else:
                 print(f"No anagrams found for '{word}' in {language}.")
@@ -6,227 +6,444 @@ Scrambles Bible book names in French or English for puzzle solving.
 
 import random
 import re
-from typing import List, Dict, Tuple, Any, Optional
-from bible_books_data import get_english_bible_books, get_french_bible_books, get_book_by_display_name, get_books_by_testament
+from typing import List, Dict, Mapping, Tuple, Any, Optional, Union
+from book_signatures import get_signature_index, get_solver_index, name_signature
+from book_suggester import MAX_SUGGESTIONS
+from guess_resolver import MAX_EDIT_DISTANCE, edit_distance
+from bible_books_data import (
+    BookIndex, BookRecord, SpecialHandling, fold_name, get_book_index, get_book_by_display_name, get_cross_reference
+)
+from language_registry import available_languages, get_language, is_supported_language, language_error_message
+from puzzle_ids import decode_puzzle_id, encode_puzzle_id, new_seed
+from scramble_scoring import validate_difficulty
+from scramble_templates import get_scramble_template
+from shuffle_bag import SessionBags
+
+# A seed, an explicit random.Random, or None for a fresh unseeded generator
+RandomSource = Union[int, random.Random, None]
+
+# Draws at the requested difficulty before falling back to a full derangement
+# when every scramble spells a valid book name
+MAX_SCRAMBLE_ATTEMPTS = 8
+
+def _get_rng(rng: RandomSource) -> random.Random:
+    """Turn a seed or generator into a generator owned by the caller"""
+    if isinstance(rng, random.Random):
+        return rng
+    return random.Random(rng)
 
 class BibleBookScrambler:
-    def __init__(self):
-        self.english_books = get_english_bible_books()
-        self.french_books = get_french_bible_books()
+    # Catalogs are loaded lazily per language by the language registry
+
+    @property
+    def english_books(self) -> Mapping[str, BookRecord]:
+        """English book records keyed by normalized name"""
+        return get_book_index('english').books
+
+    @property
+    def french_books(self) -> Mapping[str, BookRecord]:
+        """French book records keyed by normalized name"""
+        return get_book_index('french').books
 
     def _normalize_book_name(self, book_name: str) -> str:
-        """Normalize book name for comparison"""
-        return book_name.lower().strip()
+        """Normalize book name for comparison (case, accent and spacing insensitive)"""
+        return fold_name(book_name)
 
-    def _extract_letters_for_scrambling(self, text: str) -> Tuple[List[str], List[int]]:
+    def generate_scramble(self, book_name: str, language: str, difficulty: str = 'medium',
+                          rng: RandomSource = None, min_moved: Optional[int] = None) -> str:
         """
-        Extract only alphabetic characters for scrambling while preserving positions
-        of numbers, spaces, and special characters.
+        Generate a scrambled version of a Bible book name.
 
         Args:
-            text: The text to analyze
+            book_name: The Bible book name to scramble
+            language: Language name (e.g. 'english' or 'french')
+            difficulty: 'easy', 'medium', or 'hard'; medium and hard scrambles move
+                every letter, easy ones keep up to half of them, letter pairs and
+                the first letter in place
+            rng: Seed or random.Random to scramble with; the same seed always
+                gives the same scramble
+            min_moved: Fewest letters of each word that must leave their position
+                (None lets the difficulty decide)
 
         Returns:
-            Tuple of (letters_to_scramble, positions_to_preserve)
+            Scrambled version of the book name
         """
-        letters = []
-        special_positions = []
+        if not is_supported_language(language):
+            raise ValueError(language_error_message())
+        difficulty = validate_difficulty(difficulty)
 
-        for i, char in enumerate(text):
-            if char.isalpha():
-                letters.append(char)
-            else:
-                special_positions.append((i, char))
+        # Get the proper display name from our database
+        book_data = get_book_by_display_name(book_name, language)
+        if not book_data:
+            raise ValueError(f"Bible book '{book_name}' not found in {language}")
 
-        return letters, special_positions
+        # Compound names like "Song of Songs" scramble each word separately
+        template = get_scramble_template(book_data.display_name,
+                                         book_data.special_handling is SpecialHandling.COMPOUND,
+                                         get_language(language).connector_words)
+        rng = _get_rng(rng)
+
+        # Never hand out a scramble that already spells a book name or alias
+        # (swapping 'E' and 'e' in "Ezekiel" moves letters but spells the answer)
+        signatures = get_signature_index(book_data.language)
+        for _ in range(MAX_SCRAMBLE_ATTEMPTS):
+            scrambled = template.scramble(rng, min_moved, difficulty)
+            if not signatures.is_name(scrambled):
+                return scrambled
+        return template.scramble(rng)
 
-    def _scramble_letters(self, letters: List[str], max_attempts: int = 50) -> List[str]:
+    def check_solution(self, scrambled: str, guess: str, language: str, fuzzy: bool = False,
+                       max_distance: int = MAX_EDIT_DISTANCE) -> bool:
         """
-        Scramble letters ensuring the result is different from the original.
+        Check if a guess correctly solves a scrambled Bible book name.
 
         Args:
-            letters: List of letters to scramble
-            max_attempts: Maximum attempts to get a different arrangement
+            scrambled: The scrambled text (for reference, not used in validation)
+            guess: The user's guess
+            language: Language name (e.g. 'english' or 'french')
+            fuzzy: Accept misspelled guesses within max_distance edits
+            max_distance: Edit budget used when fuzzy is enabled
 
         Returns:
-            Scrambled list of letters
+            True if the guess is a valid Bible book name, False otherwise
         """
-        original = letters.copy()
-
-        for _ in range(max_attempts):
-            scrambled = letters.copy()
-            random.shuffle(scrambled)
+        if fuzzy:
+            return self.resolve_guess(guess, language, max_distance) is not None
+        book_data = get_book_by_display_name(guess, language)
+        return book_data is not None
 
-            # Make sure it's different from the original (avoid trivial scrambles)
-            if scrambled != original or len(letters) <= 2:
-                return scrambled
+    def get_canonical_name(self, name: str, language: str) -> Optional[str]:
+        """
+        Get the canonical display name for a book name typed in any form.
 
-        # If we couldn't get a different arrangement, force at least one swap
-        if len(letters) >= 2:
-            scrambled = letters.copy()
-            # Swap first two letters if they're different
-            if scrambled[0] != scrambled[1]:
-                scrambled[0], scrambled[1] = scrambled[1], scrambled[0]
-            else:
-                # Find a different letter to swap with
-                for i in range(2, len(scrambled)):
-                    if scrambled[0] != scrambled[i]:
-                        scrambled[0], scrambled[i] = scrambled[i], scrambled[0]
-                        break
+        Args:
+            name: Book name, with or without accents (e.g. 'Levitique')
+            language: Language name (e.g. 'english' or 'french')
 
-        return scrambled
+        Returns:
+            The canonical display name (e.g. 'Lévitique'), or None if not found
+        """
+        book_data = get_book_by_display_name(name, language)
+        return book_data.display_name if book_data else None
 
-    def _reconstruct_text(self, scrambled_letters: List[str], special_positions: List[Tuple[int, str]]) -> str:
+    def resolve_guess(self, guess: str, language: str,
+                      max_distance: int = MAX_EDIT_DISTANCE) -> Optional[Tuple[str, int]]:
         """
-        Reconstruct text by inserting scrambled letters and preserving special characters.
+        Resolve a possibly misspelled guess to a canonical Bible book name.
 
         Args:
-            scrambled_letters: List of scrambled alphabetic characters
-            special_positions: List of (position, character) for non-alphabetic chars
+            guess: The user's guess (e.g. 'Deutoronomy')
+            language: Language name (e.g. 'english' or 'french')
+            max_distance: Largest number of edits to tolerate
 
         Returns:
-            Reconstructed text with scrambled letters and preserved special characters
+            Tuple of (canonical display name, edit distance), or None if nothing is close enough
         """
-        result = [''] * (len(scrambled_letters) + len(special_positions))
-        letter_index = 0
+        match = get_book_index(language).resolve(guess, max_distance)
+        if match is None:
+            return None
+        record, distance = match
+        return record.display_name, distance
 
-        # Place special characters first
-        special_dict = {pos: char for pos, char in special_positions}
+    def suggest_books(self, prefix: str, language: str, limit: int = MAX_SUGGESTIONS) -> List[str]:
+        """
+        Suggest book names completing a partially typed guess.
 
-        # Fill in the result
-        for i in range(len(result)):
-            if i in special_dict:
-                result[i] = special_dict[i]
-            else:
-                if letter_index < len(scrambled_letters):
-                    result[i] = scrambled_letters[letter_index]
-                    letter_index += 1
+        Args:
+            prefix: What the player has typed so far (e.g. 'Lev', '1 Sa', 'Ep')
+            language: Language name (e.g. 'english' or 'french')
+            limit: Largest number of suggestions to return
 
-        return ''.join(result)
+        Returns:
+            List of canonical display names, best match first
+        """
+        return [record.display_name for record in get_book_index(language).suggest(prefix, limit)]
 
-    def generate_scramble(self, book_name: str, language: str, difficulty: str = 'medium') -> str:
+    def get_translations(self, book_name: str, language: str) -> Dict[str, str]:
         """
-        Generate a scrambled version of a Bible book name.
+        Get a book's display name in every supported language.
 
         Args:
-            book_name: The Bible book name to scramble
-            language: 'english' or 'french'
-            difficulty: 'easy', 'medium', or 'hard' (currently not implemented)
+            book_name: The Bible book name, in any form the language accepts
+            language: Language of book_name
 
         Returns:
-            Scrambled version of the book name
+            Dictionary of language name to display name (empty if the book is not found)
         """
-        if language.lower() not in ['english', 'french']:
-            raise ValueError("Language must be 'english' or 'french'")
-
-        # Get the proper display name from our database
         book_data = get_book_by_display_name(book_name, language)
         if not book_data:
-            raise ValueError(f"Bible book '{book_name}' not found in {language}")
+            return {}
+        return {lang: record.display_name for lang, record in get_cross_reference()[book_data.book_number].items()}
+
+    def translate(self, book_name: str, from_language: str, to_language: str) -> Optional[str]:
+        """
+        Translate a Bible book name between languages.
 
-        display_name = book_data['display_name']
+        Args:
+            book_name: The Bible book name (e.g. 'Genesis' or '1 Sam')
+            from_language: Language of book_name
+            to_language: Language to translate to
 
-        # Handle special cases based on the book's metadata
-        special_handling = book_data.get('special_handling', None)
+        Returns:
+            The display name in to_language (e.g. 'Genèse'), or None if the book is not found
 
-        if special_handling == 'compound':
-            # For compound names like "Song of Songs", scramble each word separately
-            return self._scramble_compound_name(display_name)
-        else:
-            # Standard scrambling with special character preservation
-            letters, special_positions = self._extract_letters_for_scrambling(display_name)
-            scrambled_letters = self._scramble_letters(letters)
-            return self._reconstruct_text(scrambled_letters, special_positions)
+        Raises:
+            ValueError: If either language is not supported
+        """
+        target = get_language(to_language).name
+        return self.get_translations(book_name, from_language).get(target)
 
-    def _scramble_compound_name(self, text: str) -> str:
+    def validate_scramble_solution(self, original: str, scrambled: str, guess: str, fuzzy: bool = False,
+                                   max_distance: int = MAX_EDIT_DISTANCE, language: Optional[str] = None) -> bool:
         """
-        Scramble compound names like 'Song of Songs' by scrambling each word separately.
+        Validate that a guess is the correct solution to a specific scramble.
 
         Args:
-            text: The compound name to scramble
+            original: The original Bible book name
+            scrambled: The scrambled version
+            guess: The user's guess
+            fuzzy: Accept misspelled guesses within max_distance edits
+            max_distance: Edit budget used when fuzzy is enabled (at most MAX_EDIT_DISTANCE)
+            language: Language of original (found from the name when omitted)
 
         Returns:
-            Scrambled version with word boundaries preserved
+            True if guess matches the original (case-insensitive), or is another
+            book name or alias spelled by exactly the scrambled letters (only when
+            scrambled really is an anagram of original). With
+            fuzzy, a misspelled guess is accepted only if it resolves to the
+            original's book; the exact name of another book ('2 Samuel' for
+            '1 Samuel') is always wrong
+
+        Raises:
+            ValueError: If max_distance exceeds MAX_EDIT_DISTANCE, the largest
+                distance the guess resolver is built for
         """
-        words = text.split()
-        scrambled_words = []
-
-        for word in words:
-            # Don't scramble very short connector words (of, des, etc.)
-            if len(word) <= 2 or word.lower() in ['of', 'des', 'de', 'du']:
-                scrambled_words.append(word)
-            else:
-                letters, special_positions = self._extract_letters_for_scrambling(word)
-                if len(letters) > 1:
-                    scrambled_letters = self._scramble_letters(letters)
-                    scrambled_word = self._reconstruct_text(scrambled_letters, special_positions)
-                    scrambled_words.append(scrambled_word)
-                else:
-                    scrambled_words.append(word)
+        if fuzzy and max_distance > MAX_EDIT_DISTANCE:
+            raise ValueError(f"max_distance can be at most {MAX_EDIT_DISTANCE}")
+        if self._is_scramble_of(scrambled, original) and get_signature_index(language).spells(scrambled, guess):
+            return True
+        if self._normalize_book_name(original) == self._normalize_book_name(guess):
+            return True
+        if not fuzzy:
+            return False
+
+        record, index = self._find_book(original, language)
+        if record is None:
+            # Not a catalog name: fall back to comparing the strings
+            original = self._normalize_book_name(original)
+            guess = self._normalize_book_name(guess)
+            limit = min(max_distance, len(guess) // 2)
+            return limit > 0 and edit_distance(original, guess, limit) <= limit
+
+        match = index.resolve(guess, max_distance)
+        return match is not None and match[0].book_number == record.book_number
+
+    def _is_scramble_of(self, scrambled: str, original: str) -> bool:
+        """Check that a scramble (possibly sent by a client) uses exactly the letters of the original"""
+        return bool(scrambled) and name_signature(scrambled) == name_signature(original)
+
+    def _find_book(self, name: str, language: Optional[str]) -> Tuple[Optional[BookRecord], Optional[BookIndex]]:
+        """Look up a book in one language, or in each language in turn when none is given"""
+        languages = [language] if language else available_languages()
+        for lang in languages:
+            index = get_book_index(lang)
+            record = index.lookup(name)
+            if record is not None:
+                return record, index
+        return None, None
+
+    def validate_bilingual_solution(self, original: str, guess: str, language: str, fuzzy: bool = False,
+                                    max_distance: int = MAX_EDIT_DISTANCE, scrambled: str = '') -> bool:
+        """
+        Validate a guess against a book's name in any supported language.
 
-        return ' '.join(scrambled_words)
+        Args:
+            original: The original Bible book name
+            guess: The user's guess, in any supported language
+            language: Language of original
+            fuzzy: Accept misspelled guesses within max_distance edits
+            max_distance: Edit budget used when fuzzy is enabled
+            scrambled: The scrambled version, if the guess answers a scramble
 
-    def check_solution(self, scrambled: str, guess: str, language: str) -> bool:
+        Returns:
+            True if guess matches the book's name in one of the languages, or is
+            a book name or alias in any language spelled by exactly the scrambled
+            letters (only when scrambled really is an anagram of original)
         """
-        Check if a guess correctly solves a scrambled Bible book name.
+        if self._is_scramble_of(scrambled, original) and get_signature_index().spells(scrambled, guess):
+            return True
+        names = self.get_translations(original, language).items() or [(language, original)]
+        return any(self.validate_scramble_solution(name, '', guess, fuzzy=fuzzy, max_distance=max_distance,
+                                                   language=name_language)
+                   for name_language, name in names)
+
+    def get_answers(self, book_name: str, language: str) -> List[str]:
+        """
+        List every book a scramble of a book name could be solved as.
 
         Args:
-            scrambled: The scrambled text (for reference, not used in validation)
-            guess: The user's guess
-            language: 'english' or 'french'
+            book_name: The Bible book name
+            language: Language name (e.g. 'english' or 'french')
 
         Returns:
-            True if the guess is a valid Bible book name, False otherwise
+            Display names in the given language, the book itself first, then every
+            other book with a name or alias in that language made of the same letters
+
+        Raises:
+            ValueError: If the book is not found
         """
-        book_data = get_book_by_display_name(guess, language)
-        return book_data is not None
+        book_data = get_book_by_display_name(book_name, language)
+        if not book_data:
+            raise ValueError(f"Bible book '{book_name}' not found in {language}")
+
+        by_number = get_book_index(book_data.language).by_number
+        answers = [book_data.display_name]
+        for record in get_signature_index(book_data.language).books_spelled_by(book_data.display_name):
+            name = by_number[record.book_number].display_name
+            if name not in answers:
+                answers.append(name)
+        return answers
 
-    def validate_scramble_solution(self, original: str, scrambled: str, guess: str) -> bool:
+    def solve(self, scrambled: str, language: Optional[str] = None,
+              max_distance: int = MAX_EDIT_DISTANCE) -> List[Dict[str, Any]]:
         """
-        Validate that a guess is the correct solution to a specific scramble.
+        Find the Bible books a scramble could have come from.
+
+        Accents, case, spaces and letter order are ignored; digits must match.
+        When no book uses exactly the scrambled letters, books within
+        max_distance added or removed letters are returned instead. Only
+        full book names and long aliases are matched, so short input is
+        never solved through an abbreviation ('abc' is not Acts by way of 'Ac').
 
         Args:
-            original: The original Bible book name
-            scrambled: The scrambled version
-            guess: The user's guess
+            scrambled: The scrambled text, fully or partially scrambled
+            language: Only return books in this language (None for every language)
+            max_distance: Largest number of wrong letters to tolerate (0 for exact only)
 
         Returns:
-            True if guess matches the original (case-insensitive)
-        """
-        return self._normalize_book_name(original) == self._normalize_book_name(guess)
+            List of dictionaries with book, language, book_number and distance,
+            closest first, at most one per book and language
 
-    def get_random_book(self, language: str, testament: str = 'any', category: str = 'any') -> str:
+        Raises:
+            ValueError: If the language is not supported
+        """
+        if language is not None:
+            if not is_supported_language(language):
+                raise ValueError(language_error_message())
+            language = get_language(language).name
+
+        return [{
+            'book': record.display_name,
+            'language': record.language,
+            'book_number': record.book_number,
+            'distance': distance
+        } for record, distance in get_solver_index(language).match(scrambled, max_distance)]
+
+    def get_random_book(self, language: str, testament: str = 'any', category: str = 'any',
+                        rng: RandomSource = None) -> str:
         """
         Get a random Bible book for scrambling.
 
         Args:
-            language: 'english' or 'french'
+            language: Language name (e.g. 'english' or 'french')
             testament: 'old'/'ancien', 'new'/'nouveau', or 'any'
             category: Specific category or 'any'
+            rng: Seed or random.Random to pick with
 
         Returns:
             Random Bible book display name
+
+        Raises:
+            ValueError: If the filters are unknown or match no books
         """
-        books = self.english_books if language.lower() == 'english' else self.french_books
+        books = get_book_index(language).selection_table(testament, category)
+        if not books:
+            raise ValueError(f"No books found with criteria: testament={testament}, category={category}")
 
-        # Filter by testament if specified
-        if testament != 'any':
-            if language.lower() == 'english':
-                target_testament = 'old' if testament.lower() in ['old', 'ancien'] else 'new'
-            else:
-                target_testament = 'ancien' if testament.lower() in ['old', 'ancien'] else 'nouveau'
+        return _get_rng(rng).choice(books)
 
-            books = {k: v for k, v in books.items() if v['testament'] == target_testament}
+    def create_puzzle(self, language: str, testament: str = 'any', category: str = 'any',
+                      seed: Optional[int] = None, difficulty: str = 'medium') -> Dict[str, Any]:
+        """
+        Create a random puzzle that can be regenerated from its ID.
+
+        Args:
+            language: Language name (e.g. 'english' or 'french')
+            testament: 'old'/'ancien', 'new'/'nouveau', or 'any'
+            category: Specific category or 'any'
+            seed: Seed for the puzzle (defaults to a fresh random seed)
+            difficulty: 'easy', 'medium' or 'hard'
 
-        # Filter by category if specified
-        if category != 'any':
-            books = {k: v for k, v in books.items() if v['category'] == category}
+        Returns:
+            Dictionary with puzzle_id, language, difficulty, original, scrambled, hint,
+            ambiguous and answers
 
-        if not books:
-            raise ValueError(f"No books found with criteria: testament={testament}, category={category}")
+        Raises:
+            ValueError: If the seed is negative, the difficulty is unknown or the filters match no books
+        """
+        seed = new_seed() if seed is None else seed
+        if seed < 0:
+            raise ValueError("Seed must be a non-negative integer")
+        book_name = self.get_random_book(language, testament, category, rng=seed)
+        return self.create_book_puzzle(book_name, language, seed, difficulty)
+
+    def create_book_puzzle(self, book_name: str, language: str, seed: Optional[int] = None,
+                           difficulty: str = 'medium') -> Dict[str, Any]:
+        """
+        Create a puzzle for a given book that can be regenerated from its ID.
 
-        random_key = random.choice(list(books.keys()))
-        return books[random_key]['display_name']
+        Args:
+            book_name: The Bible book name
+            language: Language name (e.g. 'english' or 'french')
+            seed: Seed for the scramble (defaults to a fresh random seed)
+            difficulty: 'easy', 'medium' or 'hard'
+
+        Returns:
+            Dictionary with puzzle_id, language, difficulty, original, scrambled, hint,
+            ambiguous and answers
+
+        Raises:
+            ValueError: If the seed is negative, the difficulty is unknown or the book is not found
+        """
+        seed = new_seed() if seed is None else seed
+        if seed < 0:
+            raise ValueError("Seed must be a non-negative integer")
+        difficulty = validate_difficulty(difficulty)
+        book_data = get_book_by_display_name(book_name, language)
+        if not book_data:
+            raise ValueError(f"Bible book '{book_name}' not found in {language}")
+        return self.get_puzzle(encode_puzzle_id(book_data.language, book_data.book_number, seed, difficulty))
+
+    def get_puzzle(self, puzzle_id: str) -> Dict[str, Any]:
+        """
+        Regenerate a puzzle from its ID.
+
+        Args:
+            puzzle_id: ID returned by create_puzzle (e.g. 'english-1-9f2c4e7a01b3d5c8')
+
+        Returns:
+            Dictionary with puzzle_id, language, difficulty, original, scrambled, hint,
+            ambiguous and answers (every book the scramble can be solved as)
+
+        Raises:
+            ValueError: If the ID is malformed or names an unknown language or book
+        """
+        language, book_number, seed, difficulty = decode_puzzle_id(puzzle_id)
+        book_data = get_book_index(language).by_number.get(book_number)
+        if book_data is None:
+            raise ValueError(f"Invalid puzzle ID: '{puzzle_id}'")
+
+        answers = self.get_answers(book_data.display_name, language)
+        return {
+            'puzzle_id': encode_puzzle_id(language, book_number, seed, difficulty),
+            'language': language,
+            'difficulty': difficulty,
+            'original': book_data.display_name,
+            'scrambled': self.generate_scramble(book_data.display_name, language, difficulty, rng=seed),
+            'hint': self.get_hint(book_data.display_name, language),
+            'ambiguous': len(answers) > 1,
+            'answers': answers
+        }
 
     def get_hint(self, book_name: str, language: str) -> str:
         """
@@ -234,7 +451,7 @@ class BibleBookScrambler:
 
         Args:
             book_name: The Bible book name
-            language: 'english' or 'french'
+            language: Language name (e.g. 'english' or 'french')
 
         Returns:
             A helpful hint about the book
@@ -243,59 +460,46 @@ class BibleBookScrambler:
         if not book_data:
             return "Book not found"
 
-        testament = book_data['testament']
-        category = book_data['category']
-        book_number = book_data['book_number']
-
         # Translate testament and category to user-friendly terms
-        if language.lower() == 'english':
-            testament_name = "Old Testament" if testament == 'old' else "New Testament"
-            category_map = {
-                'law': 'Law (Torah)',
-                'history': 'Historical Books',
-                'wisdom': 'Wisdom Literature',
-                'major_prophets': 'Major Prophets',
-                'minor_prophets': 'Minor Prophets',
-                'gospels': 'Gospels',
-                'pauline_epistles': 'Pauline Epistles',
-                'general_epistles': 'General Epistles',
-                'apocalyptic': 'Apocalyptic Literature'
-            }
-        else:
-            testament_name = "Ancien Testament" if testament == 'ancien' else "Nouveau Testament"
-            category_map = {
-                'loi': 'Loi (Torah)',
-                'histoire': 'Livres Historiques',
-                'sagesse': 'Littérature de Sagesse',
-                'grands_prophetes': 'Grands Prophètes',
-                'petits_prophetes': 'Petits Prophètes',
-                'evangiles': 'Évangiles',
-                'epitres_pauliniennes': 'Épîtres Pauliniennes',
-                'epitres_generales': 'Épîtres Générales',
-                'apocalyptique': 'Littérature Apocalyptique'
-            }
-
-        category_name = category_map.get(category, category.replace('_', ' ').title())
-
-        return f"{testament_name}, {category_name} (Book #{book_number})"
+        spec = get_language(language)
+        return spec.hint_format.format(
+            testament=spec.testament_names[book_data.testament],
+            category=spec.category_names[book_data.category],
+            book_number=book_data.book_number
+        )
 
     def get_all_books_list(self, language: str) -> List[str]:
         """
         Get a list of all Bible book names in the specified language.
 
         Args:
-            language: 'english' or 'french'
+            language: Language name (e.g. 'english' or 'french')
 
         Returns:
             List of all Bible book display names
         """
-        books = self.english_books if language.lower() == 'english' else self.french_books
-        return [book_data['display_name'] for book_data in books.values()]
+        return [book.display_name for book in self.get_book_records(language)]
+
+    def get_book_records(self, language: str) -> Tuple[BookRecord, ...]:
+        """
+        Get the catalog of Bible book records for a language in book order.
+
+        Args:
+            language: Language name (e.g. 'english' or 'french')
+
+        Returns:
+            Tuple of BookRecords ordered by book number
+        """
+        return get_book_index(language).records
 
 def main():
     """Main function to run the Bible book scrambler tool"""
     scrambler = BibleBookScrambler()
 
+    # Random challenges go through every book before repeating one
+    session_bags = SessionBags(max_sessions=1)
+    session_id = session_bags.new_session_id()
+
     print("=== Bible Book Scrambler Tool ===")
     print("Scramble Bible book names in French or English for puzzle solving")
     print()
@@ -319,16 +523,15 @@ def main():
         language = None
         if choice in ['1', '2', '3', '4', '5']:
             print("\nChoose language:")
-            print("1. English")
-            print("2. French")
-            lang_choice = input("Enter language choice (1-2): ").strip()
-
-            if lang_choice == '1':
-                language = 'english'
-            elif lang_choice == '2':
-                language = 'french'
+            for i, name in enumerate(available_languages(), 1):
+                print(f"{i}. {get_language(name).display_name}")
+            lang_choice = input(f"Enter language choice (1-{len(available_languages())}): ").strip()
+
+            languages = available_languages()
+            if lang_choice.isdigit() and 1 <= int(lang_choice) <= len(languages):
+                language = languages[int(lang_choice) - 1]
             else:
-                print("Invalid language choice. Please enter 1 or 2.")
+                print(f"Invalid language choice. Please enter 1-{len(languages)}.")
                 continue
 
         try:
@@ -336,26 +539,30 @@ def main():
                 # Generate scramble from book name
                 book_name = input(f"Enter a Bible book name in {language.title()}: ").strip()
                 if book_name:
-                    scrambled = scrambler.generate_scramble(book_name, language)
+                    difficulty = input("Difficulty (easy/medium/hard) [medium]: ").strip() or 'medium'
+                    scrambled = scrambler.generate_scramble(book_name, language, difficulty)
                     print(f"\nOriginal: {book_name}")
                     print(f"Scrambled: {scrambled}")
 
             elif choice == '2':
                 # Random scramble challenge
                 print("\nChoose testament:")
-                print("1. Old Testament" + (" / Ancien Testament" if language == 'french' else ""))
-                print("2. New Testament" + (" / Nouveau Testament" if language == 'french' else ""))
+                spec = get_language(language)
+                print(f"1. {spec.testament_names[0]}")
+                print(f"2. {spec.testament_names[1]}")
                 print("3. Any")
 
                 testament_choice = input("Enter testament choice (1-3): ").strip()
                 testament = 'any'
                 if testament_choice == '1':
-                    testament = 'old' if language == 'english' else 'ancien'
+                    testament = spec.testament_keys[0]
                 elif testament_choice == '2':
-                    testament = 'new' if language == 'english' else 'nouveau'
+                    testament = spec.testament_keys[1]
+
+                difficulty = input("Difficulty (easy/medium/hard) [medium]: ").strip() or 'medium'
 
-                random_book = scrambler.get_random_book(language, testament)
-                scrambled = scrambler.generate_scramble(random_book, language)
+                random_book = session_bags.draw(session_id, language, testament)
+                scrambled = scrambler.generate_scramble(random_book, language, difficulty)
                 hint = scrambler.get_hint(random_book, language)
 
                 print(f"\nScrambled book: {scrambled}")
@@ -1,969 +1,461 @@
 #!/usr/bin/env python3
 """
 Bible Books Data
-Complete list of the 66 canonical Bible books in English and French
+Complete list of the 66 canonical Bible books in every supported language
 with metadata for the Bible book scrambler tool.
+
+The catalogs themselves live in the per-language data files under
+languages/ (see language_registry.py); this module turns them into
+compact records and build-once lookup indexes.
 """
 
-from typing import Dict, Any
+import unicodedata
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Any, ItemsView, List, Mapping, Optional, Tuple
+
+from book_suggester import PrefixSuggester
+from guess_resolver import GuessResolver
+from language_registry import available_languages, get_language
+
+def get_bible_books(language: str) -> Mapping[str, 'BookRecord']:
+    """
+    Get all 66 Bible books in a language with metadata.
+
+    Args:
+        language: Language name (e.g. 'english' or 'french')
+
+    Returns:
+        Read-only mapping of normalized book names to the shared, immutable
+        book records (which read like the old metadata dictionaries)
+    """
+    return get_book_index(language).books
 
-def get_english_bible_books() -> Dict[str, Dict[str, Any]]:
+def get_english_bible_books() -> Mapping[str, 'BookRecord']:
     """
     Get all 66 Bible books in English with metadata.
 
     Returns:
-        Dictionary with normalized book names as keys and metadata as values
+        Read-only mapping of normalized book names to book records
     """
-    return {
-        # OLD TESTAMENT - LAW (Torah/Pentateuch)
-        "genesis": {
-            "display_name": "Genesis",
-            "testament": "old",
-            "category": "law",
-            "book_number": 1
-        },
-        "exodus": {
-            "display_name": "Exodus",
-            "testament": "old",
-            "category": "law",
-            "book_number": 2
-        },
-        "leviticus": {
-            "display_name": "Leviticus",
-            "testament": "old",
-            "category": "law",
-            "book_number": 3
-        },
-        "numbers": {
-            "display_name": "Numbers",
-            "testament": "old",
-            "category": "law",
-            "book_number": 4
-        },
-        "deuteronomy": {
-            "display_name": "Deuteronomy",
-            "testament": "old",
-            "category": "law",
-            "book_number": 5
-        },
-
-        # OLD TESTAMENT - HISTORY
-        "joshua": {
-            "display_name": "Joshua",
-            "testament": "old",
-            "category": "history",
-            "book_number": 6
-        },
-        "judges": {
-            "display_name": "Judges",
-            "testament": "old",
-            "category": "history",
-            "book_number": 7
-        },
-        "ruth": {
-            "display_name": "Ruth",
-            "testament": "old",
-            "category": "history",
-            "book_number": 8
-        },
-        "1_samuel": {
-            "display_name": "1 Samuel",
-            "testament": "old",
-            "category": "history",
-            "book_number": 9,
-            "special_handling": "numbered"
-        },
-        "2_samuel": {
-            "display_name": "2 Samuel",
-            "testament": "old",
-            "category": "history",
-            "book_number": 10,
-            "special_handling": "numbered"
-        },
-        "1_kings": {
-            "display_name": "1 Kings",
-            "testament": "old",
-            "category": "history",
-            "book_number": 11,
-            "special_handling": "numbered"
-        },
-        "2_kings": {
-            "display_name": "2 Kings",
-            "testament": "old",
-            "category": "history",
-            "book_number": 12,
-            "special_handling": "numbered"
-        },
-        "1_chronicles": {
-            "display_name": "1 Chronicles",
-            "testament": "old",
-            "category": "history",
-            "book_number": 13,
-            "special_handling": "numbered"
-        },
-        "2_chronicles": {
-            "display_name": "2 Chronicles",
-            "testament": "old",
-            "category": "history",
-            "book_number": 14,
-            "special_handling": "numbered"
-        },
-        "ezra": {
-            "display_name": "Ezra",
-            "testament": "old",
-            "category": "history",
-            "book_number": 15
-        },
-        "nehemiah": {
-            "display_name": "Nehemiah",
-            "testament": "old",
-            "category": "history",
-            "book_number": 16
-        },
-        "esther": {
-            "display_name": "Esther",
-            "testament": "old",
-            "category": "history",
-            "book_number": 17
-        },
-
-        # OLD TESTAMENT - WISDOM & POETRY
-        "job": {
-            "display_name": "Job",
-            "testament": "old",
-            "category": "wisdom",
-            "book_number": 18
-        },
-        "psalms": {
-            "display_name": "Psalms",
-            "testament": "old",
-            "category": "wisdom",
-            "book_number": 19
-        },
-        "proverbs": {
-            "display_name": "Proverbs",
-            "testament": "old",
-            "category": "wisdom",
-            "book_number": 20
-        },
-        "ecclesiastes": {
-            "display_name": "Ecclesiastes",
-            "testament": "old",
-            "category": "wisdom",
-            "book_number": 21
-        },
-        "song_of_songs": {
-            "display_name": "Song of Songs",
-            "testament": "old",
-            "category": "wisdom",
-            "book_number": 22,
-            "special_handling": "compound",
-            "alternate_names": ["Song of Solomon"]
-        },
-
-        # OLD TESTAMENT - MAJOR PROPHETS
-        "isaiah": {
-            "display_name": "Isaiah",
-            "testament": "old",
-            "category": "major_prophets",
-            "book_number": 23
-        },
-        "jeremiah": {
-            "display_name": "Jeremiah",
-            "testament": "old",
-            "category": "major_prophets",
-            "book_number": 24
-        },
-        "lamentations": {
-            "display_name": "Lamentations",
-            "testament": "old",
-            "category": "major_prophets",
-            "book_number": 25
-        },
-        "ezekiel": {
-            "display_name": "Ezekiel",
-            "testament": "old",
-            "category": "major_prophets",
-            "book_number": 26
-        },
-        "daniel": {
-            "display_name": "Daniel",
-            "testament": "old",
-            "category": "major_prophets",
-            "book_number": 27
-        },
-
-        # OLD TESTAMENT - MINOR PROPHETS
-        "hosea": {
-            "display_name": "Hosea",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 28
-        },
-        "joel": {
-            "display_name": "Joel",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 29
-        },
-        "amos": {
-            "display_name": "Amos",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 30
-        },
-        "obadiah": {
-            "display_name": "Obadiah",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 31
-        },
-        "jonah": {
-            "display_name": "Jonah",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 32
-        },
-        "micah": {
-            "display_name": "Micah",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 33
-        },
-        "nahum": {
-            "display_name": "Nahum",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 34
-        },
-        "habakkuk": {
-            "display_name": "Habakkuk",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 35
-        },
-        "zephaniah": {
-            "display_name": "Zephaniah",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 36
-        },
-        "haggai": {
-            "display_name": "Haggai",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 37
-        },
-        "zechariah": {
-            "display_name": "Zechariah",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 38
-        },
-        "malachi": {
-            "display_name": "Malachi",
-            "testament": "old",
-            "category": "minor_prophets",
-            "book_number": 39
-        },
-
-        # NEW TESTAMENT - GOSPELS
-        "matthew": {
-            "display_name": "Matthew",
-            "testament": "new",
-            "category": "gospels",
-            "book_number": 40
-        },
-        "mark": {
-            "display_name": "Mark",
-            "testament": "new",
-            "category": "gospels",
-            "book_number": 41
-        },
-        "luke": {
-            "display_name": "Luke",
-            "testament": "new",
-            "category": "gospels",
-            "book_number": 42
-        },
-        "john": {
-            "display_name": "John",
-            "testament": "new",
-            "category": "gospels",
-            "book_number": 43
-        },
-
-        # NEW TESTAMENT - HISTORY
-        "acts": {
-            "display_name": "Acts",
-            "testament": "new",
-            "category": "history",
-            "book_number": 44
-        },
-
-        # NEW TESTAMENT - PAULINE EPISTLES
-        "romans": {
-            "display_name": "Romans",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 45
-        },
-        "1_corinthians": {
-            "display_name": "1 Corinthians",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 46,
-            "special_handling": "numbered"
-        },
-        "2_corinthians": {
-            "display_name": "2 Corinthians",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 47,
-            "special_handling": "numbered"
-        },
-        "galatians": {
-            "display_name": "Galatians",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 48
-        },
-        "ephesians": {
-            "display_name": "Ephesians",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 49
-        },
-        "philippians": {
-            "display_name": "Philippians",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 50
-        },
-        "colossians": {
-            "display_name": "Colossians",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 51
-        },
-        "1_thessalonians": {
-            "display_name": "1 Thessalonians",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 52,
-            "special_handling": "numbered"
-        },
-        "2_thessalonians": {
-            "display_name": "2 Thessalonians",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 53,
-            "special_handling": "numbered"
-        },
-        "1_timothy": {
-            "display_name": "1 Timothy",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 54,
-            "special_handling": "numbered"
-        },
-        "2_timothy": {
-            "display_name": "2 Timothy",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 55,
-            "special_handling": "numbered"
-        },
-        "titus": {
-            "display_name": "Titus",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 56
-        },
-        "philemon": {
-            "display_name": "Philemon",
-            "testament": "new",
-            "category": "pauline_epistles",
-            "book_number": 57
-        },
-
-        # NEW TESTAMENT - GENERAL EPISTLES
-        "hebrews": {
-            "display_name": "Hebrews",
-            "testament": "new",
-            "category": "general_epistles",
-            "book_number": 58
-        },
-        "james": {
-            "display_name": "James",
-            "testament": "new",
-            "category": "general_epistles",
-            "book_number": 59
-        },
-        "1_peter": {
-            "display_name": "1 Peter",
-            "testament": "new",
-            "category": "general_epistles",
-            "book_number": 60,
-            "special_handling": "numbered"
-        },
-        "2_peter": {
-            "display_name": "2 Peter",
-            "testament": "new",
-            "category": "general_epistles",
-            "book_number": 61,
-            "special_handling": "numbered"
-        },
-        "1_john": {
-            "display_name": "1 John",
-            "testament": "new",
-            "category": "general_epistles",
-            "book_number": 62,
-            "special_handling": "numbered"
-        },
-        "2_john": {
-            "display_name": "2 John",
-            "testament": "new",
-            "category": "general_epistles",
-            "book_number": 63,
-            "special_handling": "numbered"
-        },
-        "3_john": {
-            "display_name": "3 John",
-            "testament": "new",
-            "category": "general_epistles",
-            "book_number": 64,
-            "special_handling": "numbered"
-        },
-        "jude": {
-            "display_name": "Jude",
-            "testament": "new",
-            "category": "general_epistles",
-            "book_number": 65
-        },
-
-        # NEW TESTAMENT - APOCALYPTIC
-        "revelation": {
-            "display_name": "Revelation",
-            "testament": "new",
-            "category": "apocalyptic",
-            "book_number": 66,
-            "alternate_names": ["Apocalypse"]
-        }
-    }
-
-def get_french_bible_books() -> Dict[str, Dict[str, Any]]:
+    return get_bible_books('english')
+
+def get_french_bible_books() -> Mapping[str, 'BookRecord']:
     """
     Get all 66 Bible books in French with metadata.
 
     Returns:
-        Dictionary with normalized book names as keys and metadata as values
+        Read-only mapping of normalized book names to book records
     """
-    return {
-        # ANCIEN TESTAMENT - LOI (Torah/Pentateuque)
-        "genese": {
-            "display_name": "Genèse",
-            "testament": "ancien",
-            "category": "loi",
-            "book_number": 1,
-            "special_handling": "accented"
-        },
-        "exode": {
-            "display_name": "Exode",
-            "testament": "ancien",
-            "category": "loi",
-            "book_number": 2
-        },
-        "levitique": {
-            "display_name": "Lévitique",
-            "testament": "ancien",
-            "category": "loi",
-            "book_number": 3,
-            "special_handling": "accented"
-        },
-        "nombres": {
-            "display_name": "Nombres",
-            "testament": "ancien",
-            "category": "loi",
-            "book_number": 4
-        },
-        "deuteronome": {
-            "display_name": "Deutéronome",
-            "testament": "ancien",
-            "category": "loi",
-            "book_number": 5,
-            "special_handling": "accented"
-        },
-
-        # ANCIEN TESTAMENT - HISTOIRE
-        "josue": {
-            "display_name": "Josué",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 6,
-            "special_handling": "accented"
-        },
-        "juges": {
-            "display_name": "Juges",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 7
-        },
-        "ruth": {
-            "display_name": "Ruth",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 8
-        },
-        "1_samuel": {
-            "display_name": "1 Samuel",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 9,
-            "special_handling": "numbered"
-        },
-        "2_samuel": {
-            "display_name": "2 Samuel",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 10,
-            "special_handling": "numbered"
-        },
-        "1_rois": {
-            "display_name": "1 Rois",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 11,
-            "special_handling": "numbered"
-        },
-        "2_rois": {
-            "display_name": "2 Rois",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 12,
-            "special_handling": "numbered"
-        },
-        "1_chroniques": {
-            "display_name": "1 Chroniques",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 13,
-            "special_handling": "numbered"
-        },
-        "2_chroniques": {
-            "display_name": "2 Chroniques",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 14,
-            "special_handling": "numbered"
-        },
-        "esdras": {
-            "display_name": "Esdras",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 15
-        },
-        "nehemie": {
-            "display_name": "Néhémie",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 16,
-            "special_handling": "accented"
-        },
-        "esther": {
-            "display_name": "Esther",
-            "testament": "ancien",
-            "category": "histoire",
-            "book_number": 17
-        },
-
-        # ANCIEN TESTAMENT - SAGESSE & POÉSIE
-        "job": {
-            "display_name": "Job",
-            "testament": "ancien",
-            "category": "sagesse",
-            "book_number": 18
-        },
-        "psaumes": {
-            "display_name": "Psaumes",
-            "testament": "ancien",
-            "category": "sagesse",
-            "book_number": 19
-        },
-        "proverbes": {
-            "display_name": "Proverbes",
-            "testament": "ancien",
-            "category": "sagesse",
-            "book_number": 20
-        },
-        "ecclesiaste": {
-            "display_name": "Ecclésiaste",
-            "testament": "ancien",
-            "category": "sagesse",
-            "book_number": 21,
-            "special_handling": "accented"
-        },
-        "cantique_des_cantiques": {
-            "display_name": "Cantique des Cantiques",
-            "testament": "ancien",
-            "category": "sagesse",
-            "book_number": 22,
-            "special_handling": "compound"
-        },
-
-        # ANCIEN TESTAMENT - GRANDS PROPHÈTES
-        "esaie": {
-            "display_name": "Ésaïe",
-            "testament": "ancien",
-            "category": "grands_prophetes",
-            "book_number": 23,
-            "special_handling": "accented"
-        },
-        "jeremie": {
-            "display_name": "Jérémie",
-            "testament": "ancien",
-            "category": "grands_prophetes",
-            "book_number": 24,
-            "special_handling": "accented"
-        },
-        "lamentations": {
-            "display_name": "Lamentations",
-            "testament": "ancien",
-            "category": "grands_prophetes",
-            "book_number": 25
-        },
-        "ezechiel": {
-            "display_name": "Ézéchiel",
-            "testament": "ancien",
-            "category": "grands_prophetes",
-            "book_number": 26,
-            "special_handling": "accented"
-        },
-        "daniel": {
-            "display_name": "Daniel",
-            "testament": "ancien",
-            "category": "grands_prophetes",
-            "book_number": 27
-        },
-
-        # ANCIEN TESTAMENT - PETITS PROPHÈTES
-        "osee": {
-            "display_name": "Osée",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 28,
-            "special_handling": "accented"
-        },
-        "joel": {
-            "display_name": "Joël",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 29,
-            "special_handling": "accented"
-        },
-        "amos": {
-            "display_name": "Amos",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 30
-        },
-        "abdias": {
-            "display_name": "Abdias",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 31
-        },
-        "jonas": {
-            "display_name": "Jonas",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 32
-        },
-        "michee": {
-            "display_name": "Michée",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 33,
-            "special_handling": "accented"
-        },
-        "nahum": {
-            "display_name": "Nahum",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 34
-        },
-        "habacuc": {
-            "display_name": "Habacuc",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 35
-        },
-        "sophonie": {
-            "display_name": "Sophonie",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 36
-        },
-        "aggee": {
-            "display_name": "Aggée",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 37,
-            "special_handling": "accented"
-        },
-        "zacharie": {
-            "display_name": "Zacharie",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 38
-        },
-        "malachie": {
-            "display_name": "Malachie",
-            "testament": "ancien",
-            "category": "petits_prophetes",
-            "book_number": 39
-        },
-
-        # NOUVEAU TESTAMENT - ÉVANGILES
-        "matthieu": {
-            "display_name": "Matthieu",
-            "testament": "nouveau",
-            "category": "evangiles",
-            "book_number": 40
-        },
-        "marc": {
-            "display_name": "Marc",
-            "testament": "nouveau",
-            "category": "evangiles",
-            "book_number": 41
-        },
-        "luc": {
-            "display_name": "Luc",
-            "testament": "nouveau",
-            "category": "evangiles",
-            "book_number": 42
-        },
-        "jean": {
-            "display_name": "Jean",
-            "testament": "nouveau",
-            "category": "evangiles",
-            "book_number": 43
-        },
-
-        # NOUVEAU TESTAMENT - HISTOIRE
-        "actes": {
-            "display_name": "Actes",
-            "testament": "nouveau",
-            "category": "histoire",
-            "book_number": 44
-        },
-
-        # NOUVEAU TESTAMENT - ÉPÎTRES PAULINIENNES
-        "romains": {
-            "display_name": "Romains",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 45
-        },
-        "1_corinthiens": {
-            "display_name": "1 Corinthiens",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 46,
-            "special_handling": "numbered"
-        },
-        "2_corinthiens": {
-            "display_name": "2 Corinthiens",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 47,
-            "special_handling": "numbered"
-        },
-        "galates": {
-            "display_name": "Galates",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 48
-        },
-        "ephesiens": {
-            "display_name": "Éphésiens",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 49,
-            "special_handling": "accented"
-        },
-        "philippiens": {
-            "display_name": "Philippiens",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 50
-        },
-        "colossiens": {
-            "display_name": "Colossiens",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 51
-        },
-        "1_thessaloniciens": {
-            "display_name": "1 Thessaloniciens",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 52,
-            "special_handling": "numbered"
-        },
-        "2_thessaloniciens": {
-            "display_name": "2 Thessaloniciens",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 53,
-            "special_handling": "numbered"
-        },
-        "1_timothee": {
-            "display_name": "1 Timothée",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 54,
-            "special_handling": "numbered_accented"
-        },
-        "2_timothee": {
-            "display_name": "2 Timothée",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 55,
-            "special_handling": "numbered_accented"
-        },
-        "tite": {
-            "display_name": "Tite",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 56
-        },
-        "philemon": {
-            "display_name": "Philémon",
-            "testament": "nouveau",
-            "category": "epitres_pauliniennes",
-            "book_number": 57,
-            "special_handling": "accented"
-        },
-
-        # NOUVEAU TESTAMENT - ÉPÎTRES GÉNÉRALES
-        "hebreux": {
-            "display_name": "Hébreux",
-            "testament": "nouveau",
-            "category": "epitres_generales",
-            "book_number": 58,
-            "special_handling": "accented"
-        },
-        "jacques": {
-            "display_name": "Jacques",
-            "testament": "nouveau",
-            "category": "epitres_generales",
-            "book_number": 59
-        },
-        "1_pierre": {
-            "display_name": "1 Pierre",
-            "testament": "nouveau",
-            "category": "epitres_generales",
-            "book_number": 60,
-            "special_handling": "numbered"
-        },
-        "2_pierre": {
-            "display_name": "2 Pierre",
-            "testament": "nouveau",
-            "category": "epitres_generales",
-            "book_number": 61,
-            "special_handling": "numbered"
-        },
-        "1_jean": {
-            "display_name": "1 Jean",
-            "testament": "nouveau",
-            "category": "epitres_generales",
-            "book_number": 62,
-            "special_handling": "numbered"
-        },
-        "2_jean": {
-            "display_name": "2 Jean",
-            "testament": "nouveau",
-            "category": "epitres_generales",
-            "book_number": 63,
-            "special_handling": "numbered"
-        },
-        "3_jean": {
-            "display_name": "3 Jean",
-            "testament": "nouveau",
-            "category": "epitres_generales",
-            "book_number": 64,
-            "special_handling": "numbered"
-        },
-        "jude": {
-            "display_name": "Jude",
-            "testament": "nouveau",
-            "category": "epitres_generales",
-            "book_number": 65
-        },
-
-        # NOUVEAU TESTAMENT - APOCALYPTIQUE
-        "apocalypse": {
-            "display_name": "Apocalypse",
-            "testament": "nouveau",
-            "category": "apocalyptique",
-            "book_number": 66
-        }
-    }
-
-def get_book_by_display_name(display_name: str, language: str) -> Dict[str, Any]:
+    return get_bible_books('french')
+
+class Testament(IntEnum):
+    """Testament a book belongs to, independent of language"""
+    OLD = 0
+    NEW = 1
+
+class Category(IntEnum):
+    """Literary category of a book, independent of language"""
+    LAW = 0
+    HISTORY = 1
+    WISDOM = 2
+    MAJOR_PROPHETS = 3
+    MINOR_PROPHETS = 4
+    GOSPELS = 5
+    PAULINE_EPISTLES = 6
+    GENERAL_EPISTLES = 7
+    APOCALYPTIC = 8
+
+class SpecialHandling(IntEnum):
+    """Scrambling hints attached to a book name"""
+    NONE = 0
+    NUMBERED = 1
+    ACCENTED = 2
+    COMPOUND = 3
+    NUMBERED_ACCENTED = 4
+
+SPECIAL_HANDLING_KEYS: Tuple[str, ...] = ('', 'numbered', 'accented', 'compound', 'numbered_accented')
+
+class BookRecord:
     """
-    Find a Bible book by its display name.
+    Immutable, compact representation of one Bible book.
+
+    Testament, category and special handling are stored as small enums.
+    Item access (record['display_name'], record.get('special_handling'))
+    is still supported so code written against the old per-book dicts keeps
+    working, and yields the same localized string values those dicts held.
+    """
+
+    __slots__ = ('key', 'display_name', 'testament', 'category', 'book_number',
+                 'special_handling', 'alternate_names', 'language')
+
+    _FIELDS = ('display_name', 'testament', 'category', 'book_number',
+               'special_handling', 'alternate_names')
+
+    def __init__(self, key: str, display_name: str, testament: Testament, category: Category,
+                 book_number: int, language: str,
+                 special_handling: SpecialHandling = SpecialHandling.NONE,
+                 alternate_names: Tuple[str, ...] = ()):
+        set_field = object.__setattr__
+        set_field(self, 'key', key)
+        set_field(self, 'display_name', display_name)
+        set_field(self, 'testament', testament)
+        set_field(self, 'category', category)
+        set_field(self, 'book_number', book_number)
+        set_field(self, 'special_handling', special_handling)
+        set_field(self, 'alternate_names', tuple(alternate_names))
+        set_field(self, 'language', language)
+
+    @classmethod
+    def from_dict(cls, key: str, book_data: Dict[str, Any], language: str) -> 'BookRecord':
+        """
+        Build a record from one entry of the catalog dictionaries.
+
+        Args:
+            key: Normalized book key (e.g. '1_samuel')
+            book_data: The book's metadata dictionary
+            language: Language the entry belongs to
+
+        Returns:
+            The equivalent BookRecord
+        """
+        spec = get_language(language)
+        special_handling = book_data.get('special_handling')
+        return cls(
+            key=key,
+            display_name=book_data['display_name'],
+            testament=Testament(spec.testament_keys.index(book_data['testament'])),
+            category=Category(spec.category_keys.index(book_data['category'])),
+            book_number=book_data['book_number'],
+            language=language,
+            special_handling=SpecialHandling(SPECIAL_HANDLING_KEYS.index(special_handling)) if special_handling else SpecialHandling.NONE,
+            alternate_names=tuple(book_data.get('alternate_names', ()))
+        )
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("BookRecord is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("BookRecord is immutable")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BookRecord):
+            return NotImplemented
+        return self.language == other.language and self.book_number == other.book_number
+
+    def __hash__(self) -> int:
+        return hash((self.language, self.book_number))
+
+    def __repr__(self) -> str:
+        return f"BookRecord({self.key!r}, {self.display_name!r}, {self.language!r}, #{self.book_number})"
+
+    # Dict-compatible view for callers written against the old dictionaries
+
+    def __getitem__(self, field: str) -> Any:
+        if field == 'display_name':
+            return self.display_name
+        if field == 'testament':
+            return get_language(self.language).testament_keys[self.testament]
+        if field == 'category':
+            return get_language(self.language).category_keys[self.category]
+        if field == 'book_number':
+            return self.book_number
+        if field == 'special_handling' and self.special_handling:
+            return SPECIAL_HANDLING_KEYS[self.special_handling]
+        if field == 'alternate_names' and self.alternate_names:
+            return list(self.alternate_names)
+        raise KeyError(field)
+
+    def __contains__(self, field: str) -> bool:
+        try:
+            self[field]
+        except KeyError:
+            return False
+        return True
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """Return a field the way the old book dictionary would"""
+        try:
+            return self[field]
+        except KeyError:
+            return default
+
+    def keys(self) -> List[str]:
+        """Return the field names present in the old book dictionary"""
+        return [field for field in self._FIELDS if field in self]
+
+    def items(self) -> List[Tuple[str, Any]]:
+        """Return (field, value) pairs as the old book dictionary would"""
+        return [(field, self[field]) for field in self.keys()]
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a plain dictionary copy of this record"""
+        return dict(self.items())
+
+def fold_name(text: str) -> str:
+    """
+    Fold a book name into its lookup key.
+
+    Applies NFKD normalization, strips accents, casefolds and removes
+    whitespace and punctuation, so 'Ésaïe', 'ESAIE' and a decomposed (NFD)
+    'Ésaïe' all fold to 'esaie'.
 
     Args:
-        display_name: The display name to search for
-        language: 'english' or 'french'
+        text: The name to fold
 
     Returns:
-        Book data dictionary or None if not found
+        The folded lookup key
     """
-    books = get_english_bible_books() if language.lower() == 'english' else get_french_bible_books()
+    decomposed = unicodedata.normalize('NFKD', text)
+    return ''.join(char for char in decomposed.casefold()
+                   if char.isalnum() and not unicodedata.combining(char))
 
-    # Normalize the input for comparison
-    normalized_input = display_name.lower().replace(' ', '_')
+class BookIndex:
+    """
+    Build-once lookup tables for one language's Bible book catalog.
 
-    # Direct lookup
-    if normalized_input in books:
-        return books[normalized_input]
+    The catalog is materialized a single time as a tuple of BookRecords
+    ordered by book number, and every name a book can be looked up by
+    (normalized key, display name, alternate names) is folded with
+    fold_name and stored in a hash map, so an accent- and case-insensitive
+    lookup is a single dictionary probe.
+    """
 
-    # Search by display name
-    for book_key, book_data in books.items():
-        if book_data["display_name"].lower() == display_name.lower():
-            return book_data
+    def __init__(self, language: str, records: Tuple[BookRecord, ...], aliases: Optional[Dict[str, int]] = None):
+        self.language = language
+        self.records = tuple(sorted(records, key=lambda record: record.book_number))
+        self.books: Mapping[str, BookRecord] = MappingProxyType({record.key: record for record in self.records})
+        self.by_number: Dict[int, BookRecord] = {record.book_number: record for record in self.records}
+        self._by_folded: Dict[str, BookRecord] = {}
+
+        # Keys and display names take precedence over alternate names
+        for record in self.records:
+            self._by_folded.setdefault(fold_name(record.key), record)
+            self._by_folded.setdefault(fold_name(record.display_name), record)
+        for record in self.records:
+            for alt_name in record.alternate_names:
+                self._by_folded.setdefault(fold_name(alt_name), record)
+        self._canonical_count = len(self._by_folded)
+
+        # Compiled aliases ('1Sam', 'First Kings', 'Mt') are the lowest priority
+        if aliases is None:
+            from alias_compiler import compile_aliases
+            aliases = compile_aliases(self.records, language)
+        for folded, book_number in aliases.items():
+            if book_number in self.by_number:
+                self._by_folded.setdefault(folded, self.by_number[book_number])
+
+        self._selection = self._build_selection_tables()
+        self._resolver: Optional[GuessResolver[BookRecord]] = None
+        self._suggester: Optional[PrefixSuggester[BookRecord]] = None
+
+    def _build_selection_tables(self) -> Dict[Tuple[str, str], Tuple[str, ...]]:
+        """
+        Precompute the display names for every (testament, category) filter.
+
+        Keys are the filter strings callers pass in ('any', the language's
+        testament names and aliases such as 'old' or 'ancien', and its
+        category keys); combinations that match no books are left out.
+        """
+        spec = get_language(self.language)
+        testament_filters: Dict[str, Optional[Testament]] = {'any': None}
+        testament_filters.update(spec.testament_filters)
+
+        category_filters: Dict[str, Optional[Category]] = {'any': None}
+        for category in Category:
+            category_filters[spec.category_keys[category]] = category
+
+        tables = {}
+        for testament_key, testament in testament_filters.items():
+            for category_key, category in category_filters.items():
+                names = tuple(
+                    record.display_name for record in self.records
+                    if (testament is None or record.testament is testament)
+                    and (category is None or record.category is category)
+                )
+                if names:
+                    tables[(testament_key, category_key)] = names
+        return tables
+
+    @classmethod
+    def from_catalog(cls, books: Dict[str, Dict[str, Any]], language: str) -> 'BookIndex':
+        """Build an index from one of the catalog dictionaries"""
+        return cls(language, tuple(BookRecord.from_dict(key, book_data, language) for key, book_data in books.items()))
+
+    def lookup(self, name: str) -> Optional[BookRecord]:
+        """
+        Find a book by normalized key, display name or alternate name.
+
+        Matching ignores case, accents, whitespace and punctuation, so
+        'Levitique' and a decomposed (NFD) 'Lévitique' both find 'Lévitique'.
+
+        Args:
+            name: The name to search for
+
+        Returns:
+            BookRecord or None if not found
+        """
+        return self._by_folded.get(fold_name(name))
+
+    def lookup_folded(self, folded: str) -> Optional[BookRecord]:
+        """Find a book by a name that has already been passed through fold_name"""
+        return self._by_folded.get(folded)
+
+    def folded_names(self) -> ItemsView[str, BookRecord]:
+        """Every folded name a book can be looked up by, with its BookRecord"""
+        return self._by_folded.items()
+
+    def resolve(self, guess: str, max_distance: Optional[int] = None) -> Optional[Tuple[BookRecord, int]]:
+        """
+        Resolve a possibly misspelled guess to the closest book.
+
+        Args:
+            guess: The name to resolve
+            max_distance: Largest edit distance to accept (defaults to the resolver's budget)
+
+        Returns:
+            Tuple of (BookRecord, edit distance), or None if no book is close enough
+        """
+        folded = fold_name(guess)
+        record = self._by_folded.get(folded)
+        if record is not None:
+            return record, 0
+
+        if self._resolver is None:
+            # Built on first use over the canonical names and the longer aliases;
+            # typo matching against two-letter abbreviations would only add noise
+            names = list(self._by_folded.items())
+            names = names[:self._canonical_count] + [
+                (folded, record) for folded, record in names[self._canonical_count:] if len(folded) >= 5
+            ]
+            self._resolver = GuessResolver(names)
+        return self._resolver.resolve(folded, max_distance)
+
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> Tuple[BookRecord, ...]:
+        """
+        Complete a partially typed book name.
+
+        Args:
+            prefix: What the player has typed so far (accents, case and spacing are ignored)
+            limit: Number of suggestions to return (defaults to MAX_SUGGESTIONS)
+
+        Returns:
+            Tuple of BookRecords, best match first
+        """
+        if self._suggester is None:
+            # Built on first use; canonical names rank ahead of aliases
+            self._suggester = PrefixSuggester(
+                (folded, record, 0 if i < self._canonical_count else 1)
+                for i, (folded, record) in enumerate(self._by_folded.items())
+            )
+        return self._suggester.suggest(fold_name(prefix), limit)
+
+    def selection_table(self, testament: str = 'any', category: str = 'any') -> Optional[Tuple[str, ...]]:
+        """
+        Get the precomputed display names matching a testament and category filter.
+
+        Args:
+            testament: 'old'/'ancien', 'new'/'nouveau', or 'any'
+            category: Category key in this index's language, or 'any'
+
+        Returns:
+            Tuple of display names in book order, or None for unknown or empty filters
+        """
+        return self._selection.get((testament.lower(), category.lower()))
+
+    def by_testament(self, testament: Testament) -> Tuple[BookRecord, ...]:
+        """Return the records of one testament in book order"""
+        return tuple(record for record in self.records if record.testament is testament)
+
+# Indexes are built lazily on first use and shared for the life of the process
+_BOOK_INDEXES: Dict[str, BookIndex] = {}
+
+def get_book_index(language: str) -> BookIndex:
+    """
+    Get the shared lookup index for a language, building it on first use.
 
-        # Check alternate names if they exist
-        if "alternate_names" in book_data:
-            for alt_name in book_data["alternate_names"]:
-                if alt_name.lower() == display_name.lower():
-                    return book_data
+    Args:
+        language: Language name (e.g. 'english' or 'french')
 
-    return None
+    Returns:
+        The BookIndex for the language
 
-def get_books_by_testament(testament: str, language: str) -> Dict[str, Dict[str, Any]]:
+    Raises:
+        ValueError: If the language is not supported
     """
-    Get all books from a specific testament.
+    language = language.lower()
+    index = _BOOK_INDEXES.get(language)
+    if index is None:
+        spec = get_language(language)
+        # Prefer the precompiled catalog file, falling back to the language data file
+        from compiled_catalog import load_compiled_records
+        compiled = load_compiled_records(spec.name)
+        if compiled is not None:
+            index = BookIndex(spec.name, *compiled)
+        else:
+            index = BookIndex.from_catalog(spec.books, spec.name)
+        index = _BOOK_INDEXES.setdefault(language, index)
+    return index
+
+# Built once from every language's index and shared by all callers
+_CROSS_REFERENCE: Dict[int, Dict[str, BookRecord]] = {}
+
+def get_cross_reference() -> Dict[int, Dict[str, BookRecord]]:
+    """
+    Get the table linking each book across languages, building it on first use.
+
+    Books are matched by book_number, which every language shares.
+
+    Returns:
+        Dictionary of book number to {language: BookRecord}
+    """
+    if not _CROSS_REFERENCE:
+        table: Dict[int, Dict[str, BookRecord]] = {}
+        for language in available_languages():
+            for record in get_book_index(language).records:
+                table.setdefault(record.book_number, {})[language] = record
+        _CROSS_REFERENCE.update(table)
+    return _CROSS_REFERENCE
+
+def parse_testament(testament: str, language: str) -> Testament:
+    """
+    Map a testament filter to a Testament.
 
     Args:
-        testament: 'old'/'ancien' or 'new'/'nouveau'
+        testament: 'old'/'new', or the language's own name for a testament ('ancien'/'nouveau')
+        language: Language name
+
+    Returns:
+        Testament.OLD for an old testament filter, Testament.NEW otherwise
+    """
+    return get_language(language).testament_filters.get(testament.lower(), Testament.NEW)
+
+def get_book_by_display_name(display_name: str, language: str) -> Optional[BookRecord]:
+    """
+    Find a Bible book by its display name.
+
+    Args:
+        display_name: The display name to search for
         language: 'english' or 'french'
 
     Returns:
-        Dictionary of books from the specified testament
+        BookRecord or None if not found
+    """
+    return get_book_index(language).lookup(display_name)
+
+def get_books_by_testament(testament: str, language: str) -> Dict[str, BookRecord]:
     """
-    books = get_english_bible_books() if language.lower() == 'english' else get_french_bible_books()
+    Get all books from a specific testament.
 
-    # Normalize testament names
-    if language.lower() == 'english':
-        target_testament = 'old' if testament.lower() in ['old', 'ancien'] else 'new'
-    else:
-        target_testament = 'ancien' if testament.lower() in ['old', 'ancien'] else 'nouveau'
+    Args:
+        testament: 'old'/'ancien' or 'new'/'nouveau'
+        language: 'english' or 'french'
 
-    return {key: data for key, data in books.items() if data['testament'] == target_testament}
+    Returns:
+        Dictionary of book records from the specified testament, keyed by normalized name
+    """
+    records = get_book_index(language).by_testament(parse_testament(testament, language))
+    return {record.key: record for record in records}
 
 if __name__ == "__main__":
     # Test the data structure
@@ -974,7 +466,7 @@ if __name__ == "__main__":
     print(f"French Bible books loaded: {len(french_books)}")
 
     # Test a few lookups
-    print(f"\nGenesis data: {english_books['genesis']}")
-    print(f"Genèse data: {french_books['genese']}")
-    print(f"1 Samuel data: {english_books['1_samuel']}")
-    print(f"1 Corinthiens data: {french_books['1_corinthiens']}")
\ No newline at end of file
+    print(f"\nGenesis data: {english_books['genesis'].as_dict()}")
+    print(f"Genèse data: {french_books['genese'].as_dict()}")
+    print(f"1 Samuel data: {english_books['1_samuel'].as_dict()}")
+    print(f"1 Corinthiens data: {french_books['1_corinthiens'].as_dict()}")
\ No newline at end of file
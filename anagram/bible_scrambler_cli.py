@@ -2,15 +2,26 @@
 """
 Command Line Interface for the Bible Book Scrambler
 Usage:
-  python3 bible_scrambler_cli.py generate [book_name] [language]
-  python3 bible_scrambler_cli.py random [language] [testament]
+  python3 bible_scrambler_cli.py generate [book_name] [language] [difficulty]
+  python3 bible_scrambler_cli.py random [language] [testament] [difficulty]
+  python3 bible_scrambler_cli.py puzzle [puzzle_id]
+  python3 bible_scrambler_cli.py daily [language] [difficulty]
   python3 bible_scrambler_cli.py solve [scrambled] [guess] [language]
+  python3 bible_scrambler_cli.py solve [scrambled] [language]
   python3 bible_scrambler_cli.py hint [book_name] [language]
   python3 bible_scrambler_cli.py list [language]
+  python3 bible_scrambler_cli.py suggest [prefix] [language]
+  python3 bible_scrambler_cli.py bulk [language] [count] [options]
 """
 
+import argparse
 import sys
 from bible_book_scrambler import BibleBookScrambler
+from daily_puzzle import DailyPuzzles
+from bulk_generator import FORMATS, BulkReport, generate_bulk, write_puzzles
+from bible_books_data import Testament
+from language_registry import available_languages, get_language, is_supported_language, language_error_message
+from scramble_scoring import DIFFICULTIES
 
 def print_usage():
     """Print usage instructions"""
@@ -20,16 +31,29 @@ def print_usage():
     print("  Generate scramble from book name:")
     print("    python3 bible_scrambler_cli.py generate \"Genesis\" english")
     print("    python3 bible_scrambler_cli.py generate \"Lévitique\" french")
+    print("    python3 bible_scrambler_cli.py generate \"Deuteronomy\" english hard")
     print()
     print("  Random scramble challenge:")
     print("    python3 bible_scrambler_cli.py random english")
     print("    python3 bible_scrambler_cli.py random french old")
     print("    python3 bible_scrambler_cli.py random english new")
+    print("    python3 bible_scrambler_cli.py random french any easy")
+    print()
+    print("  Replay a puzzle from its ID:")
+    print("    python3 bible_scrambler_cli.py puzzle english-1-2a")
+    print()
+    print("  Puzzle of the day (same on every machine):")
+    print("    python3 bible_scrambler_cli.py daily english")
+    print("    python3 bible_scrambler_cli.py daily french hard")
     print()
     print("  Check solution:")
     print("    python3 bible_scrambler_cli.py solve \"sneeGi\" \"Genesis\" english")
     print("    python3 bible_scrambler_cli.py solve \"éqLiutive\" \"Lévitique\" french")
     print()
+    print("  Find the book a scramble came from:")
+    print("    python3 bible_scrambler_cli.py solve \"sneeGsi\" english")
+    print("    python3 bible_scrambler_cli.py solve \"1 tnhiCorsnai\" any")
+    print()
     print("  Get hint for a book:")
     print("    python3 bible_scrambler_cli.py hint \"Genesis\" english")
     print("    python3 bible_scrambler_cli.py hint \"Matthieu\" french")
@@ -38,12 +62,21 @@ def print_usage():
     print("    python3 bible_scrambler_cli.py list english")
     print("    python3 bible_scrambler_cli.py list french")
     print()
-    print("Languages: english, french")
+    print("  Suggest book names for a partial guess:")
+    print("    python3 bible_scrambler_cli.py suggest \"Jo\" english")
+    print("    python3 bible_scrambler_cli.py suggest \"1 Co\" french")
+    print()
+    print("  Generate puzzles in bulk (JSONL or CSV):")
+    print("    python3 bible_scrambler_cli.py bulk english 100000 --difficulty hard --seed 7 --output pack.jsonl")
+    print("    python3 bible_scrambler_cli.py bulk french 5000 --testament nouveau --format csv --workers 4")
+    print()
+    print(f"Languages: {', '.join(available_languages())}")
     print("Testaments: old, new (optional for random mode)")
+    print(f"Difficulties: {', '.join(DIFFICULTIES)} (optional, default medium)")
 
 def validate_language(language: str) -> bool:
     """Validate language parameter"""
-    return language.lower() in ['english', 'french']
+    return is_supported_language(language)
 
 def main():
     if len(sys.argv) < 2:
@@ -56,19 +89,20 @@ def main():
     try:
         if command == "generate":
             # Generate scramble from book name
-            if len(sys.argv) != 4:
+            if len(sys.argv) not in [4, 5]:
                 print("Error: Generate mode requires book name and language")
-                print("Usage: python3 bible_scrambler_cli.py generate \"[book_name]\" [language]")
+                print("Usage: python3 bible_scrambler_cli.py generate \"[book_name]\" [language] [difficulty]")
                 return
 
             book_name = sys.argv[2]
             language = sys.argv[3].lower()
+            difficulty = sys.argv[4].lower() if len(sys.argv) > 4 else 'medium'
 
             if not validate_language(language):
-                print("Error: Language must be 'english' or 'french'")
+                print(f"Error: {language_error_message()}")
                 return
 
-            scrambled = scrambler.generate_scramble(book_name, language)
+            scrambled = scrambler.generate_scramble(book_name, language, difficulty)
             hint = scrambler.get_hint(book_name, language)
 
             print(f"Original: {book_name}")
@@ -79,36 +113,94 @@ def main():
             # Random scramble challenge
             if len(sys.argv) < 3:
                 print("Error: Random mode requires language")
-                print("Usage: python3 bible_scrambler_cli.py random [language] [testament]")
+                print("Usage: python3 bible_scrambler_cli.py random [language] [testament] [difficulty]")
                 return
 
             language = sys.argv[2].lower()
             testament = sys.argv[3].lower() if len(sys.argv) > 3 else 'any'
+            difficulty = sys.argv[4].lower() if len(sys.argv) > 4 else 'medium'
 
             if not validate_language(language):
-                print("Error: Language must be 'english' or 'french'")
+                print(f"Error: {language_error_message()}")
                 return
 
-            if testament not in ['any', 'old', 'new', 'ancien', 'nouveau']:
+            if testament != 'any' and testament not in get_language(language).testament_filters:
                 print("Error: Testament must be 'old', 'new', or omitted for 'any'")
                 return
 
-            random_book = scrambler.get_random_book(language, testament)
-            scrambled = scrambler.generate_scramble(random_book, language)
-            hint = scrambler.get_hint(random_book, language)
+            puzzle = scrambler.create_puzzle(language, testament, difficulty=difficulty)
 
             print("=== Random Bible Book Scramble Challenge ===")
-            print(f"Scrambled: {scrambled}")
-            print(f"Hint: {hint}")
+            print(f"Scrambled: {puzzle['scrambled']}")
+            print(f"Hint: {puzzle['hint']}")
+            print(f"Puzzle ID: {puzzle['puzzle_id']}")
             print()
             print("Can you guess which Bible book this is?")
-            print(f"(Answer: {random_book})")
+            print(f"(Answer: {puzzle['original']})")
+
+        elif command == "puzzle":
+            # Regenerate a puzzle from its ID
+            if len(sys.argv) != 3:
+                print("Error: Puzzle mode requires a puzzle ID")
+                print("Usage: python3 bible_scrambler_cli.py puzzle [puzzle_id]")
+                return
+
+            puzzle = scrambler.get_puzzle(sys.argv[2])
+
+            print(f"Puzzle ID: {puzzle['puzzle_id']}")
+            print(f"Scrambled: {puzzle['scrambled']}")
+            print(f"Hint: {puzzle['hint']}")
+            print()
+            print(f"(Answer: {puzzle['original']})")
+
+        elif command == "daily":
+            # Puzzle of the day
+            if len(sys.argv) not in [3, 4]:
+                print("Error: Daily mode requires language")
+                print("Usage: python3 bible_scrambler_cli.py daily [language] [difficulty]")
+                return
+
+            language = sys.argv[2].lower()
+            difficulty = sys.argv[3].lower() if len(sys.argv) > 3 else 'medium'
+
+            if not validate_language(language):
+                print(f"Error: {language_error_message()}")
+                return
+
+            puzzle = DailyPuzzles.from_environment(scrambler).get(language, difficulty)
+
+            print(f"=== Bible Book Scramble of the Day ({puzzle['date']}) ===")
+            print(f"Scrambled: {puzzle['scrambled']}")
+            print(f"Hint: {puzzle['hint']}")
+            print(f"Puzzle ID: {puzzle['puzzle_id']}")
+            print()
+            print(f"(Answer: {puzzle['original']})")
+
+        elif command == "solve" and len(sys.argv) == 4:
+            # Find the book a scramble came from
+            scrambled = sys.argv[2]
+            language = sys.argv[3].lower()
+
+            if language != 'any' and not validate_language(language):
+                print(f"Error: {language_error_message()}")
+                return
+
+            solutions = scrambler.solve(scrambled, None if language == 'any' else language)
+            if not solutions:
+                print(f"No Bible book matches '{scrambled}'")
+                return
+
+            print(f"Scrambled: {scrambled}")
+            for solution in solutions:
+                note = "" if solution['distance'] == 0 else f" ({solution['distance']} letter(s) off)"
+                print(f"  {solution['book']} [{solution['language']}, book #{solution['book_number']}]{note}")
 
         elif command == "solve":
             # Check solution
             if len(sys.argv) != 5:
-                print("Error: Solve mode requires scrambled text, guess, and language")
+                print("Error: Solve mode requires scrambled text and language, optionally with a guess")
                 print("Usage: python3 bible_scrambler_cli.py solve \"[scrambled]\" \"[guess]\" [language]")
+                print("       python3 bible_scrambler_cli.py solve \"[scrambled]\" [language]")
                 return
 
             scrambled = sys.argv[2]
@@ -116,7 +208,7 @@ def main():
             language = sys.argv[4].lower()
 
             if not validate_language(language):
-                print("Error: Language must be 'english' or 'french'")
+                print(f"Error: {language_error_message()}")
                 return
 
             is_valid = scrambler.check_solution(scrambled, guess, language)
@@ -136,7 +228,7 @@ def main():
             language = sys.argv[3].lower()
 
             if not validate_language(language):
-                print("Error: Language must be 'english' or 'french'")
+                print(f"Error: {language_error_message()}")
                 return
 
             hint = scrambler.get_hint(book_name, language)
@@ -153,7 +245,7 @@ def main():
             language = sys.argv[2].lower()
 
             if not validate_language(language):
-                print("Error: Language must be 'english' or 'french'")
+                print(f"Error: {language_error_message()}")
                 return
 
             books = scrambler.get_all_books_list(language)
@@ -161,34 +253,80 @@ def main():
             print("-" * 40)
 
             # Group by testament for better readability
-            if language == 'english':
-                english_books = scrambler.english_books
-                old_testament = [book['display_name'] for book in english_books.values() if book['testament'] == 'old']
-                new_testament = [book['display_name'] for book in english_books.values() if book['testament'] == 'new']
-
-                print("OLD TESTAMENT (39 books):")
-                for i, book in enumerate(sorted(old_testament, key=lambda x: next(data['book_number'] for data in english_books.values() if data['display_name'] == x)), 1):
-                    print(f"  {i:2d}. {book}")
-
-                print("\nNEW TESTAMENT (27 books):")
-                for i, book in enumerate(sorted(new_testament, key=lambda x: next(data['book_number'] for data in english_books.values() if data['display_name'] == x)), 1):
-                    print(f"  {i:2d}. {book}")
-            else:
-                french_books = scrambler.french_books
-                ancien_testament = [book['display_name'] for book in french_books.values() if book['testament'] == 'ancien']
-                nouveau_testament = [book['display_name'] for book in french_books.values() if book['testament'] == 'nouveau']
+            records = scrambler.get_book_records(language)
+            old_testament = [book.display_name for book in records if book.testament is Testament.OLD]
+            new_testament = [book.display_name for book in records if book.testament is Testament.NEW]
+
+            spec = get_language(language)
+            old_heading = f"{spec.testament_names[Testament.OLD].upper()} ({len(old_testament)} {spec.books_label}):"
+            new_heading = f"{spec.testament_names[Testament.NEW].upper()} ({len(new_testament)} {spec.books_label}):"
+
+            print(old_heading)
+            for i, book in enumerate(old_testament, 1):
+                print(f"  {i:2d}. {book}")
 
-                print("ANCIEN TESTAMENT (39 livres):")
-                for i, book in enumerate(sorted(ancien_testament, key=lambda x: next(data['book_number'] for data in french_books.values() if data['display_name'] == x)), 1):
-                    print(f"  {i:2d}. {book}")
+            print(f"\n{new_heading}")
+            for i, book in enumerate(new_testament, 1):
+                print(f"  {i:2d}. {book}")
+
+        elif command == "suggest":
+            # Autocomplete a partial book name
+            if len(sys.argv) != 4:
+                print("Error: Suggest mode requires a prefix and language")
+                print("Usage: python3 bible_scrambler_cli.py suggest \"[prefix]\" [language]")
+                return
+
+            prefix = sys.argv[2]
+            language = sys.argv[3].lower()
+
+            if not validate_language(language):
+                print(f"Error: {language_error_message()}")
+                return
+
+            suggestions = scrambler.suggest_books(prefix, language)
+            if not suggestions:
+                print(f"No books start with '{prefix}'")
+                return
+
+            print(f"Books starting with '{prefix}':")
+            for i, book in enumerate(suggestions, 1):
+                print(f"  {i:2d}. {book}")
+
+        elif command == "bulk":
+            # Generate many puzzles across worker processes
+            parser = argparse.ArgumentParser(prog="bible_scrambler_cli.py bulk",
+                                             description="Generate puzzles in bulk")
+            parser.add_argument('language')
+            parser.add_argument('count', type=int)
+            parser.add_argument('--testament', default='any')
+            parser.add_argument('--category', default='any')
+            parser.add_argument('--difficulty', default='medium', choices=DIFFICULTIES)
+            parser.add_argument('--seed', type=int, default=0, help="master seed (same seed, same puzzles)")
+            parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+            parser.add_argument('--format', default='jsonl', choices=FORMATS)
+            parser.add_argument('--output', default=None, help="output file (default: standard output)")
+            args = parser.parse_args(sys.argv[2:])
+
+            language = args.language.lower()
+            if not validate_language(language):
+                print(f"Error: {language_error_message()}")
+                return
+
+            report = BulkReport()
+            puzzles = generate_bulk(language, args.count, args.testament, args.category, args.difficulty,
+                                    master_seed=args.seed, workers=args.workers, report=report)
+            if args.output:
+                with open(args.output, 'w', encoding='utf-8', newline='') as output:
+                    write_puzzles(puzzles, output, args.format)
+            else:
+                write_puzzles(puzzles, sys.stdout, args.format)
 
-                print("\nNOUVEAU TESTAMENT (27 livres):")
-                for i, book in enumerate(sorted(nouveau_testament, key=lambda x: next(data['book_number'] for data in french_books.values() if data['display_name'] == x)), 1):
-                    print(f"  {i:2d}. {book}")
+            # The report goes to stderr so it never mixes with streamed puzzles
+            print(report, file=sys.stderr)
 
         else:
             print(f"Error: Unknown command '{command}'")
-            print("Available commands: generate, random, solve, hint, list")
+            print("Available commands: generate, random, puzzle, daily, solve, hint, list, suggest, bulk")
             print("Use 'python3 bible_scrambler_cli.py' without arguments to see usage.")
 
     except ValueError as e:
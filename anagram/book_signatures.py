@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Book Name Signatures
+Indexes every name in the catalog, across all languages, by its letter
+multiset so scrambles can be checked against the whole catalog in O(1).
+
+A signature is the sorted characters of the folded name (accents, case,
+spaces and punctuation removed). Digits are kept, because scrambles leave
+them in place: '1 John' and '2 John' are never anagrams of each other.
+Spaces are dropped on purpose. Scrambles keep them in place too, but
+players type them freely ('1John', 'Song of songs'). Names are looked up
+by the same space-free folded keys everywhere else. And no two books'
+names differ only in their spacing, so counting spaces would only
+reject input that is correct.
+
+The index answers two questions:
+
+- does a scramble spell a valid name or alias outright (a degenerate
+  scramble that must be redrawn)
+- which books can the scrambled letters spell (more than one makes the
+  puzzle ambiguous, and each of them is a correct answer)
+
+Noisy input (a missing, extra or mistyped letter) is matched by multiset
+distance: the number of characters that would have to be added or removed
+to turn one signature into the other.
+
+Solving a scramble uses a separate index without the short compiled
+aliases (see get_solver_index), since two- and three-letter abbreviations
+are within a letter or two of almost any short input.
+
+Indexes are built per language, so scrambling and checking puzzles in one
+language never loads the others. The catalog-wide index, over every
+language, is only built for callers that ask for it (solving a scramble
+of unknown language, bilingual answers).
+"""
+
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from bible_books_data import BookRecord, fold_name, get_book_index
+from language_registry import available_languages, get_language
+
+def name_signature(text: str) -> str:
+    """
+    Compute the letter multiset signature of a name.
+
+    Args:
+        text: A book name or scramble
+
+    Returns:
+        The folded characters in sorted order ('Ruth' -> 'hrtu')
+    """
+    return ''.join(sorted(fold_name(text)))
+
+def multiset_distance(a: str, b: str, limit: int) -> int:
+    """
+    Count the characters to add or remove to turn one signature into another.
+
+    Args:
+        a: A signature (sorted characters)
+        b: Another signature
+        limit: Distance past which to stop counting
+
+    Returns:
+        The distance, or limit + 1 once it exceeds limit
+    """
+    i = j = distance = 0
+    while i < len(a) and j < len(b):
+        if a[i] == b[j]:
+            i += 1
+            j += 1
+            continue
+        distance += 1
+        if distance > limit:
+            return distance
+        if a[i] < b[j]:
+            i += 1
+        else:
+            j += 1
+    return min(distance + len(a) - i + len(b) - j, limit + 1)
+
+class SignatureIndex:
+    """
+    Build-once signature lookup over a set of folded names.
+
+    Each signature maps to the books any of its names belongs to, kept
+    once per (language, book number) in catalog order.
+    """
+
+    def __init__(self, names: Iterable[Tuple[str, BookRecord]]):
+        self._names: Set[str] = set()
+        self._by_signature: Dict[str, List[BookRecord]] = {}
+        seen: Set[Tuple[str, str, int]] = set()
+
+        for folded, record in names:
+            self._names.add(folded)
+            signature = ''.join(sorted(folded))
+            key = (signature, record.language, record.book_number)
+            if key not in seen:
+                seen.add(key)
+                self._by_signature.setdefault(signature, []).append(record)
+
+        # Signatures grouped by length, built on the first noisy match
+        self._by_length: Optional[Dict[int, List[str]]] = None
+
+    def is_name(self, text: str) -> bool:
+        """Check whether text spells a book name or alias in any language"""
+        return fold_name(text) in self._names
+
+    def books_spelled_by(self, text: str) -> Tuple[BookRecord, ...]:
+        """
+        Find every book with a name made of exactly the letters of text.
+
+        Args:
+            text: A book name or scramble
+
+        Returns:
+            Tuple of BookRecords, at most one per language and book
+        """
+        return tuple(self._by_signature.get(name_signature(text), ()))
+
+    def match(self, text: str, max_distance: int = 0) -> List[Tuple[BookRecord, int]]:
+        """
+        Find the books a scramble came from, tolerating a few wrong letters.
+
+        Exact signature matches are a single probe and are returned alone when
+        there are any; otherwise every signature within max_distance is scanned.
+
+        Args:
+            text: A scramble, possibly partial or mistyped
+            max_distance: Largest multiset distance to accept (capped at a third
+                of the scramble's length so short inputs do not match everything)
+
+        Returns:
+            List of (BookRecord, distance) pairs, closest first
+        """
+        signature = name_signature(text)
+        exact = self._by_signature.get(signature)
+        limit = min(max_distance, len(signature) // 3)
+        if exact or limit <= 0:
+            return [(record, 0) for record in exact or ()]
+
+        if self._by_length is None:
+            by_length: Dict[int, List[str]] = {}
+            for candidate in self._by_signature:
+                by_length.setdefault(len(candidate), []).append(candidate)
+            self._by_length = by_length
+
+        matches = []
+        for length in range(len(signature) - limit, len(signature) + limit + 1):
+            for candidate in self._by_length.get(length, ()):
+                distance = multiset_distance(signature, candidate, limit)
+                if distance <= limit:
+                    matches.extend((record, distance) for record in self._by_signature[candidate])
+        matches.sort(key=lambda match: match[1])
+        return matches
+
+    def spells(self, text: str, guess: str) -> bool:
+        """
+        Check whether a guess is a book name or alias that uses exactly the letters of text.
+
+        Args:
+            text: The scramble
+            guess: The name to check
+
+        Returns:
+            True if guess is a valid name and an anagram of text
+        """
+        folded = fold_name(guess)
+        return folded in self._names and ''.join(sorted(folded)) == name_signature(text)
+
+    def __len__(self) -> int:
+        return len(self._by_signature)
+
+# Compiled aliases shorter than this (folded) are left out of the solver index:
+# abbreviations like 'Ac' or 'Gn' are within a letter or two of almost any short input
+MIN_SOLVER_ALIAS_LENGTH = 5
+
+# Built on first use per (language, '' for the whole catalog; solver) and shared by all callers
+_SIGNATURE_INDEXES: Dict[Tuple[str, bool], SignatureIndex] = {}
+
+def _full_names(record: BookRecord) -> Set[str]:
+    """Get the folded key, display name and alternate names of a book"""
+    return {fold_name(name) for name in (record.key, record.display_name, *record.alternate_names)}
+
+def _get_index(language: Optional[str], solver: bool) -> SignatureIndex:
+    """Get a shared signature index, building it on first use"""
+    key = (get_language(language).name if language is not None else '', solver)
+    index = _SIGNATURE_INDEXES.get(key)
+    if index is None:
+        languages = [key[0]] if key[0] else available_languages()
+        names = [(folded, record) for name in languages for folded, record in get_book_index(name).folded_names()
+                 if not solver or len(folded) >= MIN_SOLVER_ALIAS_LENGTH or folded in _full_names(record)]
+        index = _SIGNATURE_INDEXES.setdefault(key, SignatureIndex(names))
+    return index
+
+def get_signature_index(language: Optional[str] = None) -> SignatureIndex:
+    """
+    Get the signature index of one language or of the whole catalog, building it on first use.
+
+    Args:
+        language: Language name, or None for every language (loads them all)
+
+    Returns:
+        SignatureIndex over the names and aliases of the language, or of every language
+
+    Raises:
+        ValueError: If the language is not supported
+    """
+    return _get_index(language, False)
+
+def get_solver_index(language: Optional[str] = None) -> SignatureIndex:
+    """
+    Get the index scrambles are solved against, building it on first use.
+
+    Only full names (keys, display names, alternate names) and compiled
+    aliases of at least MIN_SOLVER_ALIAS_LENGTH characters are included,
+    so short inputs are not matched to abbreviations.
+
+    Args:
+        language: Language name, or None for every language (loads them all)
+
+    Returns:
+        SignatureIndex over the full names and long aliases
+
+    Raises:
+        ValueError: If the language is not supported
+    """
+    return _get_index(language, True)
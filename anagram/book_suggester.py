@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Book Name Suggester
+Prefix completion for Bible book names, used to autocomplete guesses as
+players type. Every prefix of every name is a node of a flattened trie
+holding its precomputed best completions, so a keystroke costs one
+dictionary probe no matter how many names share the prefix.
+"""
+
+from typing import Dict, Generic, Iterable, Optional, Tuple, TypeVar
+
+# Most completions kept per prefix
+MAX_SUGGESTIONS = 10
+
+T = TypeVar('T')
+
+class PrefixSuggester(Generic[T]):
+    """
+    Flattened prefix trie mapping normalized prefixes to ranked entries.
+
+    Names are registered with a tier (0 for canonical names, higher for
+    aliases). An entry reachable through several names is listed once,
+    ranked by its best name: lower tier first, then the shortest
+    completion, then registration order.
+    """
+
+    def __init__(self, names: Iterable[Tuple[str, T, int]], limit: int = MAX_SUGGESTIONS):
+        self.limit = limit
+        candidates: Dict[str, Dict[T, Tuple[int, int, int]]] = {}
+
+        for order, (name, entry, tier) in enumerate(names):
+            rank = (tier, len(name), order)
+            for end in range(1, len(name) + 1):
+                best = candidates.setdefault(name[:end], {})
+                if entry not in best or rank < best[entry]:
+                    best[entry] = rank
+
+        self._prefixes: Dict[str, Tuple[T, ...]] = {}
+        for prefix, best in candidates.items():
+            ranked = sorted(best, key=best.__getitem__)
+            self._prefixes[prefix] = tuple(ranked[:limit])
+
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> Tuple[T, ...]:
+        """
+        Get the best completions for a normalized prefix.
+
+        Args:
+            prefix: Normalized prefix typed so far
+            limit: Number of completions to return, capped at the suggester's limit
+
+        Returns:
+            Tuple of entries, best first (empty if nothing starts with the prefix)
+        """
+        completions = self._prefixes.get(prefix, ())
+        return completions if limit is None else completions[:max(limit, 0)]
+
+    def __len__(self) -> int:
+        return len(self._prefixes)
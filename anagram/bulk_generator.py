@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Bulk Puzzle Generator
+Generates large batches of scramble puzzles for printed puzzle packs and
+cache seeding, fanning the work out over a process pool.
+
+Each puzzle's seed is derived from the master seed and the puzzle's
+position alone, so a batch is identical for a given master seed no
+matter how many workers or how large the chunks, and every puzzle can be
+replayed from its ID.
+Puzzles are streamed to JSONL or CSV in order, with only a few chunks in
+flight at a time.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, IO, Iterator, List, Optional, Tuple
+
+# Puzzles generated per worker task
+CHUNK_SIZE = 500
+
+FORMATS = ('jsonl', 'csv')
+
+CSV_FIELDS = ('puzzle_id', 'language', 'difficulty', 'original', 'scrambled', 'hint')
+
+# One scrambler per worker process, created on first use
+_SCRAMBLER = None
+
+def _get_scrambler():
+    global _SCRAMBLER
+    if _SCRAMBLER is None:
+        from bible_book_scrambler import BibleBookScrambler
+        _SCRAMBLER = BibleBookScrambler()
+    return _SCRAMBLER
+
+def puzzle_seed(master_seed: int, index: int) -> int:
+    """
+    Derive the seed of one puzzle in a batch.
+
+    Args:
+        master_seed: Seed of the whole batch
+        index: Position of the puzzle in the batch
+
+    Returns:
+        64-bit puzzle seed
+    """
+    digest = hashlib.blake2b(f"{master_seed}:{index}".encode('ascii'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big')
+
+def _generate_chunk(task: Tuple[str, str, str, str, int, int, int]) -> List[Dict[str, Any]]:
+    """Generate one chunk of puzzles (runs in a worker process)"""
+    language, testament, category, difficulty, master_seed, start, size = task
+    scrambler = _get_scrambler()
+    return [scrambler.create_puzzle(language, testament, category, seed=puzzle_seed(master_seed, index),
+                                    difficulty=difficulty)
+            for index in range(start, start + size)]
+
+class BulkReport:
+    """Throughput of a finished bulk run"""
+
+    __slots__ = ('count', 'elapsed', 'workers')
+
+    def __init__(self, count: int = 0, elapsed: float = 0.0, workers: int = 1):
+        self.count = count
+        self.elapsed = elapsed
+        self.workers = workers
+
+    @property
+    def puzzles_per_second(self) -> float:
+        return self.count / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def puzzles_per_second_per_core(self) -> float:
+        return self.puzzles_per_second / self.workers
+
+    def __str__(self) -> str:
+        return (f"{self.count} puzzles in {self.elapsed:.2f}s with {self.workers} worker(s): "
+                f"{self.puzzles_per_second:,.0f} puzzles/sec, "
+                f"{self.puzzles_per_second_per_core:,.0f} puzzles/sec per core")
+
+def generate_bulk(language: str, count: int, testament: str = 'any', category: str = 'any',
+                  difficulty: str = 'medium', master_seed: int = 0, workers: Optional[int] = None,
+                  chunk_size: int = CHUNK_SIZE, report: Optional[BulkReport] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Generate puzzles in bulk, streaming them in order as chunks complete.
+
+    Args:
+        language: Language name (e.g. 'english' or 'french')
+        count: Number of puzzles to generate
+        testament: 'old'/'ancien', 'new'/'nouveau', or 'any'
+        category: Specific category or 'any'
+        difficulty: 'easy', 'medium' or 'hard'
+        master_seed: Seed the whole batch is derived from
+        workers: Worker processes (defaults to the CPU count; 1 generates in this process)
+        chunk_size: Puzzles per worker task
+        report: Filled in with the run's throughput once the batch is exhausted
+
+    Returns:
+        Iterator over puzzle dictionaries with puzzle_id, language, difficulty,
+        original, scrambled and hint
+
+    Raises:
+        ValueError: If the count, options or filters are invalid
+    """
+    if count < 0 or chunk_size < 1:
+        raise ValueError("Count must be non-negative and chunk size positive")
+    if master_seed < 0:
+        raise ValueError("Seed must be a non-negative integer")
+    workers = max(1, workers or os.cpu_count() or 1)
+
+    # Fail fast on bad options before any worker starts
+    _get_scrambler().create_puzzle(language, testament, category, seed=master_seed, difficulty=difficulty)
+
+    tasks = [(language, testament, category, difficulty, master_seed, start, min(chunk_size, count - start))
+             for start in range(0, count, chunk_size)]
+    return _run_tasks(tasks, workers, count, report)
+
+def _run_tasks(tasks: List[Tuple[str, str, str, str, int, int, int]], workers: int, count: int,
+               report: Optional[BulkReport]) -> Iterator[Dict[str, Any]]:
+    """Run chunk tasks inline or on a process pool, yielding puzzles in order"""
+    started = time.perf_counter()
+    if workers == 1:
+        for task in tasks:
+            yield from _generate_chunk(task)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # Keep a couple of chunks per worker in flight so memory stays bounded
+            pending = []
+            task_iter = iter(tasks)
+            for task in task_iter:
+                pending.append(executor.submit(_generate_chunk, task))
+                if len(pending) >= workers * 2:
+                    break
+            while pending:
+                chunk = pending.pop(0).result()
+                next_task = next(task_iter, None)
+                if next_task is not None:
+                    pending.append(executor.submit(_generate_chunk, next_task))
+                yield from chunk
+
+    if report is not None:
+        report.count, report.elapsed, report.workers = count, time.perf_counter() - started, workers
+
+def write_puzzles(puzzles: Iterator[Dict[str, Any]], stream: IO[str], output_format: str = 'jsonl') -> int:
+    """
+    Stream puzzles to a text file as JSONL or CSV.
+
+    Args:
+        puzzles: Puzzles to write
+        stream: Open text stream
+        output_format: 'jsonl' or 'csv'
+
+    Returns:
+        Number of puzzles written
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    if output_format not in FORMATS:
+        raise ValueError("Format must be 'jsonl' or 'csv'")
+
+    if output_format == 'csv':
+        writer = csv.DictWriter(stream, fieldnames=CSV_FIELDS, extrasaction='ignore')
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        def write(puzzle: Dict[str, Any]) -> None:
+            stream.write(json.dumps(puzzle, ensure_ascii=False) + '\n')
+
+    written = 0
+    for puzzle in puzzles:
+        write(puzzle)
+        written += 1
+    return written
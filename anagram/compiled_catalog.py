@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Compiled Bible Book Catalog
+Build step and runtime reader for the precompiled binary catalog.
+
+The language data files in languages/ and the aliases derived by
+alias_compiler.py are compiled into a versioned binary file
+(bible_books.catalog). At runtime the file is memory-mapped and each
+language section is decoded only when it is first used, so CLI
+invocations and web workers skip building the catalog.
+
+Each language entry records the size and CRC-32 of the files its section
+was compiled from: the language data file, and the modules that shape
+the compiled bytes (alias_compiler.py derives the aliases,
+bible_books_data.py folds their keys and defines the records, and this
+module lays them out). A
+section whose sources changed since the last build is never served:
+loading falls back to the data file until the catalog is rebuilt.
+
+Each section also carries the language's spec metadata (testament and
+category names, hint format, alias tables: everything in the data file
+but the books), so a process served from the catalog never parses the
+data file at all. The build-time helpers (alias compiler, source digest)
+are imported only when building or checking.
+
+Usage:
+  python3 compiled_catalog.py build   # Compile the catalog from the language data files
+  python3 compiled_catalog.py check   # Verify the compiled file matches the data files
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import zlib
+from typing import Any, Dict, List, Optional, Tuple
+
+from bible_books_data import BookRecord, Category, SpecialHandling, Testament
+from language_registry import available_languages, get_language, language_path, read_spec_metadata
+
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'bible_books.catalog')
+
+MAGIC = b'BBSC'
+FORMAT_VERSION = 4
+
+# Modules whose code decides the compiled bytes: alias derivation, name folding and
+# record definitions, and the file layout
+SOURCE_MODULE_PATHS = tuple(os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+                            for name in ('alias_compiler.py', 'bible_books_data.py', 'compiled_catalog.py'))
+
+# magic, format version, language count, source digest
+_HEADER = struct.Struct('<4sHH32s')
+# language name, section offset, section length, metadata offset, metadata length,
+# source size, source CRC-32
+_LANGUAGE_ENTRY = struct.Struct('<16sIIIIII')
+# record count, string count, alternate name index count, alias count
+_SECTION_HEADER = struct.Struct('<HHHH')
+# book number, testament, category, special handling,
+# key string, display name string, first alternate name, alternate name count
+_RECORD = struct.Struct('<BBBBHHHH')
+# folded alias string, book number
+_ALIAS = struct.Struct('<HH')
+_INDEX = struct.Struct('<H')
+_OFFSET = struct.Struct('<I')
+
+def get_source_catalogs() -> Dict[str, Dict[str, Dict]]:
+    """
+    Get the source catalog dictionaries the compiled file is built from.
+
+    Returns:
+        Dictionary of language name to that language's catalog dictionary
+    """
+    return {language: get_language(language).books for language in available_languages()}
+
+def source_fingerprint(language: str) -> Tuple[int, int]:
+    """
+    Fingerprint the files a language's section is compiled from.
+
+    Reading and checksumming them is far cheaper than parsing the data file,
+    so it is done every time a section is first loaded.
+
+    Args:
+        language: Language name
+
+    Returns:
+        Tuple of (size of the language data file, CRC-32 of the source modules and the data file)
+    """
+    crc = 0
+    for path in SOURCE_MODULE_PATHS:
+        with open(path, 'rb') as module_file:
+            crc = zlib.crc32(module_file.read(), crc)
+    with open(language_path(language), 'rb') as data_file:
+        data = data_file.read()
+    return len(data), zlib.crc32(data, crc)
+
+def _source_records(books: Dict[str, Dict], language: str) -> List[BookRecord]:
+    """Convert one source catalog dictionary into records in book order"""
+    records = [BookRecord.from_dict(key, book_data, language) for key, book_data in books.items()]
+    records.sort(key=lambda record: record.book_number)
+    return records
+
+def source_digest(catalogs: Dict[str, Dict[str, Dict]]) -> bytes:
+    """
+    Compute a digest of the source catalogs, their aliases and the file format version.
+
+    Args:
+        catalogs: Dictionary of language name to catalog dictionary
+
+    Returns:
+        SHA-256 digest identifying the source the file was compiled from
+    """
+    import hashlib
+    from alias_compiler import compile_aliases
+
+    aliases = {language: compile_aliases(_source_records(books, language), language)
+               for language, books in catalogs.items()}
+    canonical = json.dumps({'catalogs': catalogs, 'aliases': aliases}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(f"{FORMAT_VERSION}:{canonical}".encode('utf-8')).digest()
+
+def _encode_section(records: List[BookRecord], aliases: Dict[str, int]) -> bytes:
+    """Encode one language's records and aliases with their string table"""
+    strings: List[str] = []
+    string_ids: Dict[str, int] = {}
+
+    def intern(text: str) -> int:
+        if text not in string_ids:
+            string_ids[text] = len(strings)
+            strings.append(text)
+        return string_ids[text]
+
+    record_bytes = []
+    alternate_ids: List[int] = []
+    for record in records:
+        alternate_start = len(alternate_ids)
+        alternate_ids.extend(intern(name) for name in record.alternate_names)
+        record_bytes.append(_RECORD.pack(
+            record.book_number, record.testament, record.category, record.special_handling,
+            intern(record.key), intern(record.display_name),
+            alternate_start, len(record.alternate_names)
+        ))
+
+    alias_bytes = [_ALIAS.pack(intern(folded), book_number) for folded, book_number in aliases.items()]
+
+    encoded_strings = [text.encode('utf-8') for text in strings]
+    offsets = [0]
+    for encoded in encoded_strings:
+        offsets.append(offsets[-1] + len(encoded))
+
+    return b''.join([
+        _SECTION_HEADER.pack(len(records), len(strings), len(alternate_ids), len(alias_bytes)),
+        *record_bytes,
+        *(_INDEX.pack(index) for index in alternate_ids),
+        *alias_bytes,
+        *(_OFFSET.pack(offset) for offset in offsets),
+        *encoded_strings
+    ])
+
+def compile_catalog(catalogs: Dict[str, Dict[str, Dict]]) -> bytes:
+    """
+    Compile source catalogs into the binary catalog format.
+
+    Args:
+        catalogs: Dictionary of language name to catalog dictionary
+
+    Returns:
+        The compiled catalog file contents
+    """
+    from alias_compiler import compile_aliases
+
+    sections = []
+    for language in sorted(catalogs):
+        records = _source_records(catalogs[language], language)
+        metadata = json.dumps(read_spec_metadata(language), ensure_ascii=False, sort_keys=True).encode('utf-8')
+        sections.append((language, _encode_section(records, compile_aliases(records, language)), metadata))
+
+    offset = _HEADER.size + _LANGUAGE_ENTRY.size * len(sections)
+    table = []
+    for language, section, metadata in sections:
+        table.append(_LANGUAGE_ENTRY.pack(language.encode('utf-8'), offset, len(section),
+                                          offset + len(section), len(metadata), *source_fingerprint(language)))
+        offset += len(section) + len(metadata)
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, len(sections), source_digest(catalogs))
+    return b''.join([header, *table, *(section + metadata for _, section, metadata in sections)])
+
+class CompiledCatalog:
+    """
+    Read-only view over a memory-mapped compiled catalog file.
+
+    Only the header and language table are read when the file is opened;
+    a language's records and aliases are decoded the first time they are
+    requested.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as catalog_file:
+            self._buffer = mmap.mmap(catalog_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, language_count, digest = _HEADER.unpack_from(self._buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._buffer.close()
+            raise ValueError(f"Unsupported catalog file: {path}")
+
+        self.digest = digest
+        self._sections: Dict[str, Tuple[int, int]] = {}
+        self._metadata: Dict[str, Tuple[int, int]] = {}
+        self._fingerprints: Dict[str, Tuple[int, int]] = {}
+        for i in range(language_count):
+            name, offset, length, metadata_offset, metadata_length, size, crc = _LANGUAGE_ENTRY.unpack_from(
+                self._buffer, _HEADER.size + i * _LANGUAGE_ENTRY.size)
+            language = name.rstrip(b'\0').decode('utf-8')
+            self._sections[language] = (offset, length)
+            self._metadata[language] = (metadata_offset, metadata_length)
+            self._fingerprints[language] = (size, crc)
+        self._decoded: Dict[str, Tuple[Tuple[BookRecord, ...], Dict[str, int]]] = {}
+        self._current: Dict[str, bool] = {}
+
+    @property
+    def languages(self) -> List[str]:
+        """Languages present in the compiled file"""
+        return list(self._sections)
+
+    def is_current(self, language: str) -> bool:
+        """
+        Check that a language's sources are unchanged since the file was compiled.
+
+        Args:
+            language: Language name
+
+        Returns:
+            True if the language is compiled and its data file and the alias
+            compiler still match the recorded fingerprint
+        """
+        current = self._current.get(language)
+        if current is None:
+            try:
+                current = self._fingerprints.get(language) == source_fingerprint(language)
+            except (OSError, ValueError):
+                current = False
+            self._current[language] = current
+        return current
+
+    def section(self, language: str) -> Optional[Tuple[Tuple[BookRecord, ...], Dict[str, int]]]:
+        """
+        Get the records and aliases for a language, decoding its section on first use.
+
+        Args:
+            language: Language name
+
+        Returns:
+            Tuple of (BookRecords in book order, folded alias to book number),
+            or None if the language is not compiled
+        """
+        section = self._decoded.get(language)
+        if section is None and language in self._sections:
+            section = self._decoded.setdefault(language, self._decode_section(language))
+        return section
+
+    def spec_metadata(self, language: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a language's spec metadata (its data file without the books).
+
+        Args:
+            language: Language name
+
+        Returns:
+            The metadata dictionary, or None if the language is not compiled
+        """
+        if language not in self._metadata:
+            return None
+        offset, length = self._metadata[language]
+        return json.loads(self._buffer[offset:offset + length].decode('utf-8'))
+
+    def records(self, language: str) -> Optional[Tuple[BookRecord, ...]]:
+        """Get the records for a language, or None if the language is not compiled"""
+        section = self.section(language)
+        return section[0] if section else None
+
+    def aliases(self, language: str) -> Optional[Dict[str, int]]:
+        """Get the folded aliases for a language, or None if the language is not compiled"""
+        section = self.section(language)
+        return section[1] if section else None
+
+    def _decode_section(self, language: str) -> Tuple[Tuple[BookRecord, ...], Dict[str, int]]:
+        """Decode one language section from the mapped file"""
+        buffer = self._buffer
+        position = self._sections[language][0]
+
+        record_count, string_count, alternate_count, alias_count = _SECTION_HEADER.unpack_from(buffer, position)
+        position += _SECTION_HEADER.size
+        raw_records = [_RECORD.unpack_from(buffer, position + i * _RECORD.size) for i in range(record_count)]
+        position += _RECORD.size * record_count
+        alternate_ids = [_INDEX.unpack_from(buffer, position + i * _INDEX.size)[0] for i in range(alternate_count)]
+        position += _INDEX.size * alternate_count
+        raw_aliases = [_ALIAS.unpack_from(buffer, position + i * _ALIAS.size) for i in range(alias_count)]
+        position += _ALIAS.size * alias_count
+        offsets = [_OFFSET.unpack_from(buffer, position + i * _OFFSET.size)[0] for i in range(string_count + 1)]
+        position += _OFFSET.size * (string_count + 1)
+        strings = [buffer[position + offsets[i]:position + offsets[i + 1]].decode('utf-8') for i in range(string_count)]
+
+        records = []
+        for book_number, testament, category, special, key_id, name_id, alternate_start, alt_count in raw_records:
+            records.append(BookRecord(
+                key=strings[key_id],
+                display_name=strings[name_id],
+                testament=Testament(testament),
+                category=Category(category),
+                book_number=book_number,
+                language=language,
+                special_handling=SpecialHandling(special),
+                alternate_names=tuple(strings[alternate_ids[i]] for i in range(alternate_start, alternate_start + alt_count))
+            ))
+        aliases = {strings[string_id]: book_number for string_id, book_number in raw_aliases}
+        return tuple(records), aliases
+
+# The compiled file is opened at most once per process
+_COMPILED_CATALOG: Dict[str, Optional[CompiledCatalog]] = {}
+
+def get_compiled_catalog(path: str = CATALOG_PATH) -> Optional[CompiledCatalog]:
+    """
+    Get the shared compiled catalog, opening it on first use.
+
+    Args:
+        path: Location of the compiled catalog file
+
+    Returns:
+        The CompiledCatalog, or None if the file is missing or unreadable
+    """
+    if path not in _COMPILED_CATALOG:
+        try:
+            catalog = CompiledCatalog(path)
+        except (OSError, ValueError, struct.error):
+            catalog = None
+        _COMPILED_CATALOG[path] = catalog
+    return _COMPILED_CATALOG[path]
+
+def load_compiled_records(language: str) -> Optional[Tuple[Tuple[BookRecord, ...], Dict[str, int]]]:
+    """
+    Get a language's records and aliases from the compiled catalog if it is available.
+
+    Args:
+        language: Language name
+
+    Returns:
+        Tuple of (BookRecords, folded alias to book number), or None if no
+        compiled data exists for the language or its sources changed since
+        the catalog was built
+    """
+    catalog = get_compiled_catalog()
+    if catalog is None or not catalog.is_current(language):
+        return None
+    return catalog.section(language)
+
+def load_compiled_spec(language: str) -> Optional[Dict[str, Any]]:
+    """
+    Get a language's spec metadata from the compiled catalog if it is available.
+
+    Args:
+        language: Language name
+
+    Returns:
+        The data file's contents without the books, or None if no compiled
+        data exists for the language or its sources changed since the
+        catalog was built
+    """
+    catalog = get_compiled_catalog()
+    if catalog is None or not catalog.is_current(language):
+        return None
+    return catalog.spec_metadata(language)
+
+def check_catalog(path: str = CATALOG_PATH) -> List[str]:
+    """
+    Compare a compiled catalog file against the language data files.
+
+    Args:
+        path: Location of the compiled catalog file
+
+    Returns:
+        List of problems found (empty if the file is up to date)
+    """
+    catalogs = get_source_catalogs()
+    try:
+        catalog = CompiledCatalog(path)
+    except (OSError, ValueError, struct.error) as e:
+        return [f"Cannot read compiled catalog: {e}"]
+
+    from alias_compiler import compile_aliases
+
+    problems = []
+    if catalog.digest != source_digest(catalogs):
+        problems.append("Source digest does not match, rebuild the compiled catalog")
+    for language in catalogs:
+        if not catalog.is_current(language):
+            problems.append(f"The {language} data file or alias compiler changed, rebuild the compiled catalog")
+
+    for language, books in catalogs.items():
+        expected = _source_records(books, language)
+        compiled = catalog.records(language) or ()
+        if [r.as_dict() for r in expected] != [r.as_dict() for r in compiled] or \
+                [r.key for r in expected] != [r.key for r in compiled]:
+            problems.append(f"Compiled {language} records differ from the source")
+        if catalog.aliases(language) != compile_aliases(expected, language):
+            problems.append(f"Compiled {language} aliases differ from the source")
+        if catalog.spec_metadata(language) != read_spec_metadata(language):
+            problems.append(f"Compiled {language} metadata differs from the source")
+    return problems
+
+def build_catalog(path: str = CATALOG_PATH) -> List[str]:
+    """
+    Compile the language data files to disk and verify the result.
+
+    Args:
+        path: Location to write the compiled catalog file
+
+    Returns:
+        List of problems found when checking the written file
+    """
+    data = compile_catalog(get_source_catalogs())
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as catalog_file:
+        catalog_file.write(data)
+    os.replace(temp_path, path)
+    _COMPILED_CATALOG.pop(path, None)
+    return check_catalog(path)
+
+def main():
+    if len(sys.argv) != 2 or sys.argv[1] not in ['build', 'check']:
+        print("Usage: python3 compiled_catalog.py [build|check]")
+        return 2
+
+    if sys.argv[1] == 'build':
+        problems = build_catalog()
+        if not problems:
+            print(f"Compiled catalog written to {CATALOG_PATH}")
+    else:
+        problems = check_catalog()
+        if not problems:
+            print("Compiled catalog is up to date")
+
+    for problem in problems:
+        print(f"Error: {problem}")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Daily Puzzle
+Derives the puzzle of the day from a keyed hash of the date, language and
+difficulty, so every worker on every host serves the same puzzle without
+sharing any state.
+
+The day rolls over at midnight in a configured timezone. Each process
+computes a day's puzzles once and keeps them until the rollover. Workers
+only have to agree on the timezone and the key (DAILY_PUZZLE_TIMEZONE and
+DAILY_PUZZLE_KEY).
+"""
+
+import hashlib
+import hmac
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from language_registry import get_language
+from scramble_scoring import validate_difficulty
+
+DEFAULT_TIMEZONE = 'UTC'
+
+# Used when DAILY_PUZZLE_KEY is unset; set a secret key so days can not be precomputed
+DEFAULT_KEY = 'bible-book-scramble-daily'
+
+def daily_seed(day: date, language: str, difficulty: str, key: bytes) -> int:
+    """
+    Derive the puzzle seed of one day.
+
+    Args:
+        day: The calendar day
+        language: Language name (e.g. 'english' or 'french')
+        difficulty: 'easy', 'medium' or 'hard'
+        key: Secret shared by every worker
+
+    Returns:
+        64-bit puzzle seed
+    """
+    message = f"{day.isoformat()}:{language}:{difficulty}".encode('utf-8')
+    return int.from_bytes(hmac.new(key, message, hashlib.sha256).digest()[:8], 'big')
+
+class DailyPuzzles:
+    """
+    Puzzle of the day per language and difficulty, cached until midnight.
+    """
+
+    def __init__(self, scrambler, timezone: str = DEFAULT_TIMEZONE, key: str = DEFAULT_KEY):
+        try:
+            self.timezone = ZoneInfo(timezone)
+        except (ZoneInfoNotFoundError, ValueError):
+            raise ValueError(f"Unknown timezone: '{timezone}'") from None
+        self.scrambler = scrambler
+        self._key = key.encode('utf-8')
+
+        self._day: Optional[date] = None
+        self._cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_environment(cls, scrambler) -> 'DailyPuzzles':
+        """Create daily puzzles configured by DAILY_PUZZLE_TIMEZONE and DAILY_PUZZLE_KEY"""
+        return cls(scrambler,
+                   timezone=os.environ.get('DAILY_PUZZLE_TIMEZONE', DEFAULT_TIMEZONE),
+                   key=os.environ.get('DAILY_PUZZLE_KEY', DEFAULT_KEY))
+
+    def today(self) -> date:
+        """Get the current day in the configured timezone"""
+        return datetime.now(self.timezone).date()
+
+    def seconds_until_rollover(self) -> int:
+        """Get the number of seconds until the next day's puzzles"""
+        now = datetime.now(self.timezone)
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time(), self.timezone)
+        return max(1, int((midnight - now).total_seconds()))
+
+    def get(self, language: str, difficulty: str = 'medium', day: Optional[date] = None) -> Dict[str, Any]:
+        """
+        Get the puzzle of the day.
+
+        Args:
+            language: Language name (e.g. 'english' or 'french')
+            difficulty: 'easy', 'medium' or 'hard'
+            day: Day to compute (defaults to today in the configured timezone)
+
+        Returns:
+            Puzzle dictionary as returned by BibleBookScrambler.create_puzzle,
+            plus the date in ISO format
+
+        Raises:
+            ValueError: If the language or difficulty is invalid
+        """
+        key = (get_language(language).name, validate_difficulty(difficulty))
+        if day is not None and day != self.today():
+            return self._compute(day, *key)
+
+        today = self.today()
+        with self._lock:
+            if self._day != today:
+                # Midnight rollover: drop yesterday's puzzles
+                self._day = today
+                self._cache = {}
+            puzzle = self._cache.get(key)
+        if puzzle is None:
+            puzzle = self._compute(today, *key)
+            with self._lock:
+                if self._day == today:
+                    self._cache[key] = puzzle
+        return puzzle
+
+    def _compute(self, day: date, language: str, difficulty: str) -> Dict[str, Any]:
+        """Generate the puzzle of a day"""
+        seed = daily_seed(day, language, difficulty, self._key)
+        puzzle = self.scrambler.create_puzzle(language, seed=seed, difficulty=difficulty)
+        puzzle['date'] = day.isoformat()
+        return puzzle
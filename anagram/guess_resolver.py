@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Typo-Tolerant Guess Resolver
+Resolves misspelled Bible book names to their canonical entry using a
+SymSpell-style deletion index, so lookups stay fast as catalogs grow.
+"""
+
+from typing import Dict, Generic, Iterable, List, Optional, Set, Tuple, TypeVar
+
+# Largest edit distance the deletion index is built for
+MAX_EDIT_DISTANCE = 2
+
+T = TypeVar('T')
+
+def edit_distance(source: str, target: str, limit: int) -> int:
+    """
+    Compute the optimal string alignment (Damerau-Levenshtein) distance.
+
+    Args:
+        source: First string
+        target: Second string
+        limit: Stop early once the distance is known to exceed this value
+
+    Returns:
+        The edit distance, or limit + 1 if it is larger than limit
+    """
+    if abs(len(source) - len(target)) > limit:
+        return limit + 1
+
+    previous_previous: List[int] = []
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        row_minimum = i
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and source[i - 1] == target[j - 2] and source[i - 2] == target[j - 1]:
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_minimum = min(row_minimum, value)
+        if row_minimum > limit:
+            return limit + 1
+        previous_previous, previous = previous, current
+
+    return previous[-1] if previous[-1] <= limit else limit + 1
+
+def _deletes(term: str, max_distance: int) -> Set[str]:
+    """Generate every variant of a term with up to max_distance characters deleted"""
+    variants = {term}
+    frontier = {term}
+    for _ in range(max_distance):
+        next_frontier = set()
+        for variant in frontier:
+            for i in range(len(variant)):
+                next_frontier.add(variant[:i] + variant[i + 1:])
+        next_frontier -= variants
+        variants |= next_frontier
+        frontier = next_frontier
+    return variants
+
+class GuessResolver(Generic[T]):
+    """
+    Deletion index mapping normalized names to the entries they stand for.
+
+    Every name is expanded once into all variants with up to
+    MAX_EDIT_DISTANCE deleted characters. A query expands itself the same
+    way, so only names sharing a variant with it are compared, and the
+    per-query cost does not grow with the number of names.
+    """
+
+    def __init__(self, names: Iterable[Tuple[str, T]], max_distance: int = MAX_EDIT_DISTANCE):
+        self.max_distance = max_distance
+        self._names: Dict[str, T] = {}
+        self._order: Dict[str, int] = {}
+        self._deletes: Dict[str, List[str]] = {}
+
+        # The first entry registered for a name wins, so callers list preferred names first
+        for name, entry in names:
+            if name in self._names:
+                continue
+            self._names[name] = entry
+            self._order[name] = len(self._order)
+            for variant in _deletes(name, max_distance):
+                self._deletes.setdefault(variant, []).append(name)
+
+    def resolve(self, query: str, max_distance: Optional[int] = None) -> Optional[Tuple[T, int]]:
+        """
+        Find the closest name to a normalized query.
+
+        Args:
+            query: Normalized guess
+            max_distance: Edit budget, capped at the index's budget and at half the query length
+
+        Returns:
+            Tuple of (entry, distance) for the best match, or None if nothing is close enough
+        """
+        entry = self._names.get(query)
+        if entry is not None:
+            return entry, 0
+
+        limit = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        limit = min(limit, len(query) // 2)
+        if limit <= 0:
+            return None
+
+        best: Optional[Tuple[int, int]] = None
+        best_name = ''
+        seen: Set[str] = set()
+        for variant in _deletes(query, limit):
+            for name in self._deletes.get(variant, ()):
+                if name in seen:
+                    continue
+                seen.add(name)
+                distance = edit_distance(query, name, limit)
+                if distance > limit:
+                    continue
+                # Ties go to the name registered first
+                rank = (distance, self._order[name])
+                if best is None or rank < best:
+                    best, best_name = rank, name
+
+        if best is None:
+            return None
+        return self._names[best_name], best[0]
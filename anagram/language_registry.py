@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Language Registry
+Discovers the supported Bible book languages from the data files in the
+languages/ directory and loads each one lazily on first use.
+
+Adding a language is a data drop: copy languages/english.json to
+languages/<language>.json, translate it and rebuild the compiled catalog.
+A process only parses the data files of the languages it actually uses,
+and not even those while the compiled catalog is current: the spec
+metadata is then read from the catalog, and the book list is parsed only
+if something asks for it.
+"""
+
+import json
+import os
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+LANGUAGES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'languages')
+
+class LanguageSpec:
+    """
+    Everything the scrambler needs to know about one language: its book
+    catalog, localized testament and category names, hint wording and the
+    tables the alias compiler draws from.
+
+    Localized tuples are indexed by the Testament and Category enum values.
+    """
+
+    __slots__ = ('name', 'display_name', 'testament_keys', 'testament_names', 'testament_filters',
+                 'category_keys', 'category_names', 'hint_format', 'books_label', 'connector_words',
+                 'numeral_forms', 'abbreviations', '_books', '_path')
+
+    def __init__(self, data: Dict[str, Any], path: Optional[str] = None):
+        from bible_books_data import Category, Testament
+
+        self.name: str = data['name']
+        self.display_name: str = data.get('display_name', self.name.title())
+
+        testaments = [data['testaments'][testament.name.lower()] for testament in Testament]
+        self.testament_keys: Tuple[str, ...] = tuple(entry['key'] for entry in testaments)
+        self.testament_names: Tuple[str, ...] = tuple(entry['name'] for entry in testaments)
+
+        # Filters accept the canonical name, the localized key and any listed aliases
+        self.testament_filters: Dict[str, Testament] = {}
+        for testament, entry in zip(Testament, testaments):
+            for name in [testament.name.lower(), entry['key'], *entry.get('aliases', [])]:
+                self.testament_filters[name.lower()] = testament
+
+        categories = [data['categories'][category.name.lower()] for category in Category]
+        self.category_keys: Tuple[str, ...] = tuple(entry['key'] for entry in categories)
+        self.category_names: Tuple[str, ...] = tuple(entry['name'] for entry in categories)
+
+        self.hint_format: str = data['hint_format']
+        self.books_label: str = data.get('books_label', 'books')
+        self.connector_words: FrozenSet[str] = frozenset(word.lower() for word in data.get('connector_words', []))
+        self.numeral_forms: Dict[str, Tuple[str, ...]] = {
+            number: tuple(forms) for number, forms in data.get('numeral_forms', {}).items()
+        }
+        self.abbreviations: Dict[int, Tuple[str, ...]] = {
+            int(book_number): tuple(names) for book_number, names in data.get('abbreviations', {}).items()
+        }
+        # Spec metadata from the compiled catalog comes without the books
+        self._books: Optional[Dict[str, Dict[str, Any]]] = data.get('books')
+        self._path = path
+
+    @property
+    def books(self) -> Dict[str, Dict[str, Any]]:
+        """The book catalog, parsed from the data file on first use if it was not loaded with the spec"""
+        if self._books is None:
+            self._books = _read_data_file(self._path)['books']
+        return self._books
+
+    @classmethod
+    def from_file(cls, path: str) -> 'LanguageSpec':
+        """Load a language data file"""
+        return cls(_read_data_file(path), path)
+
+def _read_data_file(path: str) -> Dict[str, Any]:
+    """Parse a language data file"""
+    with open(path, encoding='utf-8') as data_file:
+        return json.load(data_file)
+
+# Data file paths are discovered once; specs are parsed on first use
+_LANGUAGE_FILES: Dict[str, str] = {}
+_LANGUAGES: Dict[str, LanguageSpec] = {}
+
+def _language_files() -> Dict[str, str]:
+    """Map language names to their data files, scanning the directory once"""
+    if not _LANGUAGE_FILES:
+        for file_name in sorted(os.listdir(LANGUAGES_DIR)):
+            name, extension = os.path.splitext(file_name)
+            if extension == '.json':
+                _LANGUAGE_FILES.setdefault(name.lower(), os.path.join(LANGUAGES_DIR, file_name))
+    return _LANGUAGE_FILES
+
+def available_languages() -> List[str]:
+    """
+    Get the names of all supported languages.
+
+    Returns:
+        Sorted list of language names (e.g. ['english', 'french'])
+    """
+    return list(_language_files())
+
+def is_supported_language(language: str) -> bool:
+    """Check whether a language has a data file"""
+    return language.lower() in _language_files()
+
+def language_error_message() -> str:
+    """Error message listing the supported languages"""
+    names = [f"'{language}'" for language in available_languages()]
+    if len(names) <= 2:
+        return f"Language must be {' or '.join(names)}"
+    return f"Language must be one of {', '.join(names)}"
+
+def language_path(language: str) -> str:
+    """
+    Get the path of a language's data file.
+
+    Args:
+        language: Language name (case-insensitive)
+
+    Returns:
+        Path of languages/<language>.json
+
+    Raises:
+        ValueError: If the language is not supported
+    """
+    path = _language_files().get(language.lower())
+    if path is None:
+        raise ValueError(language_error_message())
+    return path
+
+def read_spec_metadata(language: str) -> Dict[str, Any]:
+    """
+    Read a language's spec metadata from its data file: everything but the books.
+
+    Args:
+        language: Language name (case-insensitive)
+
+    Returns:
+        The data file's contents without the 'books' entry
+
+    Raises:
+        ValueError: If the language is not supported
+    """
+    data = _read_data_file(language_path(language))
+    data.pop('books', None)
+    return data
+
+def get_language(language: str) -> LanguageSpec:
+    """
+    Get a language's spec, loading it on first use.
+
+    The metadata comes from the compiled catalog when it is current, so the
+    data file is only parsed when the catalog is missing or stale.
+
+    Args:
+        language: Language name (case-insensitive)
+
+    Returns:
+        The shared LanguageSpec
+
+    Raises:
+        ValueError: If the language is not supported
+    """
+    name = language.lower()
+    spec = _LANGUAGES.get(name)
+    if spec is None:
+        path = language_path(name)
+        from compiled_catalog import load_compiled_spec
+        metadata = load_compiled_spec(name)
+        spec = LanguageSpec(metadata, path) if metadata is not None else LanguageSpec.from_file(path)
+        spec = _LANGUAGES.setdefault(name, spec)
+    return spec
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Letter Arrangement Sampler
+Draws scrambles uniformly from every distinct arrangement of a word's
+letters that moves at least a given number of positions, in one pass.
+
+Letters are treated as a multiset, so repeated letters ("Numbers",
+"Ecclesiastes") neither skew the distribution nor waste draws. A
+position counts as moved when it ends up holding a different letter
+than in the original word. The number of valid completions of every
+partial arrangement is counted once per word and cached, after which a
+draw costs one weighted choice (a bisection) per position.
+
+The counting table grows with the product of (count + 1) over the
+distinct letters, which explodes for long names with many different
+letters. Above MAX_COUNTING_STATES the sampler skips counting and draws
+by rejection instead: shuffle, keep the first draw that moves enough
+positions. That is still uniform, and with that many distinct letters
+most shuffles qualify; after MAX_REJECTION_DRAWS the draw that moved the
+most positions is used.
+"""
+
+import random
+from bisect import bisect_right
+from functools import lru_cache
+from math import factorial, prod
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Largest counting table (distinct remaining-letter states) built for one word
+MAX_COUNTING_STATES = 4096
+
+# Shuffles tried per rejection-sampled draw before settling for the best one
+MAX_REJECTION_DRAWS = 200
+
+# Letters not used yet (count per class) and positions that still have to move
+_State = Tuple[Tuple[int, ...], int]
+# Class of the next letter, and the state it leads to
+_Move = Tuple[int, Tuple[int, ...], int]
+
+@lru_cache(maxsize=1024)
+def _completion_memo(letters: Tuple[str, ...]) -> Dict[_State, int]:
+    """Get the completion counts of a word, shared by its samplers for every min_moved"""
+    return {}
+
+class ArrangementSampler:
+    """
+    Uniform sampler over the arrangements of one multiset of letters.
+
+    Letters are grouped into classes of identical characters. A partial
+    arrangement is identified by the letters it has not used yet and by
+    how many more positions still have to move, and the number of valid
+    completions of each such state is memoized. Words with too many such
+    states are sampled by rejection, and total is then None.
+    """
+
+    def __init__(self, letters: Sequence[str], min_moved: Optional[int] = None):
+        self.letters: Tuple[str, ...] = tuple(letters)
+        self._classes: List[str] = []
+        class_ids: Dict[str, int] = {}
+        for letter in self.letters:
+            class_ids.setdefault(letter, len(class_ids))
+            if len(self._classes) < len(class_ids):
+                self._classes.append(letter)
+        self._original = tuple(class_ids[letter] for letter in self.letters)
+
+        counts = [0] * len(self._classes)
+        for class_id in self._original:
+            counts[class_id] += 1
+        self._counts = tuple(counts)
+
+        # A letter filling more than half the word keeps some of its places
+        length = len(self.letters)
+        most_common = max(counts, default=0)
+        max_moved = length - max(0, 2 * most_common - length)
+        requested = length if min_moved is None else max(0, min_moved)
+        self.min_moved = min(requested, max_moved)
+
+        self.total: Optional[int] = None
+        self._rejection = prod(n + 1 for n in counts) > MAX_COUNTING_STATES
+        if self._rejection:
+            # Every count up to max_moved is reachable, so no relaxation is needed
+            return
+
+        self._memo = _completion_memo(self.letters)
+        # State -> cumulative weights and moves of the next letter, filled in as draws visit states
+        self._steps: Dict[_State, Tuple[List[int], List[_Move]]] = {}
+        self.total = self._completions(self._counts, self.min_moved)
+        while self.total == 0 and self.min_moved > 0:
+            self.min_moved -= 1
+            self.total = self._completions(self._counts, self.min_moved)
+
+    def _completions(self, remaining: Tuple[int, ...], needed: int) -> int:
+        """Count the ways to finish an arrangement from the given state"""
+        left = sum(remaining)
+        if needed == 0:
+            # Unconstrained: every distinct ordering of the remaining letters
+            count = factorial(left)
+            for n in remaining:
+                count //= factorial(n)
+            return count
+        if needed > left:
+            return 0
+
+        key = (remaining, needed)
+        count = self._memo.get(key)
+        if count is None:
+            position = len(self.letters) - left
+            original = self._original[position]
+            count = 0
+            for class_id, n in enumerate(remaining):
+                if n:
+                    next_remaining = remaining[:class_id] + (n - 1,) + remaining[class_id + 1:]
+                    count += self._completions(next_remaining, needed - (class_id != original))
+            self._memo[key] = count
+        return count
+
+    def sample(self, rng: random.Random) -> List[str]:
+        """
+        Draw one arrangement uniformly at random.
+
+        Args:
+            rng: Generator to draw with
+
+        Returns:
+            The arranged letters
+        """
+        if self._rejection:
+            return self._sample_rejection(rng)
+
+        remaining = self._counts
+        needed = self.min_moved
+        result: List[str] = []
+
+        for _ in self._original:
+            # Pick the next letter with probability proportional to its completions
+            cumulative, moves = self._choices(remaining, needed)
+            class_id, remaining, needed = moves[bisect_right(cumulative, rng.randrange(cumulative[-1]))]
+            result.append(self._classes[class_id])
+
+        return result
+
+    def _choices(self, remaining: Tuple[int, ...], needed: int) -> Tuple[List[int], List[_Move]]:
+        """Get the cumulative completion counts of a state's next letters, working them out once"""
+        key = (remaining, needed)
+        choices = self._steps.get(key)
+        if choices is None:
+            original = self._original[len(self.letters) - sum(remaining)]
+            cumulative: List[int] = []
+            moves: List[_Move] = []
+            for class_id, n in enumerate(remaining):
+                if not n:
+                    continue
+                next_remaining = remaining[:class_id] + (n - 1,) + remaining[class_id + 1:]
+                next_needed = max(0, needed - (class_id != original))
+                weight = self._completions(next_remaining, next_needed)
+                if weight:
+                    cumulative.append(weight + (cumulative[-1] if cumulative else 0))
+                    moves.append((class_id, next_remaining, next_needed))
+            choices = self._steps[key] = (cumulative, moves)
+        return choices
+
+    def _sample_rejection(self, rng: random.Random) -> List[str]:
+        """Shuffle until enough positions move, or return the best of MAX_REJECTION_DRAWS shuffles"""
+        best: List[str] = []
+        best_moved = -1
+        for _ in range(MAX_REJECTION_DRAWS):
+            arranged = list(self.letters)
+            rng.shuffle(arranged)
+            moved = sum(letter != original for letter, original in zip(arranged, self.letters))
+            if moved >= self.min_moved:
+                return arranged
+            if moved > best_moved:
+                best, best_moved = arranged, moved
+        return best
+
+@lru_cache(maxsize=1024)
+def get_arrangement_sampler(letters: Tuple[str, ...], min_moved: Optional[int] = None) -> ArrangementSampler:
+    """
+    Get the shared sampler for a word's letters, building it on first use.
+
+    Args:
+        letters: The letters to arrange, in their original order
+        min_moved: Fewest positions that must change (None for all of them)
+
+    Returns:
+        The cached ArrangementSampler
+    """
+    return ArrangementSampler(letters, min_moved)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Phrase Anagram Solver
+Finds combinations of dictionary words whose letters exactly use up the
+input ("dormitory" -> "dirty room").
+
+Only signatures whose letters fit inside the input are kept, each as a
+letter-count vector over the input's alphabet. A depth-first search then
+subtracts vectors, taking signatures in a fixed order so every phrase is
+found once, and remembers remaining-letter states that lead nowhere so
+they are never explored twice. Phrases are yielded as soon as they are
+found, and the search stops at a wall-clock budget or when cancelled.
+"""
+
+import threading
+import time
+from itertools import combinations_with_replacement, product
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from word_index import WordIndex, normalize_word
+
+# Words per phrase unless the caller asks for more
+MAX_PHRASE_WORDS = 3
+
+Vector = Tuple[int, ...]
+
+def _fits(counts: Vector, limit: Vector) -> bool:
+    """Check that every letter count is within the limit"""
+    return all(count <= available for count, available in zip(counts, limit))
+
+def _candidates(index: WordIndex, target: str) -> List[Tuple[Vector, str]]:
+    """Collect the signatures whose letters all fit inside the target, longest first"""
+    alphabet = sorted(set(target))
+    position = {letter: i for i, letter in enumerate(alphabet)}
+    limit = tuple(target.count(letter) for letter in alphabet)
+
+    candidates = []
+    for signature in index.keys():
+        if not signature or len(signature) > len(target) or not set(signature) <= position.keys():
+            continue
+        counts = [0] * len(alphabet)
+        for letter in signature:
+            counts[position[letter]] += 1
+        counts = tuple(counts)
+        if _fits(counts, limit):
+            candidates.append((counts, signature))
+    candidates.sort(key=lambda candidate: (-len(candidate[1]), candidate[1]))
+    return candidates
+
+def _expand(index: WordIndex, signatures: List[str]) -> Iterator[Tuple[str, ...]]:
+    """Turn a combination of signatures into every distinct combination of words"""
+    groups: Dict[str, int] = {}
+    for signature in signatures:
+        groups[signature] = groups.get(signature, 0) + 1
+    choices = [list(combinations_with_replacement(index.get(signature, ()), repeat))
+               for signature, repeat in groups.items()]
+    for picked in product(*choices):
+        yield tuple(word for group in picked for word in group)
+
+def find_phrases(index: WordIndex, text: str, max_words: int = MAX_PHRASE_WORDS,
+                 time_budget: Optional[float] = None,
+                 cancel: Optional[threading.Event] = None) -> Iterator[str]:
+    """
+    Stream the phrases that use exactly the letters of a text.
+
+    Args:
+        index: Signature index of the dictionary
+        text: Word or phrase to rearrange
+        max_words: Most words per phrase
+        time_budget: Seconds to search before stopping (None for no limit)
+        cancel: Event that stops the search once set
+
+    Returns:
+        Iterator over phrases (words joined by spaces); the input itself is skipped
+    """
+    target = normalize_word(text)
+    if not target or max_words < 1:
+        return
+    deadline = None if time_budget is None else time.monotonic() + time_budget
+    candidates = _candidates(index, target)
+    remaining = tuple(target.count(letter) for letter in sorted(set(target)))
+    dead_ends: Set[Tuple[Vector, int, int]] = set()
+
+    def stopped() -> bool:
+        return (deadline is not None and time.monotonic() > deadline) or \
+            (cancel is not None and cancel.is_set())
+
+    def search(remaining: Vector, start: int, words_left: int, chosen: List[str]) -> Iterator[List[str]]:
+        """Yield signature combinations using up the remaining letters"""
+        if not any(remaining):
+            yield list(chosen)
+            return
+        state = (remaining, start, words_left)
+        if words_left == 0 or state in dead_ends:
+            return
+
+        letters_left = sum(remaining)
+        found = False
+        for i in range(start, len(candidates)):
+            if stopped():
+                return
+            counts, signature = candidates[i]
+            # Candidates only get shorter, so the longest left must cover the letters in time
+            if len(signature) * words_left < letters_left:
+                break
+            if not _fits(counts, remaining):
+                continue
+            chosen.append(signature)
+            for combination in search(tuple(r - c for r, c in zip(remaining, counts)), i, words_left - 1, chosen):
+                found = True
+                yield combination
+            chosen.pop()
+        if not found and not stopped():
+            dead_ends.add(state)
+
+    for combination in search(remaining, 0, max_words, []):
+        for words in _expand(index, combination):
+            phrase = ' '.join(words)
+            if normalize_word(phrase) == target:
+                continue
+            yield phrase
+            if stopped():
+                return
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Puzzle IDs
+A puzzle ID encodes everything needed to regenerate a scramble: the
+language, the book number, the RNG seed and, unless it is medium, the
+difficulty ("english-1-9f2c4e7a01b3d5c8", "french-19-2a-h").
+Any worker can rebuild the exact same puzzle from its ID, so puzzles can
+be shared as links and cached without being stored.
+"""
+
+import random
+from typing import Tuple
+
+# Seeds are drawn from the OS so puzzle IDs can not be predicted
+SEED_BITS = 64
+
+_SYSTEM_RANDOM = random.SystemRandom()
+
+# One-letter difficulty suffixes; medium puzzles carry no suffix
+_DIFFICULTY_CODES = {'easy': 'e', 'hard': 'h'}
+_DIFFICULTY_NAMES = {code: name for name, code in _DIFFICULTY_CODES.items()}
+
+def new_seed() -> int:
+    """Draw a fresh puzzle seed"""
+    return _SYSTEM_RANDOM.getrandbits(SEED_BITS)
+
+def encode_puzzle_id(language: str, book_number: int, seed: int, difficulty: str = 'medium') -> str:
+    """
+    Build the ID of a puzzle.
+
+    Args:
+        language: Language name (e.g. 'english' or 'french')
+        book_number: Canonical book number (1-66)
+        seed: Seed the scramble is generated from
+        difficulty: 'easy', 'medium' or 'hard'
+
+    Returns:
+        Puzzle ID such as 'french-43-1f3a' or 'french-43-1f3a-h'
+    """
+    puzzle_id = f"{language.lower()}-{book_number}-{seed:x}"
+    code = _DIFFICULTY_CODES.get(difficulty)
+    return f"{puzzle_id}-{code}" if code else puzzle_id
+
+def decode_puzzle_id(puzzle_id: str) -> Tuple[str, int, int, str]:
+    """
+    Split a puzzle ID into its parts.
+
+    Args:
+        puzzle_id: ID produced by encode_puzzle_id
+
+    Returns:
+        Tuple of (language, book number, seed, difficulty)
+
+    Raises:
+        ValueError: If the ID is malformed
+    """
+    parts = puzzle_id.strip().split('-')
+    difficulty = _DIFFICULTY_NAMES.get(parts[3].lower()) if len(parts) == 4 else 'medium'
+    try:
+        language, book_number, seed = parts[0].lower(), int(parts[1]), int(parts[2], 16)
+    except (IndexError, ValueError):
+        raise ValueError(f"Invalid puzzle ID: '{puzzle_id}'") from None
+    if len(parts) > 4 or difficulty is None or not language or book_number < 1 or seed < 0:
+        raise ValueError(f"Invalid puzzle ID: '{puzzle_id}'")
+    return language, book_number, seed, difficulty
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Puzzle Pool
+Keeps pre-generated random challenges ready per (language, testament,
+difficulty) so serving one is a dequeue rather than a book pick, scramble
+and hint lookup on the request path.
+
+A background thread tops each pool back up to its high watermark as soon
+as it drops below its low watermark. A request that finds its pool empty
+generates its puzzle inline (a miss) and registers the pool for refills.
+
+No-repeat sessions pick the book themselves (from a shuffle bag), so they
+draw from small per-book pools instead: a few ready puzzles for every book
+of a language and difficulty, registered together on the first miss.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from language_registry import get_language
+from scramble_scoring import validate_difficulty
+
+# Default watermarks: refill below LOW_WATERMARK, up to HIGH_WATERMARK
+LOW_WATERMARK = 16
+HIGH_WATERMARK = 64
+
+# Per-book pools are shallow: a session sees each book once per round
+BOOK_LOW_WATERMARK = 1
+BOOK_HIGH_WATERMARK = 4
+
+PoolKey = Tuple[str, str, str]
+
+class PuzzlePool:
+    """
+    Per-key queues of ready puzzles with a background refill thread.
+
+    Only unseeded random challenges are pooled; every pooled puzzle still
+    carries its own puzzle ID, so it can be replayed like any other.
+    """
+
+    def __init__(self, scrambler, low: int = LOW_WATERMARK, high: int = HIGH_WATERMARK,
+                 book_low: int = BOOK_LOW_WATERMARK, book_high: int = BOOK_HIGH_WATERMARK):
+        if not 0 <= low < high or not 0 <= book_low < book_high:
+            raise ValueError("Watermarks must satisfy 0 <= low < high")
+        self.scrambler = scrambler
+        self.low = low
+        self.high = high
+        self.book_low = book_low
+        self.book_high = book_high
+
+        self._pools: Dict[PoolKey, Deque[Dict[str, Any]]] = {}
+        # (language, book display name, difficulty) -> ready puzzles of that book
+        self._book_pools: Dict[PoolKey, Deque[Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.generated = 0
+        self._refill_seconds = 0.0
+
+    def _key(self, language: str, testament: str, difficulty: str) -> PoolKey:
+        """Normalize request options so equivalent requests share a pool"""
+        spec = get_language(language)
+        testament = testament.lower()
+        if testament != 'any' and testament in spec.testament_filters:
+            testament = spec.testament_filters[testament].name.lower()
+        return spec.name, testament, validate_difficulty(difficulty)
+
+    def get(self, language: str, testament: str = 'any', difficulty: str = 'medium') -> Dict[str, Any]:
+        """
+        Take a ready puzzle, generating one inline when the pool is empty.
+
+        Args:
+            language: Language name (e.g. 'english' or 'french')
+            testament: 'old'/'ancien', 'new'/'nouveau', or 'any'
+            difficulty: 'easy', 'medium' or 'hard'
+
+        Returns:
+            Puzzle dictionary as returned by BibleBookScrambler.create_puzzle
+
+        Raises:
+            ValueError: If the options are invalid
+        """
+        key = self._key(language, testament, difficulty)
+        pool = self._pools.get(key)
+
+        puzzle = None
+        if pool:
+            try:
+                puzzle = pool.popleft()
+            except IndexError:
+                pass
+
+        if puzzle is None:
+            # Generated before registering, so invalid options never get a pool
+            puzzle = self.scrambler.create_puzzle(key[0], key[1], difficulty=key[2])
+            with self._lock:
+                self.misses += 1
+                pool = self._pools.setdefault(key, deque())
+        else:
+            with self._lock:
+                self.hits += 1
+
+        if len(pool) < self.low:
+            self._start()
+            self._wakeup.set()
+        return puzzle
+
+    def get_book(self, book_name: str, language: str, difficulty: str = 'medium') -> Dict[str, Any]:
+        """
+        Take a ready puzzle of one book, generating it inline when its pool is empty.
+
+        Args:
+            book_name: Display name of the book
+            language: Language name (e.g. 'english' or 'french')
+            difficulty: 'easy', 'medium' or 'hard'
+
+        Returns:
+            Puzzle dictionary as returned by BibleBookScrambler.create_book_puzzle
+
+        Raises:
+            ValueError: If the book or options are invalid
+        """
+        language = get_language(language).name
+        difficulty = validate_difficulty(difficulty)
+        pool = self._book_pools.get((language, book_name, difficulty))
+
+        puzzle = None
+        if pool:
+            try:
+                puzzle = pool.popleft()
+            except IndexError:
+                pass
+
+        if puzzle is None:
+            # Generated before registering, so unknown books never get a pool
+            puzzle = self.scrambler.create_book_puzzle(book_name, language, difficulty=difficulty)
+            key = (language, puzzle['original'], difficulty)
+            with self._lock:
+                self.misses += 1
+                if key not in self._book_pools:
+                    # Sessions work through every book, so get them all ready at once
+                    self._register_books(language, difficulty)
+                pool = self._book_pools[key]
+        else:
+            with self._lock:
+                self.hits += 1
+
+        if len(pool) < self.book_low:
+            self._start()
+            self._wakeup.set()
+        return puzzle
+
+    def prefill(self, language: str, testament: str = 'any', difficulty: str = 'medium') -> None:
+        """
+        Register a pool ahead of traffic so the refill thread fills it.
+
+        Args:
+            language: Language name (e.g. 'english' or 'french')
+            testament: 'old'/'ancien', 'new'/'nouveau', or 'any'
+            difficulty: 'easy', 'medium' or 'hard'
+
+        Raises:
+            ValueError: If the options are invalid
+        """
+        key = self._key(language, testament, difficulty)
+        self.scrambler.get_random_book(key[0], key[1])
+        with self._lock:
+            self._pools.setdefault(key, deque())
+        self._start()
+        self._wakeup.set()
+
+    def prefill_books(self, language: str, difficulty: str = 'medium') -> None:
+        """
+        Register the pool of every book ahead of traffic so the refill thread fills them.
+
+        Args:
+            language: Language name (e.g. 'english' or 'french')
+            difficulty: 'easy', 'medium' or 'hard'
+
+        Raises:
+            ValueError: If the options are invalid
+        """
+        language = get_language(language).name
+        difficulty = validate_difficulty(difficulty)
+        with self._lock:
+            self._register_books(language, difficulty)
+        self._start()
+        self._wakeup.set()
+
+    def _register_books(self, language: str, difficulty: str) -> None:
+        """Add an empty pool for every book of a language; the caller holds the lock"""
+        for book in self.scrambler.get_all_books_list(language):
+            self._book_pools.setdefault((language, book, difficulty), deque())
+
+    def _start(self) -> None:
+        """Start the refill thread on first use"""
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stopping.clear()
+                self._thread = threading.Thread(target=self._refill_loop, name='puzzle-pool-refill', daemon=True)
+                self._thread.start()
+
+    def _refill_loop(self) -> None:
+        """Top up every pool below its low watermark until stopped"""
+        while not self._stopping.is_set():
+            self._wakeup.wait(timeout=1.0)
+            self._wakeup.clear()
+            for key, pool in list(self._pools.items()):
+                if len(pool) >= self.low:
+                    continue
+                while len(pool) < self.high and not self._stopping.is_set():
+                    started = time.perf_counter()
+                    pool.append(self.scrambler.create_puzzle(key[0], key[1], difficulty=key[2]))
+                    with self._lock:
+                        self.generated += 1
+                        self._refill_seconds += time.perf_counter() - started
+            for key, pool in list(self._book_pools.items()):
+                if len(pool) >= self.book_low:
+                    continue
+                while len(pool) < self.book_high and not self._stopping.is_set():
+                    started = time.perf_counter()
+                    pool.append(self.scrambler.create_book_puzzle(key[1], key[0], difficulty=key[2]))
+                    with self._lock:
+                        self.generated += 1
+                        self._refill_seconds += time.perf_counter() - started
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the refill thread"""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get pool depths and counters for monitoring.
+
+        Returns:
+            Dictionary with per-pool depths, ready per-book puzzles per language
+            and difficulty, hits, misses, hit rate, puzzles generated in the
+            background and the refill rate in puzzles/sec
+        """
+        with self._lock:
+            requests = self.hits + self.misses
+            book_pools: Dict[str, int] = {}
+            for (language, _, difficulty), pool in self._book_pools.items():
+                key = f"{language}/{difficulty}"
+                book_pools[key] = book_pools.get(key, 0) + len(pool)
+            return {
+                'pools': {'/'.join(key): len(pool) for key, pool in self._pools.items()},
+                'book_pools': book_pools,
+                'low_watermark': self.low,
+                'high_watermark': self.high,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / requests if requests else 0.0,
+                'generated': self.generated,
+                'refill_rate': self.generated / self._refill_seconds if self._refill_seconds else 0.0
+            }
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Scramble Difficulty Scoring
+Rates candidate scrambles by how easy they are to solve and picks one
+inside the requested difficulty band.
+
+A batch of candidates is drawn per word from the uniform arrangement
+sampler, plus, for easy scrambles, partial scrambles that cycle a random
+subset of letters. Unless the caller sets min_moved, medium and hard
+scrambles move every letter (the sampler's derangements) and easy ones
+at least half of them. Each candidate is
+scored on four features, all in [0, 1] and higher meaning easier:
+
+- fixed: share of letters still in their original position
+- bigrams: share of adjacent letter pairs that also appear in the original
+- leading: whether the first letter is unchanged
+- pronounceable: share of adjacent pairs alternating vowel and consonant
+
+The batch is scored in one vectorized pass with NumPy when it is
+installed, and with plain Python otherwise. NumPy is imported on the
+first scored batch rather than with this module, so processes that never
+score a scramble (and CLI start-up) do not pay for it.
+"""
+
+import random
+import unicodedata
+from functools import lru_cache
+from math import ceil
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from letter_arrangements import ArrangementSampler, get_arrangement_sampler
+
+DIFFICULTIES = ('easy', 'medium', 'hard')
+
+# Ease score range of each difficulty, as [low, high)
+DIFFICULTY_BANDS: Dict[str, Tuple[float, float]] = {
+    'easy': (0.45, 1.01),
+    'medium': (0.2, 0.45),
+    'hard': (0.0, 0.2)
+}
+
+# Weights of the fixed, bigrams, leading and pronounceable features
+FEATURE_WEIGHTS = (0.35, 0.3, 0.2, 0.15)
+
+# Candidates scored per word
+BATCH_SIZE = 32
+
+# Share of a word's letters that must move when the caller sets no min_moved
+DEFAULT_MOVED_SHARE: Dict[str, float] = {
+    'easy': 0.5,
+    'medium': 1.0,
+    'hard': 1.0
+}
+
+_VOWELS = frozenset('aeiouy')
+
+def _is_vowel(letter: str) -> bool:
+    """Check whether a letter is a vowel, ignoring case and accents"""
+    return unicodedata.normalize('NFKD', letter)[:1].lower() in _VOWELS
+
+def validate_difficulty(difficulty: str) -> str:
+    """
+    Normalize a difficulty name.
+
+    Args:
+        difficulty: 'easy', 'medium' or 'hard' (case-insensitive)
+
+    Returns:
+        The lowercase difficulty name
+
+    Raises:
+        ValueError: If the difficulty is unknown
+    """
+    name = difficulty.lower()
+    if name not in DIFFICULTY_BANDS:
+        raise ValueError("Difficulty must be 'easy', 'medium' or 'hard'")
+    return name
+
+def _encode(letters: Sequence[str], candidates: Sequence[Sequence[str]]) -> Tuple[List[int], List[List[int]], List[bool]]:
+    """Map letters to small integer codes, with a vowel flag per code"""
+    codes: Dict[str, int] = {}
+    for letter in letters:
+        codes.setdefault(letter, len(codes))
+    vowels = [_is_vowel(letter) for letter in codes]
+    original = [codes[letter] for letter in letters]
+    encoded = [[codes[letter] for letter in candidate] for candidate in candidates]
+    return original, encoded, vowels
+
+@lru_cache(maxsize=1)
+def _get_numpy():
+    """Import NumPy on first use, or get None when it is not installed"""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover - exercised only without NumPy
+        return None
+    return numpy
+
+def _score_numpy(original: List[int], candidates: List[List[int]], vowels: List[bool]) -> List[float]:
+    """Score a batch of encoded candidates with NumPy"""
+    np = _get_numpy()
+    origin = np.asarray(original, dtype=np.int32)
+    batch = np.asarray(candidates, dtype=np.int32)
+    is_vowel = np.asarray(vowels, dtype=bool)
+    length = origin.size
+
+    fixed = (batch == origin).mean(axis=1)
+    leading = (batch[:, 0] == origin[0]).astype(float)
+    if length > 1:
+        base = len(vowels)
+        original_pairs = np.unique(origin[:-1] * base + origin[1:])
+        pairs = batch[:, :-1] * base + batch[:, 1:]
+        bigrams = np.isin(pairs, original_pairs).mean(axis=1)
+        shapes = is_vowel[batch]
+        pronounceable = (shapes[:, 1:] != shapes[:, :-1]).mean(axis=1)
+    else:
+        bigrams = pronounceable = np.ones(len(candidates))
+
+    weights = FEATURE_WEIGHTS
+    scores = weights[0] * fixed + weights[1] * bigrams + weights[2] * leading + weights[3] * pronounceable
+    return scores.tolist()
+
+def _score_python(original: List[int], candidates: List[List[int]], vowels: List[bool]) -> List[float]:
+    """Score a batch of encoded candidates without NumPy"""
+    length = len(original)
+    original_pairs = set(zip(original, original[1:]))
+    weights = FEATURE_WEIGHTS
+    scores = []
+    for candidate in candidates:
+        fixed = sum(a == b for a, b in zip(candidate, original)) / length
+        leading = 1.0 if candidate[0] == original[0] else 0.0
+        if length > 1:
+            pairs = list(zip(candidate, candidate[1:]))
+            bigrams = sum(pair in original_pairs for pair in pairs) / len(pairs)
+            pronounceable = sum(vowels[a] != vowels[b] for a, b in pairs) / len(pairs)
+        else:
+            bigrams = pronounceable = 1.0
+        scores.append(weights[0] * fixed + weights[1] * bigrams + weights[2] * leading + weights[3] * pronounceable)
+    return scores
+
+def score_scrambles(letters: Sequence[str], candidates: Sequence[Sequence[str]]) -> List[float]:
+    """
+    Rate how easy each candidate scramble of a word is to solve.
+
+    Args:
+        letters: The word's letters in their original order
+        candidates: Rearrangements of those letters
+
+    Returns:
+        Ease score of each candidate, from 0 (hardest) to 1 (unscrambled)
+    """
+    if not letters or not candidates:
+        return [1.0] * len(candidates)
+    original, encoded, vowels = _encode(letters, candidates)
+    if _get_numpy() is not None:
+        return _score_numpy(original, encoded, vowels)
+    return _score_python(original, encoded, vowels)
+
+def default_min_moved(difficulty: str, length: int) -> Optional[int]:
+    """
+    Get the fewest letters a scramble of a difficulty moves when the caller sets no minimum.
+
+    Args:
+        difficulty: 'easy', 'medium' or 'hard'
+        length: Number of letters in the word
+
+    Returns:
+        The minimum, or None for every letter
+    """
+    share = DEFAULT_MOVED_SHARE[validate_difficulty(difficulty)]
+    return None if share >= 1 else ceil(share * length)
+
+def _candidates(letters: Sequence[str], rng: random.Random, sampler: ArrangementSampler,
+                batch_size: int) -> List[List[str]]:
+    """Draw a batch of scrambles of a word, partial ones only where the sampler allows them"""
+    length = len(letters)
+    smallest = max(2, sampler.min_moved)
+    batch = []
+    for i in range(batch_size):
+        cycle_length = rng.randint(smallest, length) if smallest < length else length
+        if i % 4 == 3 or cycle_length >= length:
+            batch.append(sampler.sample(rng))
+            continue
+        # Rotate a random subset of positions: every chosen letter moves one step along the cycle
+        positions = rng.sample(range(length), cycle_length)
+        candidate = list(letters)
+        for source, target in zip(positions, positions[1:] + positions[:1]):
+            candidate[target] = letters[source]
+        batch.append(candidate)
+    return batch
+
+def choose_scramble(letters: Sequence[str], difficulty: str, rng: random.Random,
+                    min_moved: Optional[int] = None, batch_size: int = BATCH_SIZE,
+                    sampler: Optional[ArrangementSampler] = None) -> List[str]:
+    """
+    Scramble a word's letters at the requested difficulty.
+
+    Args:
+        letters: The word's letters in their original order
+        difficulty: 'easy', 'medium' or 'hard'
+        rng: Generator to draw candidates with
+        min_moved: Fewest positions that must hold a different letter
+            (None lets the difficulty decide, see DEFAULT_MOVED_SHARE)
+        batch_size: Number of candidates to score
+        sampler: The letters' sampler for the effective min_moved, when the
+            caller already holds it (min_moved is then ignored)
+
+    Returns:
+        The chosen arrangement; a random candidate inside the band, or the
+        candidate closest to it when none falls inside
+    """
+    difficulty = validate_difficulty(difficulty)
+    low, high = DIFFICULTY_BANDS[difficulty]
+    if sampler is None:
+        if min_moved is None:
+            min_moved = default_min_moved(difficulty, len(letters))
+        sampler = get_arrangement_sampler(tuple(letters), min_moved)
+    if len(letters) < 3:
+        return sampler.sample(rng)
+
+    batch = _candidates(letters, rng, sampler, batch_size)
+    # Candidates must move as many letters as the sampler requires, and at least one
+    fewest = max(1, sampler.min_moved)
+    batch = [c for c in batch if sum(a != b for a, b in zip(c, letters)) >= fewest]
+    if not batch:
+        return sampler.sample(rng)
+    scores = score_scrambles(letters, batch)
+
+    in_band = [candidate for candidate, score in zip(batch, scores) if low <= score < high]
+    if in_band:
+        return rng.choice(in_band)
+    distances = [low - score if score < low else score - high for score in scores]
+    return batch[distances.index(min(distances))]
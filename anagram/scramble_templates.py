@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Scramble Templates
+Compiles a book name once into the layout every scramble of it shares:
+the fixed characters (digits, spaces, punctuation, connector words), the
+slots that hold letters, and how those slots are grouped into words.
+
+A scramble is then one arrangement per word scattered into a copy of the
+fixed characters, without walking the name again.
+"""
+
+import random
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from letter_arrangements import ArrangementSampler, get_arrangement_sampler
+from scramble_scoring import choose_scramble, default_min_moved
+
+class ScrambleSegment:
+    """Letters scrambled together and the slots they are scattered into"""
+
+    __slots__ = ('letters', 'slots', '_samplers')
+
+    def __init__(self, letters: Tuple[str, ...], slots: Tuple[int, ...]):
+        self.letters = letters
+        self.slots = slots
+        self._samplers: Dict[Optional[int], ArrangementSampler] = {}
+
+    def sampler(self, min_moved: Optional[int]) -> ArrangementSampler:
+        """Get the segment's sampler for a min_moved, fetching it once"""
+        sampler = self._samplers.get(min_moved)
+        if sampler is None:
+            sampler = self._samplers[min_moved] = get_arrangement_sampler(self.letters, min_moved)
+        return sampler
+
+class ScrambleTemplate:
+    """
+    Precompiled scramble layout of one name.
+
+    Simple names scramble all their letters as one segment, digits and
+    spaces staying in place ("1 Corinthians"). Compound names scramble each
+    word separately and leave connector words and words of two characters
+    or fewer untouched ("Song of Songs").
+    """
+
+    __slots__ = ('text', 'segments', '_chars')
+
+    def __init__(self, text: str, compound: bool = False, connector_words: FrozenSet[str] = frozenset()):
+        self.text = text
+        self._chars: Tuple[str, ...] = tuple(text)
+        segments: List[ScrambleSegment] = []
+
+        if compound:
+            start = 0
+            for word in text.split(' '):
+                end = start + len(word)
+                if len(word) > 2 and word.lower() not in connector_words:
+                    slots = tuple(i for i in range(start, end) if text[i].isalpha())
+                    if len(slots) > 1:
+                        segments.append(ScrambleSegment(tuple(text[i] for i in slots), slots))
+                start = end + 1
+        else:
+            slots = tuple(i for i, char in enumerate(text) if char.isalpha())
+            segments.append(ScrambleSegment(tuple(text[i] for i in slots), slots))
+
+        self.segments: Tuple[ScrambleSegment, ...] = tuple(segments)
+        # Build the default samplers now, so the first scramble does no counting
+        for segment in self.segments:
+            segment.sampler(None)
+
+    def scramble(self, rng: random.Random, min_moved: Optional[int] = None,
+                 difficulty: Optional[str] = None) -> str:
+        """
+        Scramble the name.
+
+        Args:
+            rng: Generator to shuffle with
+            min_moved: Fewest letters of each segment that must leave their position
+            difficulty: 'easy', 'medium' or 'hard' to pick from scored candidates
+                instead of drawing uniformly
+
+        Returns:
+            The scrambled name
+        """
+        buffer = list(self._chars)
+        for segment in self.segments:
+            if difficulty is None:
+                arranged = segment.sampler(min_moved).sample(rng)
+            else:
+                moved = min_moved if min_moved is not None else default_min_moved(difficulty, len(segment.letters))
+                arranged = choose_scramble(segment.letters, difficulty, rng, sampler=segment.sampler(moved))
+            for slot, letter in zip(segment.slots, arranged):
+                buffer[slot] = letter
+        return ''.join(buffer)
+
+@lru_cache(maxsize=512)
+def get_scramble_template(text: str, compound: bool = False,
+                          connector_words: FrozenSet[str] = frozenset()) -> ScrambleTemplate:
+    """
+    Get the shared template of a name, compiling it on first use.
+
+    Args:
+        text: The name as displayed
+        compound: Scramble each word separately
+        connector_words: Lowercase words a compound name leaves unscrambled
+
+    Returns:
+        The cached ScrambleTemplate
+    """
+    return ScrambleTemplate(text, compound, connector_words)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Shuffle Bags
+Draws random books without replacement so a player sees every book of a
+selection once before any repeats.
+
+A ShuffleBag deals a shuffled copy of its items one at a time and
+reshuffles when it runs out, taking care that the last book of one round
+is not the first of the next. SessionBags keeps one bag per player
+session and selection on the server, bounded by a session count (least
+recently used sessions are dropped first) and an idle timeout.
+"""
+
+import random
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from bible_books_data import get_book_index
+
+# Sessions kept before the least recently used one is dropped
+MAX_SESSIONS = 10000
+
+# Seconds a session survives without a draw
+SESSION_TTL = 3600
+
+class ShuffleBag:
+    """Random draws without replacement, reshuffled when exhausted"""
+
+    __slots__ = ('items', '_remaining', '_last', '_rng')
+
+    def __init__(self, items: Sequence[str], rng: Optional[random.Random] = None):
+        if not items:
+            raise ValueError("A shuffle bag needs at least one item")
+        self.items = tuple(items)
+        self._remaining: List[str] = []
+        self._last: Optional[str] = None
+        self._rng = rng or random.Random()
+
+    def draw(self) -> str:
+        """
+        Draw the next item.
+
+        Returns:
+            An item not drawn yet in the current round
+        """
+        if not self._remaining:
+            remaining = list(self.items)
+            self._rng.shuffle(remaining)
+            # Draws pop from the end, so keep the previous round's last item away from it
+            if len(remaining) > 1 and remaining[-1] == self._last:
+                remaining[0], remaining[-1] = remaining[-1], remaining[0]
+            self._remaining = remaining
+        self._last = self._remaining.pop()
+        return self._last
+
+    def __len__(self) -> int:
+        """Items left before the next reshuffle"""
+        return len(self._remaining)
+
+class SessionBags:
+    """
+    Per-session shuffle bags for every book selection a player draws from.
+
+    Equivalent filters ('old' and 'ancien', 'Old' and 'old') select the same
+    books and therefore share a bag.
+    """
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS, ttl: float = SESSION_TTL,
+                 clock: Callable[[], float] = time.monotonic):
+        if max_sessions < 1 or ttl <= 0:
+            raise ValueError("Session limit and TTL must be positive")
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._clock = clock
+        self._sessions: 'OrderedDict[str, Tuple[float, Dict[Tuple[str, ...], ShuffleBag]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def new_session_id() -> str:
+        """Create an unguessable session ID"""
+        return secrets.token_urlsafe(12)
+
+    def draw(self, session_id: str, language: str, testament: str = 'any', category: str = 'any') -> str:
+        """
+        Draw the session's next book for a selection.
+
+        Args:
+            session_id: ID of the player's session (unknown IDs start a new session)
+            language: Language name (e.g. 'english' or 'french')
+            testament: 'old'/'ancien', 'new'/'nouveau', or 'any'
+            category: Specific category or 'any'
+
+        Returns:
+            Display name of a book the session has not drawn in this round
+
+        Raises:
+            ValueError: If the filters are unknown or match no books
+        """
+        books = get_book_index(language).selection_table(testament, category)
+        if not books:
+            raise ValueError(f"No books found with criteria: testament={testament}, category={category}")
+
+        now = self._clock()
+        with self._lock:
+            self._expire(now)
+            _, bags = self._sessions.pop(session_id, (now, {}))
+            self._sessions[session_id] = (now, bags)
+            if len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+            bag = bags.get(books)
+            if bag is None:
+                bag = bags[books] = ShuffleBag(books)
+            return bag.draw()
+
+    def _expire(self, now: float) -> None:
+        """Drop sessions idle for longer than the TTL (oldest are first)"""
+        while self._sessions:
+            session_id, (last_used, _) = next(iter(self._sessions.items()))
+            if now - last_used <= self.ttl:
+                break
+            del self._sessions[session_id]
+
+    def __len__(self) -> int:
+        return len(self._sessions)
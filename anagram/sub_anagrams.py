@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Sub-Anagram Search
+Finds every dictionary word that can be built from some of the given
+letters, the core query of a Scrabble- or Boggle-style mode.
+
+The dictionary is stored as a letter-count matrix: one row per word, one
+column per letter a-z plus one per accented or other character that
+appears in the word list. Each word also gets a 26-bit mask of the plain
+letters it contains. A query first keeps the words whose mask fits inside
+the mask of the offered letters and whose length fits, then checks the
+remaining rows' counts against the offered counts in one vectorized
+comparison.
+
+Blank tiles ('?' or '*') stand for any character: a word fits when the
+letters it is missing add up to no more than the blanks. Everything runs
+on NumPy when it is installed, and in plain Python otherwise.
+"""
+
+from string import ascii_lowercase
+from typing import Dict, Iterable, List, Tuple
+
+from word_index import normalize_word
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without NumPy
+    np = None
+
+BLANK_TILES = '?*'
+
+# Words shorter than this are left out of results unless asked for
+MIN_WORD_LENGTH = 2
+
+_MASK_BITS = {letter: 1 << i for i, letter in enumerate(ascii_lowercase)}
+
+def _letter_mask(text: str) -> int:
+    """Get the 26-bit mask of the plain letters in a text"""
+    mask = 0
+    for letter in text:
+        mask |= _MASK_BITS.get(letter, 0)
+    return mask
+
+def _bit_counts():
+    """Get the number of set bits of every 16-bit value"""
+    values = np.arange(1 << 16, dtype=np.uint32)
+    counts = np.zeros(1 << 16, dtype=np.uint8)
+    for bit in range(16):
+        counts += ((values >> bit) & 1).astype(np.uint8)
+    return counts
+
+class LetterMatrix:
+    """
+    Build-once letter-count matrix over a word list.
+
+    Words are kept in (length, word) order so results come out grouped
+    and sorted without further work.
+    """
+
+    def __init__(self, words: Iterable[str]):
+        normalized_words = {word: normalize_word(word) for word in words}
+        self.words: Tuple[str, ...] = tuple(sorted((word for word, normalized in normalized_words.items() if normalized),
+                                                   key=lambda word: (len(normalized_words[word]), word)))
+        normalized = [normalized_words[word] for word in self.words]
+
+        extra = sorted({letter for word in normalized for letter in word} - set(ascii_lowercase))
+        self.columns: Tuple[str, ...] = tuple(ascii_lowercase) + tuple(extra)
+        self._column = {letter: i for i, letter in enumerate(self.columns)}
+
+        self._vectorized = np is not None
+        if not self._vectorized:
+            self._lengths = [len(word) for word in normalized]
+            self._masks = [_letter_mask(word) for word in normalized]
+            self._counts = [self._count(word) for word in normalized]
+            return
+
+        self._lengths = np.fromiter(map(len, normalized), dtype=np.int32, count=len(normalized))
+        # Count every (row, column) pair of the whole list in a single bincount
+        width = len(self.columns)
+        rows = np.repeat(np.arange(len(normalized), dtype=np.int64), self._lengths)
+        columns = np.fromiter((self._column[letter] for word in normalized for letter in word),
+                              dtype=np.int64, count=int(self._lengths.sum()))
+        counts = np.bincount(rows * width + columns, minlength=len(normalized) * width)
+        self._counts = np.minimum(counts, 255).astype(np.uint8).reshape(len(normalized), width)
+        self._masks = (self._counts[:, :26] > 0).astype(np.uint32) @ (np.uint32(1) << np.arange(26, dtype=np.uint32))
+        self._words = np.array(self.words, dtype=object)
+        # Bit counts of 16-bit values, for the blank-tile mask filter
+        self._bits = _bit_counts()
+
+    def _count(self, word: str) -> Dict[int, int]:
+        """Count a word's letters by column"""
+        counts: Dict[int, int] = {}
+        for letter in word:
+            column = self._column[letter]
+            counts[column] = counts.get(column, 0) + 1
+        return counts
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+    def find(self, letters: str, min_length: int = MIN_WORD_LENGTH) -> Dict[int, List[str]]:
+        """
+        Find the words that can be built from some of the letters.
+
+        Args:
+            letters: Available letters, with '?' or '*' for blank tiles
+            min_length: Shortest word to include
+
+        Returns:
+            Dictionary of word length to the words of that length in
+            alphabetical order, longest words first
+        """
+        offered = normalize_word(letters)
+        blanks = sum(offered.count(tile) for tile in BLANK_TILES)
+        offered = ''.join(letter for letter in offered if letter not in BLANK_TILES)
+        if self._vectorized:
+            return self._find_numpy(offered, blanks, min_length)
+        return self._find_python(offered, blanks, min_length)
+
+    def _find_numpy(self, offered: str, blanks: int, min_length: int) -> Dict[int, List[str]]:
+        """Select the fitting rows with NumPy"""
+        available = np.zeros(len(self.columns), dtype=np.uint8)
+        for letter in offered:
+            column = self._column.get(letter)
+            if column is not None and available[column] < 255:
+                available[column] += 1
+
+        # Rows are sorted by length, so the words short enough are one slice
+        first = int(np.searchsorted(self._lengths, min_length, side='left'))
+        last = int(np.searchsorted(self._lengths, len(offered) + blanks, side='right'))
+        outside = self._masks[first:last] & np.uint32(~_letter_mask(offered) & 0x3FFFFFF)
+        if blanks:
+            # Each plain letter missing altogether needs a blank of its own
+            missing = self._bits[outside & 0xFFFF] + self._bits[outside >> 16]
+            rows = first + np.flatnonzero(missing <= blanks)
+            counts = self._counts[rows]
+            shortfall = (np.maximum(counts, available) - available).sum(axis=1, dtype=np.int32)
+            rows = rows[shortfall <= blanks]
+        else:
+            rows = first + np.flatnonzero(outside == 0)
+            rows = rows[(self._counts[rows] <= available).all(axis=1)]
+
+        # Rows are in (length, word) order: split them where the length changes
+        lengths = self._lengths[rows]
+        starts = np.flatnonzero(np.diff(lengths)) + 1
+        groups = zip(np.split(lengths, starts), np.split(self._words[rows], starts))
+        return {int(group_lengths[0]): group.tolist() for group_lengths, group in reversed(list(groups)) if len(group)}
+
+    def _find_python(self, offered: str, blanks: int, min_length: int) -> Dict[int, List[str]]:
+        """Select the fitting rows without NumPy"""
+        available = self._count(''.join(letter for letter in offered if letter in self._column))
+        mask = _letter_mask(offered)
+        longest = len(offered) + blanks
+        groups: Dict[int, List[str]] = {}
+        for row, length in enumerate(self._lengths):
+            if length < min_length or length > longest:
+                continue
+            if not blanks and self._masks[row] & ~mask:
+                continue
+            shortfall = sum(max(count - available.get(column, 0), 0)
+                            for column, count in self._counts[row].items())
+            if shortfall <= blanks:
+                groups.setdefault(length, []).append(self.words[row])
+        return {length: groups[length] for length in sorted(groups, reverse=True)}
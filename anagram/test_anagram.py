@@ -3,7 +3,16 @@
 Test script for the anagram generator
 """
 
+import gzip
+import os
+import random
+import tempfile
+import threading
+import time
+
+import sub_anagrams
 from anagram_generator import AnagramGenerator
+from word_index import MappedWordIndex, build_index
 
 def test_anagram_generator():
     """Test the anagram generator functionality"""
@@ -48,5 +57,205 @@ def test_anagram_generator():
         status = "✓" if result == expected else "✗"
         print(f"{status} '{word1}' and '{word2}' are anagrams: {result} (expected: {expected})")
 
+def test_signature_index():
+    """Test that indexed lookups match a full scan and come back in a stable order"""
+    generator = AnagramGenerator()
+
+    print()
+    print("=== Testing Signature Index ===")
+
+    for language, word_list in [('english', generator.english_words), ('french', generator.french_words)]:
+        mismatches = 0
+        for word in word_list:
+            expected = sorted(candidate for candidate in word_list
+                              if candidate != word and generator._is_anagram(word, candidate))
+            if generator.find_anagrams(word, language) != expected:
+                mismatches += 1
+        status = "✓" if mismatches == 0 else "✗"
+        print(f"{status} {language.title()}: index matches a full scan for all {len(word_list)} words")
+
+    status = "✓" if generator.find_anagrams('Vile', 'french') == ['evil', 'levi', 'live', 'veil'] else "✗"
+    print(f"{status} Results are sorted and exclude the word itself: {generator.find_anagrams('Vile', 'french')}")
+
+def test_word_list_cache():
+    """Test loading word list files through the on-disk index cache"""
+    print()
+    print("=== Testing Word List Cache ===")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'mots.txt.gz')
+        with gzip.open(path, 'wt', encoding='utf-8') as word_file:
+            word_file.write("# Lexique\nchien\nniche\nChine\n\nchien\npomme de terre\n")
+
+        generator = AnagramGenerator()
+        signatures = generator.load_word_list(path, 'french')
+        index = generator._indexes['french']
+        status = "✓" if isinstance(index, MappedWordIndex) and signatures == 2 and index.word_count == 4 else "✗"
+        print(f"{status} Gzipped list indexed: {signatures} signatures, {index.word_count} words")
+        anagrams = generator.find_anagrams('chien', 'french')
+        print(f"{'✓' if anagrams == ['chine', 'niche'] else '✗'} 'chien' -> {anagrams}")
+
+        # A second load maps the cache instead of rebuilding it
+        cache_path = path + '.anagram-index'
+        built = os.path.getmtime(cache_path)
+        generator = AnagramGenerator()
+        generator.load_word_list(path, 'french')
+        status = "✓" if os.path.getmtime(cache_path) == built and generator.find_anagrams('niche', 'french') == ['chien', 'chine'] else "✗"
+        print(f"{status} Unchanged list reuses the cache")
+
+        # Changing the list invalidates the cache
+        with gzip.open(path, 'at', encoding='utf-8') as word_file:
+            word_file.write("hcine\n")
+        generator = AnagramGenerator()
+        generator.load_word_list(path, 'french')
+        anagrams = generator.find_anagrams('chien', 'french')
+        print(f"{'✓' if anagrams == ['chine', 'hcine', 'niche'] else '✗'} Changed list rebuilds the cache: {anagrams}")
+
+        # The word list attributes follow the loaded list and can not be changed behind the index
+        status = "✓" if generator.french_words == {'chien', 'niche', 'chine', 'hcine', 'pomme de terre'} else "✗"
+        print(f"{status} french_words holds the loaded list: {sorted(generator.french_words)}")
+        try:
+            generator.english_words.add('tinsel')
+            print("✗ english_words accepted a word the index would not see")
+        except AttributeError:
+            print("✓ english_words is read-only")
+
+        generator.close()
+
+def test_phrase_anagrams():
+    """Test multi-word phrase anagrams, including the word limit, time budget and cancellation"""
+    generator = AnagramGenerator()
+
+    print()
+    print("=== Testing Phrase Anagrams ===")
+
+    phrases = list(generator.find_phrase_anagrams('Earth Star', 'english'))
+    expected = ['earth arts', 'earth rats', 'earth tars', 'heart arts', 'heart rats', 'heart star', 'heart tars']
+    print(f"{'✓' if phrases == expected else '✗'} 'Earth Star' -> {phrases}")
+
+    # Every phrase uses exactly the input's letters
+    phrases = list(generator.find_phrase_anagrams('teatime', 'english', max_words=3))
+    exact = all(generator._is_anagram(phrase, 'teatime') for phrase in phrases)
+    print(f"{'✓' if phrases and exact else '✗'} All {len(phrases)} phrases for 'teatime' use exactly its letters")
+
+    single = list(generator.find_phrase_anagrams('listen', 'english', max_words=1))
+    print(f"{'✓' if single == ['silent'] else '✗'} One word per phrase matches find_anagrams: {single}")
+
+    # Repeated words are allowed, each combination once
+    index = build_index(['dirty', 'room', 'dormitory', 'to', 'ot'])
+    generator._indexes['english'] = index
+    phrases = list(generator.find_phrase_anagrams('dormitory', 'english', max_words=2))
+    print(f"{'✓' if phrases == ['dirty room'] else '✗'} 'dormitory' -> {phrases}")
+    phrases = list(generator.find_phrase_anagrams('toot', 'english', max_words=2))
+    print(f"{'✓' if phrases == ['ot ot', 'ot to', 'to to'] else '✗'} 'toot' -> {phrases}")
+
+    cancel = threading.Event()
+    cancel.set()
+    cancelled = list(generator.find_phrase_anagrams('dormitory', 'english', cancel=cancel))
+    print(f"{'✓' if cancelled == [] else '✗'} A cancelled search yields nothing")
+
+    # A large dictionary must stop at the time budget
+    rng = random.Random(7)
+    generator._indexes['english'] = build_index(
+        ''.join(rng.choice('aeiounrstl') for _ in range(rng.randint(2, 6))) for _ in range(20000))
+    start = time.perf_counter()
+    found = sum(1 for _ in generator.find_phrase_anagrams('astronomers', 'english', max_words=4, time_budget=0.2))
+    elapsed = time.perf_counter() - start
+    print(f"{'✓' if elapsed < 1.0 else '✗'} Time budget respected: {found} phrases in {elapsed:.2f}s")
+
+def test_sub_anagrams():
+    """Test finding the words built from some of a set of letters, with and without NumPy"""
+    generator = AnagramGenerator()
+
+    print()
+    print("=== Testing Sub-Anagrams ===")
+
+    groups = generator.find_sub_anagrams('Earths', 'english')
+    expected = {5: ['earth', 'heart'], 4: ['arts', 'east', 'eats', 'hate', 'rats', 'sate', 'seat', 'star', 'tars', 'teas'],
+                3: ['art', 'ate', 'eat', 'rat', 'tar', 'tea']}
+    print(f"{'✓' if groups == expected else '✗'} 'Earths' -> {groups}")
+
+    # Same results as checking every word's letters one by one
+    mismatches = 0
+    for letters in ['silent', 'mateyst', 'heartache', 'or']:
+        available = generator._get_letter_count(letters)
+        expected = sorted((word for word in generator.english_words
+                           if len(word) >= 2 and not generator._get_letter_count(word) - available),
+                          key=lambda word: (-len(word), word))
+        found = [word for words in generator.find_sub_anagrams(letters, 'english').values() for word in words]
+        mismatches += found != expected
+    print(f"{'✓' if mismatches == 0 else '✗'} Matches a word-by-word check")
+
+    # Accented letters are separate columns, blanks cover them too
+    exact = generator.find_sub_anagrams('thééa', 'french')
+    blank = generator.find_sub_anagrams('th?', 'french')
+    plain = generator.find_sub_anagrams('thea', 'french')
+    print(f"{'✓' if exact == {3: ['thé']} and blank.get(3) == ['thé'] and 3 not in plain else '✗'} Accented letters: {exact}, {blank}")
+
+    groups = generator.find_sub_anagrams('ta??', 'english', min_length=4)
+    fits = all(sum((generator._get_letter_count(word) - generator._get_letter_count('ta')).values()) <= 2
+               for words in groups.values() for word in words)
+    print(f"{'✓' if groups and fits and set(groups) == {4} else '✗'} Blank tiles: {len(groups.get(4, []))} four-letter words from 'ta??'")
+
+    # The plain Python fallback gives the same answers
+    numpy_module = sub_anagrams.np
+    sub_anagrams.np = None
+    try:
+        fallback = sub_anagrams.LetterMatrix(generator.french_words)
+    finally:
+        sub_anagrams.np = numpy_module
+    vectorized = sub_anagrams.LetterMatrix(generator.french_words)
+    queries = ['pommedeterre', 'raisin??', 'école', 'é*']
+    same = all(fallback.find(query, 1) == vectorized.find(query, 1) for query in queries)
+    print(f"{'✓' if same else '✗'} Python fallback matches the vectorized search")
+
+def test_anagram_cache():
+    """Test the memoized anagram lookups and their invalidation"""
+    print()
+    print("=== Testing Anagram Cache ===")
+
+    generator = AnagramGenerator(cache_size=2)
+    first = generator.find_anagrams('Listen', 'english')
+    first.append('mutated')
+    second = generator.find_anagrams('listen', 'english')
+    info = generator.cache_info()
+    status = "✓" if second == ['silent'] and info['hits'] == 1 and info['misses'] == 1 else "✗"
+    print(f"{status} Repeated lookup is a cache hit and returns a fresh list: {info}")
+
+    anagrams, pick = generator.find_anagrams_and_pick('earth', 'english', random.Random(3))
+    status = "✓" if anagrams == ['heart'] and pick == 'heart' and generator.cache_info()['misses'] == 2 else "✗"
+    print(f"{status} List and random pick come from a single lookup: {anagrams}, {pick}")
+    print(f"{'✓' if generator.find_anagrams_and_pick('zebra', 'english') == ([], None) else '✗'} No anagrams -> ([], None)")
+
+    info = generator.cache_info()
+    print(f"{'✓' if info['size'] == 2 and info['max_size'] == 2 else '✗'} Cache is bounded: {info['size']} entries")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'words.txt')
+        with open(path, 'w', encoding='utf-8') as word_file:
+            word_file.write("silent\nlisten\ntinsel\nenlist\n")
+        generator.find_anagrams('listen', 'english')
+        generator.load_word_list(path, 'english', os.path.join(directory, 'words.idx'))
+        anagrams = generator.find_anagrams('listen', 'english')
+        status = "✓" if anagrams == ['enlist', 'silent', 'tinsel'] else "✗"
+        print(f"{status} Loading a word list invalidates the cache: {anagrams}")
+
+        # Reloading changes the dictionary version again, even for the same language,
+        # and closes the index it replaces
+        previous = generator._indexes['english']
+        with open(path, 'a', encoding='utf-8') as word_file:
+            word_file.write("inlets\n")
+        generator.load_word_list(path, 'english', os.path.join(directory, 'words.idx'))
+        anagrams = generator.find_anagrams('listen', 'english')
+        status = "✓" if anagrams == ['enlist', 'inlets', 'silent', 'tinsel'] else "✗"
+        print(f"{status} Each reload gets a new dictionary version: {anagrams}")
+        print(f"{'✓' if previous._buffer.closed else '✗'} Reloading closes the replaced index")
+        generator.close()
+
 if __name__ == "__main__":
-    test_anagram_generator()
\ No newline at end of file
+    test_anagram_generator()
+    test_signature_index()
+    test_word_list_cache()
+    test_anagram_cache()
+    test_phrase_anagrams()
+    test_sub_anagrams()
\ No newline at end of file
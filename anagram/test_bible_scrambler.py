@@ -3,8 +3,32 @@
 Test script for the Bible Book Scrambler
 """
 
+import io
+import os
+import random
 import re
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import unicodedata
+from collections import Counter
+from datetime import date
 from bible_book_scrambler import BibleBookScrambler
+from book_signatures import SignatureIndex, get_signature_index, name_signature
+from bible_books_data import SpecialHandling, get_bible_books, get_book_index, get_book_by_display_name
+from bulk_generator import BulkReport, generate_bulk, write_puzzles
+from compiled_catalog import check_catalog, get_compiled_catalog
+from daily_puzzle import DailyPuzzles
+from guess_resolver import MAX_EDIT_DISTANCE
+from language_registry import available_languages, get_language
+from letter_arrangements import get_arrangement_sampler
+from puzzle_pool import PuzzlePool
+import scramble_scoring
+from scramble_scoring import DIFFICULTIES, score_scrambles
+from scramble_templates import get_scramble_template
+from shuffle_bag import SessionBags, ShuffleBag
 
 def test_basic_scrambling():
     """Test basic scrambling functionality"""
@@ -317,6 +341,837 @@ def test_all_66_books():
 
     print()
 
+def test_book_index():
+    """Test the build-once book lookup index"""
+    print("=== Testing Book Index ===")
+
+    lookups = [
+        ('Genesis', 'english', 'Genesis'),
+        ('1_samuel', 'english', '1 Samuel'),
+        ('song of solomon', 'english', 'Song of Songs'),
+        ('Apocalypse', 'english', 'Revelation'),
+        ('genèse', 'french', 'Genèse'),
+        ('1 Corinthiens', 'french', '1 Corinthiens')
+    ]
+
+    for name, language, expected in lookups:
+        book_data = get_book_by_display_name(name, language)
+        found = book_data['display_name'] if book_data else None
+        status = "✓" if found == expected else "✗"
+        print(f"  {status} '{name}' ({language}) -> {found}")
+
+    # The index is built once and shared between calls
+    status = "✓" if get_book_index('english') is get_book_index('English') else "✗"
+    print(f"  {status} Index is shared between calls")
+
+    status = "✓" if get_book_by_display_name('Genesis', 'english') is get_book_by_display_name('genesis', 'english') else "✗"
+    print(f"  {status} Lookups return the shared book record")
+
+    print()
+
+def test_book_records():
+    """Test the compact book record representation"""
+    print("=== Testing Book Records ===")
+
+    record = get_book_by_display_name('1 Timothée', 'french')
+    status = "✓" if record.testament.name == 'NEW' and record.special_handling is SpecialHandling.NUMBERED_ACCENTED else "✗"
+    print(f"  {status} Enum fields: {record.testament.name}, {record.special_handling.name}")
+
+    # The dict-compatible view yields the same values as the old dictionaries
+    status = "✓" if record['testament'] == 'nouveau' and record.get('special_handling') == 'numbered_accented' else "✗"
+    print(f"  {status} Dict view: {record.as_dict()}")
+
+    status = "✓" if get_book_by_display_name('Genesis', 'english').get('special_handling') is None else "✗"
+    print(f"  {status} Missing fields behave like a dict")
+
+    try:
+        record.display_name = 'Changed'
+        print("  ✗ Records should be immutable")
+    except AttributeError:
+        print("  ✓ Records are immutable")
+
+    for language in ['english', 'french']:
+        records = get_book_index(language).records
+        in_order = [r.book_number for r in records] == list(range(1, 67))
+        status = "✓" if isinstance(records, tuple) and in_order else "✗"
+        print(f"  {status} {language} catalog is a tuple of {len(records)} records in book order")
+
+    # The legacy catalog helpers hand out the shared read-only view instead of a copy
+    books = get_bible_books('english')
+    status = "✓" if books is get_bible_books('english') and books['genesis']['display_name'] == 'Genesis' else "✗"
+    print(f"  {status} get_bible_books returns the shared index view ({len(books)} books)")
+    try:
+        books['genesis'] = {}
+        print("  ✗ The shared catalog view should be read-only")
+    except TypeError:
+        print("  ✓ The shared catalog view is read-only")
+
+    print()
+
+def test_compiled_catalog():
+    """Test that the compiled catalog file matches the Python source"""
+    print("=== Testing Compiled Catalog ===")
+
+    problems = check_catalog()
+    status = "✓" if not problems else "✗"
+    print(f"  {status} Compiled catalog is up to date {problems if problems else ''}")
+
+    catalog = get_compiled_catalog()
+    for language in ['english', 'french']:
+        records = catalog.records(language) if catalog else None
+        status = "✓" if records == get_book_index(language).records else "✗"
+        print(f"  {status} {language} records decoded from the compiled file")
+
+    # A current catalog serves the spec metadata too, so the data file is never parsed
+    script = ("import json; json.load = None; "
+              "from bible_book_scrambler import BibleBookScrambler; "
+              "print(BibleBookScrambler().get_hint('Genesis', 'english'))")
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)))
+    status = "✓" if result.returncode == 0 and 'Book #1' in result.stdout else "✗"
+    print(f"  {status} Compiled path never parses the data file: {result.stdout.strip() or result.stderr.strip()[-80:]}")
+
+    # An edited data file is served from the source, not the stale compiled section
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.dirname(os.path.abspath(__file__))
+        for name in os.listdir(source):
+            if name.endswith('.py') or name == 'bible_books.catalog':
+                shutil.copy(os.path.join(source, name), directory)
+        shutil.copytree(os.path.join(source, 'languages'), os.path.join(directory, 'languages'))
+        data_path = os.path.join(directory, 'languages', 'english.json')
+        with open(data_path, encoding='utf-8') as data_file:
+            data = data_file.read()
+        with open(data_path, 'w', encoding='utf-8') as data_file:
+            data_file.write(data.replace('"display_name": "Genesis"', '"display_name": "Genesys"'))
+        script = ("from bible_books_data import get_book_index; "
+                  "print(get_book_index('english').by_number[1].display_name)")
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                                cwd=directory).stdout.strip()
+        status = "✓" if output == 'Genesys' else "✗"
+        print(f"  {status} Stale compiled section falls back to the edited data file: {output}")
+
+    # Changing how names are folded invalidates the compiled alias keys as well
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.dirname(os.path.abspath(__file__))
+        for name in os.listdir(source):
+            if name.endswith('.py') or name == 'bible_books.catalog':
+                shutil.copy(os.path.join(source, name), directory)
+        shutil.copytree(os.path.join(source, 'languages'), os.path.join(directory, 'languages'))
+        module_path = os.path.join(directory, 'bible_books_data.py')
+        with open(module_path, encoding='utf-8') as module_file:
+            module = module_file.read()
+        with open(module_path, 'w', encoding='utf-8') as module_file:
+            module_file.write(module.replace("if char.isalnum() and", "if (char.isalnum() or char == ' ') and"))
+        script = ("from compiled_catalog import get_compiled_catalog; "
+                  "from bible_books_data import get_book_index; "
+                  "record = get_book_index('english').lookup('Song of Solomon'); "
+                  "print(get_compiled_catalog().is_current('english'), record and record.book_number)")
+        output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                                cwd=directory).stdout.strip()
+        status = "✓" if output == 'False 22' else "✗"
+        print(f"  {status} Changed name folding falls back to the data file: {output}")
+
+    print()
+
+def test_selection_tables():
+    """Test the precomputed random selection tables"""
+    print("=== Testing Selection Tables ===")
+    scrambler = BibleBookScrambler()
+
+    table = get_book_index('english').selection_table('old', 'gospels')
+    status = "✓" if table is None else "✗"
+    print(f"  {status} Empty filter combination has no table")
+
+    table = get_book_index('french').selection_table('new', 'evangiles')
+    status = "✓" if table == ('Matthieu', 'Marc', 'Luc', 'Jean') else "✗"
+    print(f"  {status} French gospels: {table}")
+
+    book = scrambler.get_random_book('english', 'new', 'gospels')
+    status = "✓" if book in ['Matthew', 'Mark', 'Luke', 'John'] else "✗"
+    print(f"  {status} Random English gospel: '{book}'")
+
+    for testament, category in [('middle', 'any'), ('old', 'poetry'), ('new', 'law')]:
+        try:
+            scrambler.get_random_book('english', testament, category)
+            print(f"  ✗ Should have rejected testament={testament}, category={category}")
+        except ValueError:
+            print(f"  ✓ Rejected testament={testament}, category={category}")
+
+    print()
+
+def test_fuzzy_resolution():
+    """Test typo-tolerant guess resolution"""
+    print("=== Testing Fuzzy Resolution ===")
+    scrambler = BibleBookScrambler()
+
+    typo_tests = [
+        ('Deutoronomy', 'english', 'Deuteronomy'),
+        ('Phillipians', 'english', 'Philippians'),
+        ('Revalation', 'english', 'Revelation'),
+        ('Matthiew', 'french', 'Matthieu'),
+        ('Nonexistent', 'english', None)
+    ]
+
+    for guess, language, expected in typo_tests:
+        match = scrambler.resolve_guess(guess, language)
+        found = match[0] if match else None
+        status = "✓" if found == expected else "✗"
+        print(f"  {status} '{guess}' ({language}) -> {match}")
+
+    status = "✓" if not scrambler.check_solution("", 'Deutoronomy', 'english') else "✗"
+    print(f"  {status} Exact matching stays the default")
+
+    status = "✓" if scrambler.check_solution("", 'Deutoronomy', 'english', fuzzy=True) else "✗"
+    print(f"  {status} Fuzzy check_solution accepts a typo")
+
+    status = "✓" if scrambler.validate_scramble_solution('Philippians', '', 'Phillipians', fuzzy=True) else "✗"
+    print(f"  {status} Fuzzy validate_scramble_solution accepts a typo")
+
+    status = "✓" if not scrambler.validate_scramble_solution('Philippians', '', 'Phillipians', fuzzy=True, max_distance=1) else "✗"
+    print(f"  {status} Edit budget is respected")
+
+    # A different book's exact name is never a typo of the answer
+    for original, guess, language in [('1 Samuel', '2 Samuel', 'english'), ('John', 'Joel', 'english'),
+                                      ('1 Jean', 'Jean', 'french')]:
+        rejected = not scrambler.validate_scramble_solution(original, '', guess, fuzzy=True, language=language)
+        print(f"  {'✓' if rejected else '✗'} Fuzzy '{guess}' is not accepted for '{original}'")
+
+    try:
+        scrambler.validate_scramble_solution('John', '', 'Jon', fuzzy=True, max_distance=MAX_EDIT_DISTANCE + 1)
+        print("  ✗ Edit budget above the resolver's limit should be rejected")
+    except ValueError:
+        print("  ✓ Edit budget above the resolver's limit is rejected")
+
+    print()
+
+def test_accent_insensitive_lookup():
+    """Test accent- and Unicode-insensitive book lookup"""
+    print("=== Testing Accent-Insensitive Lookup ===")
+    scrambler = BibleBookScrambler()
+
+    folded_tests = [
+        ('Levitique', 'Lévitique'),
+        ('Genese', 'Genèse'),
+        ('Ecclesiaste', 'Ecclésiaste'),
+        ('ESAIE', 'Ésaïe'),
+        (unicodedata.normalize('NFD', 'Ézéchiel'), 'Ézéchiel'),
+        ('1-Corinthiens', '1 Corinthiens')
+    ]
+
+    for guess, expected in folded_tests:
+        canonical = scrambler.get_canonical_name(guess, 'french')
+        status = "✓" if canonical == expected else "✗"
+        print(f"  {status} {guess!r} -> {canonical!r}")
+
+    status = "✓" if scrambler.validate_scramble_solution('Lévitique', '', 'levitique') else "✗"
+    print(f"  {status} Unaccented answer validates against 'Lévitique'")
+
+    print()
+
+def test_book_aliases():
+    """Test compiled aliases for numbered books, abbreviations and OSIS IDs"""
+    print("=== Testing Book Aliases ===")
+    scrambler = BibleBookScrambler()
+
+    alias_tests = [
+        ('I Samuel', 'english', '1 Samuel'),
+        ('1Sam', 'english', '1 Samuel'),
+        ('First Kings', 'english', '1 Kings'),
+        ('Gen', 'english', 'Genesis'),
+        ('Mt', 'english', 'Matthew'),
+        ('1Cor', 'english', '1 Corinthians'),
+        ('1 R', 'french', '1 Rois'),
+        ('Premier Rois', 'french', '1 Rois'),
+        ('1Cor', 'french', '1 Corinthiens'),
+        ('Mt', 'french', 'Matthieu')
+    ]
+
+    for alias, language, expected in alias_tests:
+        canonical = scrambler.get_canonical_name(alias, language)
+        status = "✓" if canonical == expected else "✗"
+        print(f"  {status} '{alias}' ({language}) -> {canonical}")
+
+    # Aliases never shadow a real book name
+    status = "✓" if scrambler.get_canonical_name('Job', 'english') == 'Job' else "✗"
+    print(f"  {status} Display names take precedence over aliases")
+
+    print()
+
+def test_language_registry():
+    """Test language discovery and per-language data files"""
+    print("=== Testing Language Registry ===")
+    scrambler = BibleBookScrambler()
+
+    languages = available_languages()
+    status = "✓" if {'english', 'french'} <= set(languages) else "✗"
+    print(f"  {status} Languages discovered: {', '.join(languages)}")
+
+    for language in languages:
+        spec = get_language(language)
+        status = "✓" if len(spec.books) == 66 and len(spec.category_keys) == 9 else "✗"
+        print(f"  {status} {spec.display_name}: {len(spec.books)} books, {len(spec.category_keys)} categories")
+
+    # Localized testament names are accepted as filters in either language
+    book = scrambler.get_random_book('french', 'old')
+    testament = get_book_by_display_name(book, 'french')['testament']
+    status = "✓" if testament == 'ancien' else "✗"
+    print(f"  {status} 'old' filter in French -> {book} ({testament})")
+
+    try:
+        get_language('klingon')
+        print("  ✗ Unsupported language accepted")
+    except ValueError as e:
+        print(f"  ✓ Unsupported language rejected: {e}")
+
+    print()
+
+def test_book_suggestions():
+    """Test prefix autocomplete over book names and aliases"""
+    print("=== Testing Book Suggestions ===")
+    scrambler = BibleBookScrambler()
+
+    suggestion_tests = [
+        ('Jo', 'english', 'Job'),
+        ('jos', 'english', 'Joshua'),
+        ('I Sam', 'english', '1 Samuel'),
+        ('Rev', 'english', 'Revelation'),
+        ('levi', 'french', 'Lévitique'),
+        ('Ep', 'french', 'Éphésiens'),
+        ('1 Co', 'french', '1 Corinthiens')
+    ]
+
+    for prefix, language, expected in suggestion_tests:
+        suggestions = scrambler.suggest_books(prefix, language)
+        status = "✓" if suggestions and suggestions[0] == expected else "✗"
+        print(f"  {status} '{prefix}' ({language}) -> {suggestions[:3]}")
+
+    # Each book is suggested once, and the limit is respected
+    suggestions = scrambler.suggest_books('1', 'english', 5)
+    status = "✓" if len(suggestions) == 5 and len(set(suggestions)) == 5 else "✗"
+    print(f"  {status} '1' limited to 5 distinct books: {suggestions}")
+
+    status = "✓" if scrambler.suggest_books('', 'english') == [] else "✗"
+    print(f"  {status} Empty prefix returns no suggestions")
+
+    status = "✓" if scrambler.suggest_books('xyz', 'english') == [] else "✗"
+    print(f"  {status} Unknown prefix returns no suggestions")
+
+    print()
+
+def test_translation():
+    """Test translating books between languages and bilingual answers"""
+    print("=== Testing Translation ===")
+    scrambler = BibleBookScrambler()
+
+    translation_tests = [
+        ('Genesis', 'english', 'french', 'Genèse'),
+        ('Lévitique', 'french', 'english', 'Leviticus'),
+        ('Levitique', 'french', 'english', 'Leviticus'),
+        ('1 Sam', 'english', 'french', '1 Samuel'),
+        ('Song of Solomon', 'english', 'french', 'Cantique des Cantiques'),
+        ('Apocalypse', 'french', 'english', 'Revelation'),
+        ('Revelation', 'english', 'english', 'Revelation')
+    ]
+
+    for book, from_language, to_language, expected in translation_tests:
+        translated = scrambler.translate(book, from_language, to_language)
+        status = "✓" if translated == expected else "✗"
+        print(f"  {status} {book} ({from_language}) -> {translated} ({to_language})")
+
+    status = "✓" if scrambler.translate('Not a Book', 'english', 'french') is None else "✗"
+    print(f"  {status} Unknown book translates to None")
+
+    # Every book has a counterpart in every language
+    records = scrambler.get_book_records('english')
+    languages = available_languages()
+    complete = all(len(scrambler.get_translations(record.display_name, 'english')) == len(languages)
+                   for record in records)
+    print(f"  {'✓' if complete else '✗'} All 66 books have a name in {', '.join(languages)}")
+
+    bilingual_tests = [
+        ('Genèse', 'Genesis', 'french', True),
+        ('Genèse', 'Genese', 'french', True),
+        ('Exodus', 'Exode', 'english', True),
+        ('Exodus', 'Genèse', 'english', False)
+    ]
+
+    for original, guess, language, expected in bilingual_tests:
+        result = scrambler.validate_bilingual_solution(original, guess, language)
+        status = "✓" if result == expected else "✗"
+        print(f"  {status} '{guess}' for {original} ({language}): {result}")
+
+    # Another book spelled by a real scramble is accepted in bilingual mode too ('Lam' and 'Mal'
+    # are aliases of Lamentations and Malachi); a scramble of other letters is ignored
+    for original, scrambled, expected in [('Lam', 'Mla', True), ('Lam', '', False), ('Lamentations', 'Mla', False)]:
+        result = scrambler.validate_bilingual_solution(original, 'Mal', 'english', scrambled=scrambled)
+        status = "✓" if result == expected else "✗"
+        print(f"  {status} 'Mal' for {original} scrambled as '{scrambled}': {result}")
+
+    print()
+
+def test_seeded_puzzles():
+    """Test seeded scrambles and puzzle IDs"""
+    print("=== Testing Seeded Puzzles ===")
+    scrambler = BibleBookScrambler()
+
+    # The same seed always gives the same scramble and book
+    for book, language in [('Genesis', 'english'), ('Song of Solomon', 'english'), ('Lévitique', 'french')]:
+        first = scrambler.generate_scramble(book, language, rng=1234)
+        second = scrambler.generate_scramble(book, language, rng=random.Random(1234))
+        status = "✓" if first == second else "✗"
+        print(f"  {status} {book} with seed 1234 -> {first} / {second}")
+
+    picks = {scrambler.get_random_book('english', rng=99) for _ in range(5)}
+    status = "✓" if len(picks) == 1 else "✗"
+    print(f"  {status} Seeded random book is stable: {picks}")
+
+    # Puzzles round-trip through their IDs
+    for language in ['english', 'french']:
+        puzzle = scrambler.create_puzzle(language)
+        replayed = scrambler.get_puzzle(puzzle['puzzle_id'])
+        status = "✓" if replayed == puzzle else "✗"
+        print(f"  {status} {puzzle['puzzle_id']} -> {replayed['scrambled']} ({replayed['original']})")
+
+    status = "✓" if scrambler.create_puzzle('english', seed=7) == scrambler.create_puzzle('english', seed=7) else "✗"
+    print(f"  {status} Puzzles with the same seed match")
+
+    for puzzle_id in ['english-67-1', 'klingon-1-1', 'english-1', 'english-1-xyz']:
+        try:
+            scrambler.get_puzzle(puzzle_id)
+            print(f"  ✗ '{puzzle_id}' accepted")
+        except ValueError as e:
+            print(f"  ✓ '{puzzle_id}' rejected: {e}")
+
+    print()
+
+def test_letter_arrangements():
+    """Test uniform multiset scrambling with a minimum number of moved letters"""
+    print("=== Testing Letter Arrangements ===")
+    scrambler = BibleBookScrambler()
+    rng = random.Random(2024)
+
+    # By default (medium difficulty) no letter stays in its original position
+    for book, language in [('Numbers', 'english'), ('Ecclesiastes', 'english'), ('Deuteronomy', 'english'),
+                           ('1 Thessaloniciens', 'french')]:
+        scrambles = [scrambler.generate_scramble(book, language, rng=rng) for _ in range(50)]
+        fixed = max(sum(a == b and a.isalpha() for a, b in zip(book, scrambled)) for scrambled in scrambles)
+        same_letters = all(sorted(scrambled) == sorted(book) for scrambled in scrambles)
+        status = "✓" if fixed == 0 and same_letters else "✗"
+        print(f"  {status} {book} -> {scrambles[0]} (at most {fixed} letters in place in 50 scrambles)")
+
+    # Easy scrambles may keep letters in place, but still move at least half of them
+    scrambles = [scrambler.generate_scramble('Deuteronomy', 'english', 'easy', rng=rng) for _ in range(100)]
+    moved = min(sum(a != b for a, b in zip('Deuteronomy', scrambled)) for scrambled in scrambles)
+    status = "✓" if moved >= 6 else "✗"
+    print(f"  {status} Easy Deuteronomy: fewest moved in 100 scrambles = {moved}")
+
+    # A looser constraint moves at least the requested number of letters
+    scrambles = [scrambler.generate_scramble('Leviticus', 'english', 'easy', rng=rng, min_moved=3) for _ in range(200)]
+    moved = min(sum(a != b for a, b in zip('Leviticus', scrambled)) for scrambled in scrambles)
+    status = "✓" if moved >= 3 else "✗"
+    print(f"  {status} min_moved=3 on Leviticus: fewest moved in 200 scrambles = {moved}")
+
+    # Every valid arrangement is equally likely: 'abcd' has 9 derangements
+    counts = Counter(''.join(get_arrangement_sampler(tuple('abcd')).sample(rng)) for _ in range(9000))
+    status = "✓" if len(counts) == 9 and min(counts.values()) > 850 and max(counts.values()) < 1150 else "✗"
+    print(f"  {status} Derangements of 'abcd' drawn uniformly: {sorted(counts.values())}")
+
+    # Letters filling more than half the word can not all move
+    sampler = get_arrangement_sampler(tuple('abb'))
+    status = "✓" if sampler.min_moved == 2 and sampler.total == 2 else "✗"
+    print(f"  {status} 'abb' relaxes to {sampler.min_moved} moved letters ({sampler.total} arrangements)")
+
+    # Many distinct letters skip the counting table and draw by rejection
+    letters = tuple('abcdefghijklmnopqrst')
+    started = time.perf_counter()
+    sampler = get_arrangement_sampler(letters)
+    arranged = [sampler.sample(rng) for _ in range(200)]
+    elapsed = time.perf_counter() - started
+    fixed = max(sum(a == b for a, b in zip(letters, draw)) for draw in arranged)
+    status = "✓" if sampler.total is None and fixed == 0 and elapsed < 0.5 else "✗"
+    print(f"  {status} 20 distinct letters: 200 derangements in {elapsed * 1000:.1f} ms")
+
+    # Samplers of one word share their counts across min_moved values
+    memo = get_arrangement_sampler(tuple('Deuteronomy'))._memo
+    memo_size = len(memo)
+    status = "✓" if get_arrangement_sampler(tuple('Deuteronomy'), 4)._memo is memo and memo_size else "✗"
+    print(f"  {status} 'Deuteronomy' samplers share {memo_size} counted states")
+
+    print()
+
+def test_scramble_templates():
+    """Test precompiled per-name scramble layouts"""
+    print("=== Testing Scramble Templates ===")
+    rng = random.Random(16)
+
+    # Digits and spaces are fixed; all letters form one segment
+    template = get_scramble_template('1 Corinthians')
+    status = "✓" if len(template.segments) == 1 and template.segments[0].slots[0] == 2 else "✗"
+    print(f"  {status} '1 Corinthians' has one segment of {len(template.segments[0].slots)} letters")
+    scrambled = template.scramble(rng)
+    status = "✓" if scrambled[:2] == '1 ' and sorted(scrambled) == sorted('1 Corinthians') else "✗"
+    print(f"  {status} Scattered into place: {scrambled}")
+
+    # Compound names get one segment per scrambled word; connector words stay fixed
+    template = get_scramble_template('Cantique des Cantiques', True, get_language('french').connector_words)
+    words = [''.join(template.text[i] for i in segment.slots) for segment in template.segments]
+    scrambled = template.scramble(rng, difficulty='hard')
+    status = "✓" if words == ['Cantique', 'Cantiques'] and scrambled.split()[1] == 'des' else "✗"
+    print(f"  {status} Compound segments {words}: {scrambled}")
+
+    # Templates are compiled once and shared
+    status = "✓" if get_scramble_template('1 Corinthians') is get_scramble_template('1 Corinthians') else "✗"
+    print(f"  {status} Templates are cached per name")
+
+    # Difficulty scrambles use the segment's own samplers instead of looking them up again
+    template = get_scramble_template('1 Corinthians')
+    lookup = scramble_scoring.get_arrangement_sampler
+    scramble_scoring.get_arrangement_sampler = None
+    try:
+        scrambled = [template.scramble(rng, difficulty=difficulty) for difficulty in DIFFICULTIES]
+        print(f"  ✓ Difficulty scrambles reuse the segment samplers: {scrambled}")
+    except TypeError:
+        print("  ✗ Difficulty scrambles looked their sampler up again")
+    finally:
+        scramble_scoring.get_arrangement_sampler = lookup
+
+    print()
+
+def test_ambiguity_guard():
+    """Test that scrambles never spell a book name and ambiguous puzzles list every answer"""
+    print("=== Testing Ambiguity Guard ===")
+    scrambler = BibleBookScrambler()
+    signatures = get_signature_index()
+
+    # Swapping identical letters of different case used to hand out the answer itself
+    for book, language, difficulty in [('Titus', 'english', 'medium'), ('Osée', 'french', 'easy'),
+                                       ('Ésaïe', 'french', 'medium')]:
+        spelled = [scrambler.generate_scramble(book, language, difficulty, rng=seed) for seed in range(200)]
+        spelled = [scrambled for scrambled in spelled if get_signature_index(language).is_name(scrambled)]
+        status = "✓" if not spelled else "✗"
+        print(f"  {status} {book} ({difficulty}): {len(spelled)} of 200 scrambles spell a book name")
+
+    # Scrambling an English book builds the English index only
+    script = ("import language_registry; from bible_book_scrambler import BibleBookScrambler; "
+              "BibleBookScrambler().generate_scramble('Titus', 'english', 'medium', rng=1); "
+              "print(sorted(language_registry._LANGUAGES))")
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    status = "✓" if output == "['english']" else "✗"
+    print(f"  {status} Scrambling in English loads only English: {output}")
+
+    # Digits are part of the signature, so numbered books are not anagrams of each other
+    status = "✓" if name_signature('1 John') != name_signature('2 John') else "✗"
+    print(f"  {status} '1 John' and '2 John' have different signatures")
+
+    # 'Lam' and 'Mal' are aliases of Lamentations and Malachi
+    books = {record.book_number for record in signatures.books_spelled_by('Mla')}
+    status = "✓" if books == {25, 39} and signatures.spells('Mla', 'Mal') else "✗"
+    print(f"  {status} 'Mla' spells books {sorted(books)}")
+
+    # An index with two anagram names makes puzzles of either book ambiguous
+    genesis = get_book_by_display_name('Genesis', 'english')
+    exodus = get_book_by_display_name('Exodus', 'english')
+    index = SignatureIndex([('genesis', genesis), ('seenigs', exodus)])
+    status = "✓" if [record.book_number for record in index.books_spelled_by('Genesis')] == [1, 2] else "✗"
+    print(f"  {status} Anagram names share a signature")
+
+    puzzle = scrambler.create_puzzle('english', seed=17)
+    status = "✓" if puzzle['answers'] == [puzzle['original']] and not puzzle['ambiguous'] else "✗"
+    print(f"  {status} {puzzle['original']} has a single answer")
+
+    # Another book spelled by a real scramble is accepted as well: 'Mla' scrambles the alias 'Lam'
+    status = "✓" if scrambler.validate_scramble_solution('Lam', 'Mla', 'Malachi') is False and \
+        scrambler.validate_scramble_solution('Lam', 'Mla', 'mal') else "✗"
+    print(f"  {status} Any book name spelled by the scramble is accepted")
+
+    # A scramble that is not made of the original's letters proves nothing
+    status = "✓" if not scrambler.validate_scramble_solution('Lamentations', 'Mal', 'Mal') else "✗"
+    print(f"  {status} Forged scramble 'Mal' for Lamentations rejected")
+
+    print()
+
+def test_solver():
+    """Test finding the book a scramble came from"""
+    print("=== Testing Scramble Solver ===")
+    scrambler = BibleBookScrambler()
+
+    # Every generated scramble solves back to its book
+    unsolved = []
+    for language in available_languages():
+        for book in scrambler.get_all_books_list(language):
+            scrambled = scrambler.generate_scramble(book, language, rng=18)
+            books = [solution['book'] for solution in scrambler.solve(scrambled, language, max_distance=0)]
+            if book not in books:
+                unsolved.append(scrambled)
+    status = "✓" if not unsolved else "✗"
+    print(f"  {status} Every scramble solves to its book ({len(unsolved)} unsolved)")
+
+    # Digits must match; accents and case are ignored
+    solutions = scrambler.solve('2 hnoJ', 'english')
+    status = "✓" if [s['book'] for s in solutions] == ['2 John'] else "✗"
+    print(f"  {status} '2 hnoJ' -> {[s['book'] for s in solutions]}")
+    solutions = scrambler.solve('ESEGNE', 'french')
+    status = "✓" if [s['book'] for s in solutions] == ['Genèse'] else "✗"
+    print(f"  {status} 'ESEGNE' -> {[s['book'] for s in solutions]}")
+
+    # Spacing is ignored like case: a scramble typed without its space still solves
+    solutions = scrambler.solve('2hnoJ', 'english', max_distance=0)
+    status = "✓" if [s['book'] for s in solutions] == ['2 John'] else "✗"
+    print(f"  {status} '2hnoJ' -> {[s['book'] for s in solutions]}")
+
+    # Noisy input finds the closest book
+    solutions = scrambler.solve('Dueteronomyy', 'english')
+    status = "✓" if solutions and solutions[0]['book'] == 'Deuteronomy' and solutions[0]['distance'] == 1 else "✗"
+    print(f"  {status} 'Dueteronomyy' -> {solutions[0]['book'] if solutions else None}")
+    status = "✓" if not scrambler.solve('Dueteronomyy', 'english', max_distance=0) else "✗"
+    print(f"  {status} max_distance=0 only accepts exact letters")
+
+    # Short abbreviations are not solved against: 'abc' is not Acts by way of 'Ac'
+    solutions = [s['book'] for s in scrambler.solve('abc')] + [s['book'] for s in scrambler.solve('mla', 'english')]
+    status = "✓" if not solutions else "✗"
+    print(f"  {status} 'abc' and 'mla' match no abbreviation: {solutions}")
+
+    # Without a language every language is searched
+    languages = {s['language'] for s in scrambler.solve('boJ')}
+    status = "✓" if languages == set(available_languages()) else "✗"
+    print(f"  {status} 'boJ' matches in {sorted(languages)}")
+
+    print()
+
+def test_daily_puzzle():
+    """Test that the puzzle of the day is the same everywhere and rolls over at midnight"""
+    print("=== Testing Daily Puzzle ===")
+    day = date(2026, 4, 5)
+    first = DailyPuzzles(BibleBookScrambler(), 'America/Montreal', key='test-key').get('english', 'hard', day)
+    second = DailyPuzzles(BibleBookScrambler(), 'Europe/Paris', key='test-key').get('English', 'HARD', day)
+    status = "✓" if first == second and first['date'] == '2026-04-05' else "✗"
+    print(f"  {status} Independent instances agree: {first['puzzle_id']}")
+
+    # Another process (with a different hash seed) computes the same puzzle
+    script = ("from datetime import date; from daily_puzzle import DailyPuzzles; "
+              "from bible_book_scrambler import BibleBookScrambler; "
+              "print(DailyPuzzles(BibleBookScrambler(), key='test-key').get('english', 'hard', date(2026, 4, 5))['puzzle_id'])")
+    environment = dict(os.environ, PYTHONHASHSEED='123')
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), env=environment).stdout.strip()
+    status = "✓" if output == first['puzzle_id'] else "✗"
+    print(f"  {status} Separate process agrees: {output}")
+
+    other_key = DailyPuzzles(BibleBookScrambler(), key='other-key').get('english', 'hard', day)
+    other_day = DailyPuzzles(BibleBookScrambler(), key='test-key').get('english', 'hard', date(2026, 4, 6))
+    status = "✓" if other_key['puzzle_id'] != first['puzzle_id'] != other_day['puzzle_id'] else "✗"
+    print(f"  {status} The key and the date change the puzzle")
+
+    # Today's puzzles are cached until the day changes
+    daily = DailyPuzzles(BibleBookScrambler())
+    today = daily.get('french')
+    status = "✓" if daily.get('french') is today and today['date'] == daily.today().isoformat() else "✗"
+    print(f"  {status} Today's puzzle is cached ({today['date']})")
+    daily._day = date(2000, 1, 1)
+    status = "✓" if daily.get('french') is not today and daily.get('french') == today else "✗"
+    print(f"  {status} Cache is dropped at rollover ({daily.seconds_until_rollover()}s until the next one)")
+
+    try:
+        DailyPuzzles(BibleBookScrambler(), 'Mars/Olympus')
+        print("  ✗ Unknown timezone accepted")
+    except ValueError:
+        print("  ✓ Unknown timezone rejected")
+
+    print()
+
+def test_shuffle_bags():
+    """Test that random books do not repeat until every book has been drawn"""
+    print("=== Testing Shuffle Bags ===")
+    books = get_book_index('english').selection_table('new', 'any')
+
+    # One round deals every book once; rounds never repeat across the boundary
+    bag = ShuffleBag(books, random.Random(20))
+    draws = [bag.draw() for _ in range(len(books) * 50)]
+    rounds = [draws[i:i + len(books)] for i in range(0, len(draws), len(books))]
+    status = "✓" if all(sorted(r) == sorted(books) for r in rounds) else "✗"
+    print(f"  {status} Each round of {len(books)} draws covers every book once")
+    repeats = sum(a == b for a, b in zip(draws, draws[1:]))
+    print(f"  {'✓' if repeats == 0 else '✗'} No book drawn twice in a row over 50 rounds")
+
+    # Sessions are independent; equivalent filters share a bag
+    bags = SessionBags()
+    french = [bags.draw('alice', 'french', 'ancien') for _ in range(20)] + \
+        [bags.draw('alice', 'french', 'old') for _ in range(19)]
+    status = "✓" if len(set(french)) == 39 and len(bags) == 1 else "✗"
+    print(f"  {status} 'ancien' and 'old' draw from the same bag ({len(set(french))} distinct)")
+    bags.draw('bob', 'english')
+    print(f"  {'✓' if len(bags) == 2 else '✗'} Each session has its own bags")
+
+    # Least recently used sessions are dropped first, idle ones after the TTL
+    clock = [0.0]
+    bags = SessionBags(max_sessions=2, ttl=60, clock=lambda: clock[0])
+    for session_id in ('a', 'b', 'a', 'c'):
+        bags.draw(session_id, 'english')
+    status = "✓" if list(bags._sessions) == ['a', 'c'] else "✗"
+    print(f"  {status} LRU bound keeps {list(bags._sessions)}")
+    clock[0] = 100.0
+    bags.draw('d', 'english')
+    print(f"  {'✓' if list(bags._sessions) == ['d'] else '✗'} Idle sessions expire after the TTL")
+
+    # Puzzles for a drawn book still replay from their IDs
+    scrambler = BibleBookScrambler()
+    puzzle = scrambler.create_book_puzzle('Jude', 'english', seed=20, difficulty='hard')
+    status = "✓" if scrambler.get_puzzle(puzzle['puzzle_id']) == puzzle and puzzle['original'] == 'Jude' else "✗"
+    print(f"  {status} Book puzzle replays from {puzzle['puzzle_id']}")
+
+    try:
+        bags.draw('d', 'english', 'middle')
+        print("  ✗ Unknown testament accepted")
+    except ValueError:
+        print("  ✓ Unknown testament rejected")
+
+    print()
+
+def test_difficulty_levels():
+    """Test difficulty scoring and difficulty-banded scrambles"""
+    print("=== Testing Difficulty Levels ===")
+    scrambler = BibleBookScrambler()
+
+    # Scores fall as scrambles drift from the original
+    letters = list('Deuteronomy')
+    candidates = [letters, list('Deutoronemy'), list('uyDmreeonto')]
+    scores = score_scrambles(letters, candidates)
+    status = "✓" if scores[0] > scores[1] > scores[2] else "✗"
+    print(f"  {status} Ease scores: {[round(score, 2) for score in scores]}")
+
+    # The plain Python scorer agrees with the vectorized one
+    python_scores = scramble_scoring._score_python(*scramble_scoring._encode(letters, candidates))
+    status = "✓" if all(abs(a - b) < 1e-9 for a, b in zip(scores, python_scores)) else "✗"
+    print(f"  {status} Python fallback matches ({'NumPy' if scramble_scoring._get_numpy() is not None else 'no NumPy'})")
+
+    # NumPy is only imported once a batch is scored
+    script = "import sys, bible_book_scrambler; print('numpy' in sys.modules)"
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    print(f"  {'✓' if output == 'False' else '✗'} Importing the scrambler does not import NumPy")
+
+    # Easier levels keep more of the original word
+    averages = {}
+    for difficulty in DIFFICULTIES:
+        book_scores = []
+        for seed in range(30):
+            scrambled = scrambler.generate_scramble('Lamentations', 'english', difficulty, rng=seed)
+            book_scores.extend(score_scrambles(list('Lamentations'), [list(scrambled)]))
+        averages[difficulty] = sum(book_scores) / len(book_scores)
+    status = "✓" if averages['easy'] > averages['medium'] > averages['hard'] else "✗"
+    print(f"  {status} Average ease: " + ", ".join(f"{d} {averages[d]:.2f}" for d in DIFFICULTIES))
+
+    puzzle = scrambler.create_puzzle('french', difficulty='hard', seed=42)
+    status = "✓" if puzzle['puzzle_id'].endswith('-h') and scrambler.get_puzzle(puzzle['puzzle_id']) == puzzle else "✗"
+    print(f"  {status} Hard puzzle round-trips: {puzzle['puzzle_id']} -> {puzzle['scrambled']}")
+
+    try:
+        scrambler.generate_scramble('Genesis', 'english', 'impossible')
+        print("  ✗ Unknown difficulty accepted")
+    except ValueError as e:
+        print(f"  ✓ Unknown difficulty rejected: {e}")
+
+    print()
+
+def test_bulk_generation():
+    """Test deterministic bulk puzzle generation and streaming output"""
+    print("=== Testing Bulk Generation ===")
+    scrambler = BibleBookScrambler()
+
+    inline = list(generate_bulk('english', 40, difficulty='hard', master_seed=11, workers=1))
+    pooled = list(generate_bulk('english', 40, difficulty='hard', master_seed=11, workers=2, chunk_size=7))
+    status = "✓" if inline == pooled and len(inline) == 40 else "✗"
+    print(f"  {status} Same master seed, same 40 puzzles with 1 or 2 workers")
+
+    replayed = all(scrambler.get_puzzle(puzzle['puzzle_id']) == puzzle for puzzle in inline[:5])
+    print(f"  {'✓' if replayed else '✗'} Bulk puzzles replay from their IDs")
+
+    testament_ok = all(get_book_by_display_name(puzzle['original'], 'french')['testament'] == 'nouveau'
+                       for puzzle in generate_bulk('french', 20, testament='nouveau', workers=1))
+    print(f"  {'✓' if testament_ok else '✗'} Testament filter applies to every puzzle")
+
+    for output_format in ['jsonl', 'csv']:
+        stream = io.StringIO()
+        written = write_puzzles(iter(inline[:3]), stream, output_format)
+        lines = stream.getvalue().splitlines()
+        expected_lines = 3 if output_format == 'jsonl' else 4
+        status = "✓" if written == 3 and len(lines) == expected_lines else "✗"
+        print(f"  {status} {output_format}: {written} puzzles, {len(lines)} lines")
+
+    report = BulkReport()
+    list(generate_bulk('english', 10, workers=1, report=report))
+    status = "✓" if report.count == 10 and report.puzzles_per_second > 0 else "✗"
+    print(f"  {status} Report: {report}")
+
+    print()
+
+def test_puzzle_pool():
+    """Test background-refilled puzzle pools"""
+    print("=== Testing Puzzle Pool ===")
+    scrambler = BibleBookScrambler()
+    pool = PuzzlePool(scrambler, low=2, high=5)
+
+    try:
+        first = pool.get('english', 'old', 'hard')
+        status = "✓" if pool.misses == 1 and first['difficulty'] == 'hard' else "✗"
+        print(f"  {status} Empty pool generates inline: {first['puzzle_id']}")
+
+        # The refill thread tops the pool up to its high watermark
+        deadline = time.time() + 5
+        while pool.stats()['pools'].get('english/old/hard', 0) < 5 and time.time() < deadline:
+            time.sleep(0.01)
+        depth = pool.stats()['pools'].get('english/old/hard', 0)
+        print(f"  {'✓' if depth == 5 else '✗'} Pool refilled to {depth}")
+
+        # Equivalent testament names share a pool
+        puzzle = pool.get('english', 'Old', 'HARD')
+        testament = get_book_by_display_name(puzzle['original'], 'english')['testament']
+        status = "✓" if pool.hits == 1 and testament == 'old' else "✗"
+        print(f"  {status} Pooled puzzle served as a hit: {puzzle['original']} ({testament})")
+
+        status = "✓" if scrambler.get_puzzle(puzzle['puzzle_id']) == puzzle else "✗"
+        print(f"  {status} Pooled puzzles replay from their IDs")
+
+        try:
+            pool.get('english', 'middle')
+            print("  ✗ Invalid testament accepted")
+        except ValueError:
+            status = "✓" if len(pool.stats()['pools']) == 1 else "✗"
+            print(f"  {status} Invalid testament rejected without creating a pool")
+
+        # No-repeat sessions pick the book; every book of the language gets a small pool
+        puzzle = pool.get_book('Ruth', 'english', 'easy')
+        status = "✓" if puzzle['original'] == 'Ruth' and pool.misses == 2 else "✗"
+        print(f"  {status} Empty book pool generates inline: {puzzle['puzzle_id']}")
+        deadline = time.time() + 5
+        while pool.stats()['book_pools'].get('english/easy', 0) < 66 * pool.book_high and time.time() < deadline:
+            time.sleep(0.01)
+        ready = pool.stats()['book_pools'].get('english/easy', 0)
+        print(f"  {'✓' if ready == 66 * pool.book_high else '✗'} Every book's pool refilled: {ready} puzzles ready")
+
+        puzzle = pool.get_book('Jonah', 'english', 'easy')
+        status = "✓" if puzzle['original'] == 'Jonah' and pool.hits == 2 and puzzle['difficulty'] == 'easy' else "✗"
+        print(f"  {status} Book puzzle served as a hit: {puzzle['scrambled']}")
+    finally:
+        pool.stop(timeout=5)
+
+    # Importing the app starts no refill thread; the first request prefills the configured
+    # languages, including the per-book pools the web UI draws from
+    script = ("import threading, language_registry; from web.app import app, puzzle_pool; "
+              "before = [thread.name for thread in threading.enumerate()]; "
+              "app.test_client().get('/api/pool-stats'); "
+              "books = sum(key[:1] + key[2:] == ('english', 'medium') for key in puzzle_pool._book_pools); "
+              "print(before, sorted(language_registry._LANGUAGES), puzzle_pool._thread.is_alive(), books); "
+              "puzzle_pool.stop(timeout=5)")
+    output = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True,
+                            cwd=os.path.dirname(os.path.abspath(__file__)),
+                            env=dict(os.environ, PUZZLE_POOL_LANGUAGES='english')).stdout.strip()
+    status = "✓" if output == "['MainThread'] ['english'] True 66" else "✗"
+    print(f"  {status} Pool prefilled on the first request: {output}")
+
+    print()
+
 def main():
     """Run all tests"""
     print("🔬 Bible Book Scrambler Test Suite")
@@ -332,6 +1187,26 @@ def main():
     test_random_book_selection()
     test_edge_cases()
     test_all_66_books()
+    test_book_index()
+    test_book_records()
+    test_compiled_catalog()
+    test_selection_tables()
+    test_fuzzy_resolution()
+    test_accent_insensitive_lookup()
+    test_book_aliases()
+    test_language_registry()
+    test_book_suggestions()
+    test_translation()
+    test_seeded_puzzles()
+    test_letter_arrangements()
+    test_scramble_templates()
+    test_ambiguity_guard()
+    test_solver()
+    test_daily_puzzle()
+    test_shuffle_bags()
+    test_difficulty_levels()
+    test_bulk_generation()
+    test_puzzle_pool()
 
     print("=" * 50)
     print("✅ Test suite completed!")
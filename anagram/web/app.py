@@ -6,16 +6,56 @@ Web interface for the Bible book scrambling game.
 
 import sys
 import os
+import threading
 
 # Add the parent anagram directory to the Python path so we can import the Bible scrambler
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 
 from flask import Flask, render_template, request, jsonify
 from bible_book_scrambler import BibleBookScrambler
+from book_suggester import MAX_SUGGESTIONS
+from daily_puzzle import DailyPuzzles
+from guess_resolver import MAX_EDIT_DISTANCE
+from language_registry import is_supported_language, language_error_message
+from puzzle_pool import HIGH_WATERMARK, LOW_WATERMARK, PuzzlePool
+from shuffle_bag import MAX_SESSIONS, SESSION_TTL, SessionBags
 
 app = Flask(__name__)
 scrambler = BibleBookScrambler()
 
+# Random challenges are served from pre-generated pools refilled in the background
+puzzle_pool = PuzzlePool(
+    scrambler,
+    low=int(os.environ.get('PUZZLE_POOL_LOW', LOW_WATERMARK)),
+    high=int(os.environ.get('PUZZLE_POOL_HIGH', HIGH_WATERMARK))
+)
+# Pools filled ahead of traffic; the others are registered on their first miss
+POOL_LANGUAGES = [language.strip().lower()
+                  for language in os.environ.get('PUZZLE_POOL_LANGUAGES', 'english').split(',') if language.strip()]
+for pool_language in POOL_LANGUAGES:
+    if not is_supported_language(pool_language):
+        raise ValueError(f"PUZZLE_POOL_LANGUAGES: {language_error_message()}, not '{pool_language}'")
+_pool_prefilled = threading.Event()
+
+# Players who opt out of repeats draw from a per-session shuffle bag
+session_bags = SessionBags(
+    max_sessions=int(os.environ.get('SHUFFLE_BAG_SESSIONS', MAX_SESSIONS)),
+    ttl=float(os.environ.get('SHUFFLE_BAG_TTL', SESSION_TTL))
+)
+
+# Every worker derives the same puzzle of the day from the date; no shared store
+daily_puzzles = DailyPuzzles.from_environment(scrambler)
+
+@app.before_request
+def prefill_puzzle_pool():
+    """Prefill the pools on the first request, so importing the app starts no thread"""
+    if not _pool_prefilled.is_set():
+        _pool_prefilled.set()
+        for language in POOL_LANGUAGES:
+            # The web UI always asks for no repeats, so it draws from the per-book pools
+            puzzle_pool.prefill_books(language)
+            puzzle_pool.prefill(language)
+
 @app.route('/')
 def index():
     """Main game interface"""
@@ -28,22 +68,42 @@ def random_challenge():
         data = request.get_json()
         language = data.get('language', 'english')
         testament = data.get('testament', 'any')
-
-        # Get random book
-        random_book = scrambler.get_random_book(language, testament)
-
-        # Generate scramble
-        scrambled = scrambler.generate_scramble(random_book, language)
-
-        # Get hint
-        hint = scrambler.get_hint(random_book, language)
-
-        return jsonify({
+        difficulty = data.get('difficulty', 'medium')
+
+        # Seeded challenges are generated on demand; others come from the pool,
+        # per book for no-repeat sessions. Either way the puzzle ID regenerates
+        # the same puzzle
+        seed = data.get('seed')
+        session_id = None
+        if seed is not None:
+            puzzle = scrambler.create_puzzle(language, testament, seed=int(seed), difficulty=difficulty)
+        elif data.get('no_repeats', False):
+            session_id = data.get('session_id') or session_bags.new_session_id()
+            book = session_bags.draw(session_id, language, testament)
+            puzzle = puzzle_pool.get_book(book, language, difficulty)
+        else:
+            puzzle = puzzle_pool.get(language, testament, difficulty)
+        random_book = puzzle['original']
+
+        response = {
             'success': True,
+            'puzzle_id': puzzle['puzzle_id'],
+            'difficulty': puzzle['difficulty'],
             'original': random_book,
-            'scrambled': scrambled,
-            'hint': hint
-        })
+            'scrambled': puzzle['scrambled'],
+            'hint': puzzle['hint'],
+            'ambiguous': puzzle['ambiguous'],
+            'answers': puzzle['answers']
+        }
+        if session_id is not None:
+            response['session_id'] = session_id
+
+        # Bilingual challenges accept the answer in any supported language
+        if data.get('bilingual', False):
+            response['bilingual'] = True
+            response['translations'] = scrambler.get_translations(random_book, language)
+
+        return jsonify(response)
 
     except Exception as e:
         return jsonify({
@@ -57,16 +117,33 @@ def check_answer():
     try:
         data = request.get_json()
         original = data.get('original')
+        scrambled = data.get('scrambled', '')
         guess = data.get('guess')
 
+        # A puzzle ID is rebuilt on the server, so its book and scramble can not be forged
+        if data.get('puzzle_id'):
+            puzzle = scrambler.get_puzzle(data['puzzle_id'])
+            original, scrambled = puzzle['original'], puzzle['scrambled']
+
         if not original or not guess:
             return jsonify({
                 'success': False,
                 'error': 'Missing original or guess'
             }), 400
 
-        # Validate the solution
-        is_correct = scrambler.validate_scramble_solution(original, '', guess)
+        # Validate the solution, optionally tolerating typos
+        fuzzy = bool(data.get('fuzzy', False))
+        max_distance = int(data.get('max_distance', MAX_EDIT_DISTANCE))
+        # Any book whose name the scrambled letters spell is also correct
+        if data.get('bilingual', False):
+            language = data.get('language', 'english')
+            is_correct = scrambler.validate_bilingual_solution(original, guess, language,
+                                                               fuzzy=fuzzy, max_distance=max_distance,
+                                                               scrambled=scrambled)
+        else:
+            is_correct = scrambler.validate_scramble_solution(original, scrambled, guess,
+                                                              fuzzy=fuzzy, max_distance=max_distance,
+                                                              language=data.get('language'))
 
         return jsonify({
             'success': True,
@@ -79,6 +156,67 @@ def check_answer():
             'error': str(e)
         }), 400
 
+@app.route('/api/pool-stats', methods=['GET'])
+def pool_stats():
+    """Report puzzle pool depths and hit/miss counters for monitoring"""
+    return jsonify({
+        'success': True,
+        'stats': puzzle_pool.stats()
+    })
+
+@app.route('/api/daily', methods=['GET'])
+def daily():
+    """Get the puzzle of the day"""
+    try:
+        language = request.args.get('language', 'english')
+        difficulty = request.args.get('difficulty', 'medium')
+
+        puzzle = daily_puzzles.get(language, difficulty)
+        expires_in = daily_puzzles.seconds_until_rollover()
+
+        # The answer is left out: everyone shares this puzzle
+        response = jsonify({
+            'success': True,
+            'date': puzzle['date'],
+            'puzzle_id': puzzle['puzzle_id'],
+            'language': puzzle['language'],
+            'difficulty': puzzle['difficulty'],
+            'scrambled': puzzle['scrambled'],
+            'hint': puzzle['hint'],
+            'ambiguous': puzzle['ambiguous'],
+            'expires_in': expires_in
+        })
+        response.headers['Cache-Control'] = f'public, max-age={expires_in}'
+        return response
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+@app.route('/api/puzzle/<puzzle_id>', methods=['GET'])
+def puzzle(puzzle_id):
+    """Regenerate a puzzle from its ID"""
+    try:
+        puzzle = scrambler.get_puzzle(puzzle_id)
+
+        return jsonify({
+            'success': True,
+            'puzzle_id': puzzle['puzzle_id'],
+            'scrambled': puzzle['scrambled'],
+            'hint': puzzle['hint'],
+            'language': puzzle['language'],
+            'difficulty': puzzle['difficulty'],
+            'ambiguous': puzzle['ambiguous']
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
 @app.route('/api/custom-scramble', methods=['POST'])
 def custom_scramble():
     """Generate scramble for a specific book name"""
@@ -86,6 +224,7 @@ def custom_scramble():
         data = request.get_json()
         book_name = data.get('book_name')
         language = data.get('language', 'english')
+        difficulty = data.get('difficulty', 'medium')
 
         if not book_name:
             return jsonify({
@@ -94,14 +233,17 @@ def custom_scramble():
             }), 400
 
         # Generate scramble
-        scrambled = scrambler.generate_scramble(book_name, language)
+        scrambled = scrambler.generate_scramble(book_name, language, difficulty)
         hint = scrambler.get_hint(book_name, language)
+        answers = scrambler.get_answers(book_name, language)
 
         return jsonify({
             'success': True,
             'original': book_name,
             'scrambled': scrambled,
-            'hint': hint
+            'hint': hint,
+            'ambiguous': len(answers) > 1,
+            'answers': answers
         })
 
     except Exception as e:
@@ -124,12 +266,23 @@ def validate_book():
                 'error': 'Missing guess'
             }), 400
 
-        # Check if it's a valid Bible book
-        is_valid = scrambler.check_solution('', guess, language)
+        # Check if it's a valid Bible book, optionally tolerating typos
+        if data.get('fuzzy', False):
+            max_distance = int(data.get('max_distance', MAX_EDIT_DISTANCE))
+            match = scrambler.resolve_guess(guess, language, max_distance)
+            return jsonify({
+                'success': True,
+                'valid': match is not None,
+                'match': match[0] if match else None,
+                'distance': match[1] if match else None
+            })
+
+        canonical_name = scrambler.get_canonical_name(guess, language)
 
         return jsonify({
             'success': True,
-            'valid': is_valid
+            'valid': canonical_name is not None,
+            'match': canonical_name
         })
 
     except Exception as e:
@@ -158,6 +311,56 @@ def all_books():
             'error': str(e)
         }), 400
 
+@app.route('/api/suggest', methods=['GET'])
+def suggest():
+    """Suggest Bible book names completing a partially typed guess"""
+    try:
+        prefix = request.args.get('prefix', '')
+        language = request.args.get('language', 'english')
+        limit = int(request.args.get('limit', MAX_SUGGESTIONS))
+
+        suggestions = scrambler.suggest_books(prefix, language, limit)
+
+        return jsonify({
+            'success': True,
+            'prefix': prefix,
+            'suggestions': suggestions
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+@app.route('/api/solve', methods=['GET'])
+def solve():
+    """Find the Bible books a scrambled string could have come from"""
+    try:
+        scrambled = request.args.get('scrambled', '')
+        language = request.args.get('language')
+        max_distance = int(request.args.get('max_distance', MAX_EDIT_DISTANCE))
+
+        if not scrambled.strip():
+            return jsonify({
+                'success': False,
+                'error': 'Missing scrambled text'
+            }), 400
+
+        solutions = scrambler.solve(scrambled, language, max_distance)
+
+        return jsonify({
+            'success': True,
+            'scrambled': scrambled,
+            'solutions': solutions
+        })
+
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
 if __name__ == '__main__':
     # Create templates directory if it doesn't exist
     templates_dir = os.path.join(os.path.dirname(__file__), 'templates')
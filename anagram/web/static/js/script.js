@@ -3,6 +3,8 @@
 class BibleScrambleGame {
     constructor() {
         this.currentChallenge = null;
+        // Issued by the server so each book comes up once before any repeats
+        this.sessionId = null;
         this.stats = {
             score: 0,
             streak: 0,
@@ -19,6 +21,8 @@ class BibleScrambleGame {
         // Controls
         this.languageSelect = document.getElementById('language-select');
         this.testamentSelect = document.getElementById('testament-select');
+        this.difficultySelect = document.getElementById('difficulty-select');
+        this.bilingualToggle = document.getElementById('bilingual-toggle');
 
         // Buttons
         this.newChallengeBtn = document.getElementById('new-challenge-btn');
@@ -38,6 +42,7 @@ class BibleScrambleGame {
         this.scrambledDisplay = document.getElementById('scrambled-display');
         this.hintDisplay = document.getElementById('hint-display');
         this.answerInput = document.getElementById('answer-input');
+        this.answerSuggestions = document.getElementById('answer-suggestions');
         this.resultDisplay = document.getElementById('result-display');
 
         // Custom elements
@@ -68,6 +73,9 @@ class BibleScrambleGame {
             if (e.key === 'Enter') this.submitAnswer();
         });
 
+        // Autocomplete book names while typing
+        this.answerInput.addEventListener('input', () => this.scheduleSuggestions());
+
         this.customBookInput.addEventListener('keypress', (e) => {
             if (e.key === 'Enter') this.scrambleCustomBook();
         });
@@ -119,18 +127,25 @@ class BibleScrambleGame {
                 },
                 body: JSON.stringify({
                     language: language,
-                    testament: testament
+                    testament: testament,
+                    difficulty: this.difficultySelect.value,
+                    bilingual: this.bilingualToggle.checked,
+                    no_repeats: true,
+                    session_id: this.sessionId
                 })
             });
 
             const data = await response.json();
 
             if (data.success) {
+                this.sessionId = data.session_id || this.sessionId;
                 this.currentChallenge = {
+                    puzzleId: data.puzzle_id,
                     original: data.original,
                     scrambled: data.scrambled,
                     hint: data.hint,
-                    language: language
+                    language: language,
+                    bilingual: Boolean(data.bilingual)
                 };
 
                 this.scrambledDisplay.textContent = data.scrambled;
@@ -171,7 +186,10 @@ class BibleScrambleGame {
                 },
                 body: JSON.stringify({
                     original: this.currentChallenge.original,
-                    guess: this.answerInput.value.trim()
+                    scrambled: this.currentChallenge.scrambled,
+                    guess: this.answerInput.value.trim(),
+                    language: this.currentChallenge.language,
+                    bilingual: this.currentChallenge.bilingual
                 })
             });
 
@@ -281,7 +299,8 @@ class BibleScrambleGame {
                 },
                 body: JSON.stringify({
                     book_name: bookName,
-                    language: language
+                    language: language,
+                    difficulty: this.difficultySelect.value
                 })
             });
 
@@ -355,6 +374,36 @@ class BibleScrambleGame {
         }
     }
 
+    scheduleSuggestions() {
+        // Wait for a short pause in typing before asking the server
+        clearTimeout(this.suggestTimer);
+        this.suggestTimer = setTimeout(() => this.loadSuggestions(), 120);
+    }
+
+    async loadSuggestions() {
+        const prefix = this.answerInput.value.trim();
+        if (!prefix) {
+            this.answerSuggestions.innerHTML = '';
+            return;
+        }
+
+        const language = this.languageSelect.value;
+
+        try {
+            const response = await fetch(`/api/suggest?language=${language}&prefix=${encodeURIComponent(prefix)}&limit=5`);
+            const data = await response.json();
+
+            // Ignore answers to prefixes the player has already typed past
+            if (data.success && data.prefix === this.answerInput.value.trim()) {
+                this.answerSuggestions.innerHTML = data.suggestions
+                    .map(book => `<option value="${book}"></option>`)
+                    .join('');
+            }
+        } catch (error) {
+            this.answerSuggestions.innerHTML = '';
+        }
+    }
+
     showError(message) {
         this.resultDisplay.innerHTML = `
             <div style="color: #dc3545;">
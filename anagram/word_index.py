@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Anagram Word Index
+Loads external word lists for the anagram generator and caches their
+signature index on disk.
+
+A word list is a UTF-8 text file with one word per line, optionally
+gzip-compressed; blank lines and lines starting with '#' are skipped. It
+is streamed once to group words by signature (their normalized letters,
+sorted). The result is written next to the list as a versioned binary
+file holding an open-addressing hash table, so later starts memory-map it
+and answer lookups straight from the mapped file without rebuilding
+anything. The cache records the SHA-256 of the word list it was built
+from and is rebuilt as soon as the list changes.
+"""
+
+import gzip
+import hashlib
+import io
+import mmap
+import os
+import struct
+import zlib
+from typing import Dict, IO, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+MAGIC = b'ANGI'
+FORMAT_VERSION = 1
+
+CACHE_SUFFIX = '.anagram-index'
+
+# magic, format version, slot count, signature count, word count, source digest
+_HEADER = struct.Struct('<4sHxxIII32s')
+# signature group (1-based, 0 for an empty slot)
+_SLOT = struct.Struct('<I')
+# signature string offset, signature length, first word, word count
+_GROUP = struct.Struct('<IIII')
+# word string offset, word length
+_WORD = struct.Struct('<II')
+
+_GZIP_MAGIC = b'\x1f\x8b'
+
+WordIndex = Union[Dict[str, Tuple[str, ...]], 'MappedWordIndex']
+
+def normalize_word(word: str) -> str:
+    """Normalize a word by converting to lowercase and removing spaces"""
+    return word.lower().replace(' ', '')
+
+def word_signature(word: str) -> str:
+    """Get the key shared by all anagrams of a word: its normalized letters, sorted"""
+    return ''.join(sorted(normalize_word(word)))
+
+def _open_text(path: str) -> IO[str]:
+    """Open a word list as text, decompressing it if it is gzipped"""
+    with open(path, 'rb') as probe:
+        compressed = probe.read(2) == _GZIP_MAGIC
+    if compressed:
+        return io.TextIOWrapper(gzip.open(path, 'rb'), encoding='utf-8')
+    return open(path, encoding='utf-8')
+
+def read_word_list(path: str) -> Iterator[str]:
+    """
+    Stream the words of a word list file.
+
+    Args:
+        path: Word list with one word per line (UTF-8, optionally gzip)
+
+    Returns:
+        Iterator over the lowercased words
+    """
+    with _open_text(path) as word_file:
+        for line in word_file:
+            word = line.strip()
+            if word and not word.startswith('#'):
+                yield word.lower()
+
+def file_digest(path: str) -> bytes:
+    """Compute the SHA-256 of a file, reading it in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as source:
+        for chunk in iter(lambda: source.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+def build_index(words: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Group words by signature.
+
+    Args:
+        words: Words to index (duplicates are dropped)
+
+    Returns:
+        Dictionary of signature to the words sharing it, in alphabetical order
+    """
+    buckets: Dict[str, Set[str]] = {}
+    for word in words:
+        buckets.setdefault(word_signature(word), set()).add(word)
+    return {signature: tuple(sorted(group)) for signature, group in buckets.items()}
+
+def _slot_count(signature_count: int) -> int:
+    """Size the hash table to a power of two at most half full"""
+    slots = 1
+    while slots < 2 * signature_count:
+        slots *= 2
+    return slots
+
+def encode_index(index: Dict[str, Tuple[str, ...]], digest: bytes) -> bytes:
+    """
+    Encode a signature index into the cache file format.
+
+    Args:
+        index: Dictionary of signature to words
+        digest: SHA-256 of the word list the index was built from
+
+    Returns:
+        The cache file contents
+    """
+    strings = bytearray()
+    groups: List[bytes] = []
+    words: List[bytes] = []
+    slot_count = _slot_count(len(index))
+    slots = [0] * slot_count
+
+    for signature in sorted(index):
+        encoded = signature.encode('utf-8')
+        groups.append(_GROUP.pack(len(strings), len(encoded), len(words), len(index[signature])))
+        strings += encoded
+        for word in index[signature]:
+            encoded_word = word.encode('utf-8')
+            words.append(_WORD.pack(len(strings), len(encoded_word)))
+            strings += encoded_word
+
+        # Linear probing from the signature's CRC-32
+        slot = zlib.crc32(encoded) & (slot_count - 1)
+        while slots[slot]:
+            slot = (slot + 1) & (slot_count - 1)
+        slots[slot] = len(groups)
+
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, slot_count, len(groups), len(words), digest)
+    return b''.join([header, *(_SLOT.pack(group) for group in slots), *groups, *words, bytes(strings)])
+
+class MappedWordIndex:
+    """
+    Read-only signature index over a memory-mapped cache file.
+
+    Lookups hash the signature and probe the mapped table directly; only
+    the words of the matching signature are decoded.
+    """
+
+    def __init__(self, path: str):
+        with open(path, 'rb') as cache_file:
+            self._buffer = mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, slot_count, signature_count, word_count, digest = _HEADER.unpack_from(self._buffer, 0)
+        except struct.error:
+            self._buffer.close()
+            raise ValueError(f"Unsupported anagram index file: {path}") from None
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._buffer.close()
+            raise ValueError(f"Unsupported anagram index file: {path}")
+
+        self.digest = digest
+        self.word_count = word_count
+        self._mask = slot_count - 1
+        self._signature_count = signature_count
+        self._slots = _HEADER.size
+        self._groups = self._slots + _SLOT.size * slot_count
+        self._words = self._groups + _GROUP.size * signature_count
+        self._strings = self._words + _WORD.size * word_count
+
+    def _word(self, word_id: int) -> str:
+        """Decode one word"""
+        offset, length = _WORD.unpack_from(self._buffer, self._words + word_id * _WORD.size)
+        start = self._strings + offset
+        return self._buffer[start:start + length].decode('utf-8')
+
+    def get(self, signature: str, default: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+        """
+        Get the words with a signature.
+
+        Args:
+            signature: Sorted normalized letters
+            default: Returned when no word has the signature
+
+        Returns:
+            The words, in alphabetical order
+        """
+        buffer = self._buffer
+        key = signature.encode('utf-8')
+        slot = zlib.crc32(key) & self._mask
+        while True:
+            group = _SLOT.unpack_from(buffer, self._slots + slot * _SLOT.size)[0]
+            if not group:
+                return default
+            offset, length, first, count = _GROUP.unpack_from(buffer, self._groups + (group - 1) * _GROUP.size)
+            start = self._strings + offset
+            if buffer[start:start + length] == key:
+                return tuple(self._word(word_id) for word_id in range(first, first + count))
+            slot = (slot + 1) & self._mask
+
+    def keys(self) -> Iterator[str]:
+        """Iterate over every indexed signature"""
+        buffer = self._buffer
+        for group in range(self._signature_count):
+            offset, length, _, _ = _GROUP.unpack_from(buffer, self._groups + group * _GROUP.size)
+            start = self._strings + offset
+            yield buffer[start:start + length].decode('utf-8')
+
+    def words(self) -> Iterator[str]:
+        """Iterate over every indexed word, grouped by signature"""
+        for word_id in range(self.word_count):
+            yield self._word(word_id)
+
+    def __len__(self) -> int:
+        """Number of distinct signatures"""
+        return self._signature_count
+
+    def close(self) -> None:
+        """Unmap the cache file"""
+        self._buffer.close()
+
+def load_word_index(path: str, cache_path: Optional[str] = None) -> WordIndex:
+    """
+    Load the signature index of a word list, from its cache when it is current.
+
+    Args:
+        path: Word list with one word per line (UTF-8, optionally gzip)
+        cache_path: Where to keep the cache (defaults to the list's path plus '.anagram-index')
+
+    Returns:
+        A MappedWordIndex over the cache, or an in-memory index when the
+        cache can not be written
+
+    Raises:
+        OSError: If the word list can not be read
+    """
+    cache_path = cache_path or path + CACHE_SUFFIX
+    digest = file_digest(path)
+
+    try:
+        mapped = MappedWordIndex(cache_path)
+        if mapped.digest == digest:
+            return mapped
+        mapped.close()
+    except (OSError, ValueError):
+        pass
+
+    # Missing, outdated or unreadable cache: rebuild it from the word list
+    index = build_index(read_word_list(path))
+    temp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'wb') as cache_file:
+            cache_file.write(encode_index(index, digest))
+        os.replace(temp_path, cache_path)
+        return MappedWordIndex(cache_path)
+    except (OSError, ValueError):
+        # Read-only location: keep the freshly built index in memory
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return index